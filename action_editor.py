@@ -2,18 +2,150 @@
 Editor für einzelne Aktionen im Workflow.
 """
 
-import threading
-import time
-import pyautogui
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                           QLabel, QSpinBox, QDoubleSpinBox, QLineEdit,
+                           QLabel, QSpinBox, QDoubleSpinBox, QAbstractSpinBox, QLineEdit,
                            QComboBox, QPushButton, QDialog, QDialogButtonBox,
-                           QMessageBox, QApplication)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QKeySequence, QShortcut
+                           QMessageBox, QApplication, QStackedWidget)
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QSignalBlocker
+from PyQt6.QtGui import QKeySequence, QShortcut, QCursor
 
+from constants import MAX_CACHED_EDITOR_FORMS, MOUSE_TRACKING_INTERVAL
 from models import Action, ActionType
-from utils import validate_color, validate_region
+from threads import MousePositionTester, CursorPoller
+
+# Wiederkehrende Beschriftungen
+_PLACEHOLDER_TEXT = "Wähle eine Aktion aus, um Details anzuzeigen"
+_POSITION_UNKNOWN_TEXT = "Aktuelle Mausposition: ---, ---"
+_LBL_TYPE = "Typ:"
+_LBL_SCREEN = "Bildschirm:"
+_LBL_X = "X:"
+_LBL_Y = "Y:"
+_LBL_BUTTON = "Taste:"
+_LBL_DURATION = "Dauer (s):"
+_LBL_TEXT = "Text:"
+_LBL_TIMEOUT = "Timeout (s):"
+
+# Aktionstypen, die eine einzelne Mausposition verwenden
+_MOUSE_POINT_TYPES = frozenset({ActionType.MOUSE_MOVE, ActionType.MOUSE_CLICK,
+                                ActionType.MOUSE_DOUBLE_CLICK, ActionType.MOUSE_RIGHT_CLICK})
+
+
+class _IntListEditor(QWidget):
+    """Eingabe für eine feste Anzahl Ganzzahlen (z.B. Farbe oder Region) als Spinboxen"""
+
+    valueChanged = pyqtSignal()  # Ein beliebiges Feld wurde geändert
+
+    # (Minimum, Maximum, Tooltip) pro Feld, in Unterklassen festgelegt
+    FIELDS = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._spinboxes = []
+        for minimum, maximum, tooltip in self.FIELDS:
+            spinbox = QSpinBox()
+            spinbox.setRange(minimum, maximum)
+            spinbox.setKeyboardTracking(False)
+            spinbox.setToolTip(tooltip)
+            spinbox.valueChanged.connect(self.valueChanged)
+            layout.addWidget(spinbox)
+            self._spinboxes.append(spinbox)
+
+    def value(self) -> list:
+        """Gibt die Werte als Liste zurück"""
+        return [spinbox.value() for spinbox in self._spinboxes]
+
+    def setValue(self, values):
+        """Setzt die Werte aus einer Liste (überzählige Werte werden ignoriert)"""
+        for spinbox, value in zip(self._spinboxes, values):
+            with QSignalBlocker(spinbox):
+                spinbox.setValue(int(value))
+
+
+class _ColorEditor(_IntListEditor):
+    """Eingabe für eine RGB-Farbe"""
+    FIELDS = ((0, 255, "Rot"), (0, 255, "Grün"), (0, 255, "Blau"))
+
+
+class _RegionEditor(_IntListEditor):
+    """Eingabe für eine Region als x, y, Breite, Höhe"""
+    FIELDS = ((0, 9999, "X"), (0, 9999, "Y"), (1, 9999, "Breite"), (1, 9999, "Höhe"))
+
+
+def _cursor_xy():
+    """Liefert die globale Mausposition als (x, y) über Qt, ohne Umweg über pyautogui"""
+    pos = QCursor.pos()
+    return pos.x(), pos.y()
+
+
+def _parse_keys(keys_str: str):
+    """Zerlegt eine kommaseparierte Tastenliste (immer gültig)"""
+    return True, [k.strip() for k in keys_str.split(",")]
+
+
+# Auslesen der Werte pro Widget-Typ
+_WIDGET_EXTRACTORS = {
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QComboBox: QComboBox.currentText,
+    QLineEdit: QLineEdit.text,
+    _ColorEditor: _ColorEditor.value,
+    _RegionEditor: _RegionEditor.value,
+}
+
+# Änderungssignal pro Widget-Typ (für die Erkennung geänderter Parameter)
+_CHANGE_SIGNALS = {
+    QSpinBox: "valueChanged",
+    QDoubleSpinBox: "valueChanged",
+    QComboBox: "currentIndexChanged",
+    QLineEdit: "textChanged",
+    _ColorEditor: "valueChanged",
+    _RegionEditor: "valueChanged",
+}
+
+# Parameter, die vom Standard ihres Widget-Typs abweichend ausgelesen werden
+_PARAM_EXTRACTORS = {
+    "screen_id": QComboBox.currentIndex,  # Speichere den Index, nicht den Text
+}
+
+# Konvertierung von Texteingaben, liefern (ist_gültig, wert)
+_TEXT_CONVERTERS = {
+    "keys": _parse_keys,
+}
+
+
+@lru_cache(maxsize=None)
+def _value_pipeline(widget_type: type, param_name: str):
+    """Ermittelt (Auslesefunktion, Konvertierung) einmalig pro Widget-Typ und Parameter"""
+    extract = _PARAM_EXTRACTORS.get(param_name) or _WIDGET_EXTRACTORS.get(widget_type)
+    return extract, _TEXT_CONVERTERS.get(param_name)
+
+
+def _extract_widget_value(widget: QWidget, param_name: str):
+    """
+    Liest den Wert eines Parameter-Widgets aus
+
+    Args:
+        widget: Das Parameter-Widget
+        param_name: Name des Parameters
+
+    Returns:
+        Tuple[bool, Any]: (ist_gültig, wert)
+    """
+    extract, convert = _value_pipeline(type(widget), param_name)
+    if extract is None:
+        return False, None  # Unbekannter Widget-Typ
+
+    value = extract(widget)
+    if convert is None:
+        return True, value
+    return convert(value)
 
 
 class ActionParameterChangeEvent:
@@ -28,8 +160,11 @@ class ActionEditor(QWidget):
     """Editor-Widget für eine einzelne Aktion"""
 
     # Signale
-    parameter_changed = pyqtSignal(ActionParameterChangeEvent)
+    parameters_changed = pyqtSignal(list)  # Alle Änderungen eines Übernehmen-Klicks
     type_changed = pyqtSignal(ActionType)
+    _mouse_test_requested = pyqtSignal(int, int)
+    _cursor_polling_started = pyqtSignal()
+    _cursor_polling_stopped = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -37,21 +172,84 @@ class ActionEditor(QWidget):
         self.action = None
         self.edit_mode = False
         self.parameter_widgets = {}
+        self._dirty_params = {}  # Seit dem Laden geänderte Parameter (geordnet, Werte ungenutzt)
+
+        # Formular-Cache (LRU): Formulare werden erst bei Bedarf erstellt
+        self._forms = OrderedDict()
+        self._current_form = None
 
         self.main_layout = QVBoxLayout(self)
-        self.form_layout = QGridLayout()
+
+        # Stack mit Platzhalter-Seite und Editor-Seite
+        self._stack = QStackedWidget()
+        self.main_layout.addWidget(self._stack)
 
         # Platzhaltertext, wenn keine Aktion ausgewählt ist
-        self.placeholder = QLabel("Wähle eine Aktion aus, um Details anzuzeigen")
-        self.main_layout.addWidget(self.placeholder)
+        self.placeholder = QLabel(_PLACEHOLDER_TEXT)
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._stack.addWidget(self.placeholder)
+
+        # Editor-Seite: Typ-Auswahl, Parameter-Formulare, Übernehmen-Button
+        self._editor_page = QWidget()
+        editor_layout = QVBoxLayout(self._editor_page)
+        editor_layout.setContentsMargins(0, 0, 0, 0)
+
+        type_layout = QGridLayout()
+        type_layout.addWidget(QLabel(_LBL_TYPE), 0, 0)
+        self.type_combo = QComboBox()
+        self.type_combo.addItems([t.value for t in ActionType])
+        self.type_combo.currentTextChanged.connect(self._on_type_changed)
+        type_layout.addWidget(self.type_combo, 0, 1)
+        editor_layout.addLayout(type_layout)
+
+        self._form_stack = QStackedWidget()
+        editor_layout.addWidget(self._form_stack)
+
+        apply_button = QPushButton("Änderungen anwenden")
+        apply_button.clicked.connect(self._apply_changes)
+        editor_layout.addWidget(apply_button)
 
-        # Timer und Status für Mausposition-Tracking
-        self.tracking_timer = None
+        # Streckbaren Platz einfügen
+        editor_layout.addStretch()
+
+        self._stack.addWidget(self._editor_page)
+
+        # Status für Mausposition-Tracking
         self.tracking_active = False
         self.tracking_target_widget = None
         self.position_display_label = None
         self.tracking_screen_combo = None
 
+        # Tastaturkürzel für Enter bei aktivem Tracking (nur während des Trackings aktiv)
+        self.enter_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Return), self)
+        self.enter_shortcut.activated.connect(self.apply_tracked_position)
+        self.enter_shortcut.setEnabled(False)
+
+        # Bildschirm-Offsets (x, y) für das Tracking, ungültig bei Bildschirmänderungen
+        self._cached_screens = None
+        self._cached_screen_labels = None
+        self._last_pos_text = None
+        self._pos_template = None
+        self._pos_template_screen = None
+        app = QApplication.instance()
+        app.screenAdded.connect(self._invalidate_screen_cache)
+        app.screenRemoved.connect(self._invalidate_screen_cache)
+
+        # Mausabfrage pausieren, solange die Anwendung nicht aktiv ist
+        app.applicationStateChanged.connect(self._update_cursor_polling)
+
+        # Bestätigungsdialog für Typänderungen (wird bei Bedarf erstellt)
+        self._type_change_dialog = None
+        self._type_change_message = None
+
+        # Worker-Thread für Positionstests (wird beim ersten Test erstellt)
+        self._mouse_thread = None
+        self._mouse_tester = None
+
+        # Worker-Thread für die Mausabfrage beim Tracking (wird beim ersten Tracking erstellt)
+        self._cursor_thread = None
+        self._cursor_poller = None
+
         # Anfangs kein Action-Editor anzeigen
         self.clear_editor()
 
@@ -65,67 +263,79 @@ class ActionEditor(QWidget):
         # Speichere eine Kopie der Aktion, um rückgängig zu machen
         self.action = action
 
-        # Bestehende Widgets entfernen
-        self.clear_editor()
-
-        # Edit-Modus aktivieren
-        self.edit_mode = True
-
-        # Typ-Auswahl erstellen
-        type_label = QLabel("Typ:")
-        self.form_layout.addWidget(type_label, 0, 0)
+        # Laufendes Tracking beenden
+        self.stop_position_tracking()
 
-        type_combo = QComboBox()
-        for action_type in ActionType:
-            type_combo.addItem(action_type.value)
-        type_combo.setCurrentText(action.action_type.value)
-        type_combo.currentTextChanged.connect(self._on_type_changed)
-        self.form_layout.addWidget(type_combo, 0, 1)
+        # Typ-Auswahl setzen, ohne _on_type_changed auszulösen
+        with QSignalBlocker(self.type_combo):
+            self.type_combo.setCurrentText(action.action_type.value)
 
-        # Parameter-Widgets erstellen
-        self._create_parameter_widgets(action)
+        # Formular aus dem Cache holen oder bei der ersten Verwendung erstellen
+        form = self._forms.get(action.action_type)
+        if form is None:
+            form = self._install_form(action.action_type)
+        else:
+            self._forms.move_to_end(action.action_type)
 
-        # Form-Layout einfügen
-        self.main_layout.addLayout(self.form_layout)
+        # Werte der Aktion in das Formular laden (Signale blockiert, daher nichts geändert)
+        self._load_params(form, action)
+        self._dirty_params = {}
 
-        # Button einfügen
-        apply_button = QPushButton("Änderungen anwenden")
-        apply_button.clicked.connect(self._apply_changes)
-        self.main_layout.addWidget(apply_button)
+        self._current_form = form
+        self.parameter_widgets = form.parameter_widgets
+        self.position_display_label = form.position_display_label
 
-        # Streckbaren Platz einfügen
-        self.main_layout.addStretch()
+        self._form_stack.setCurrentWidget(form)
+        self._stack.setCurrentWidget(self._editor_page)
 
-        # Tastaturkürzel für Enter bei aktivem Tracking einrichten
-        self.enter_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Return), self)
-        self.enter_shortcut.activated.connect(self.apply_tracked_position)
-        self.enter_shortcut.setEnabled(False)
+        # Edit-Modus aktivieren
+        self.edit_mode = True
 
     def clear_editor(self):
         """Leert den Editor und zeigt den Platzhaltertext an"""
-        # Bestehende Widgets entfernen
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                while item.layout().count():
-                    subitem = item.layout().takeAt(0)
-                    if subitem.widget():
-                        subitem.widget().deleteLater()
-
-        # Parameter-Widgets zurücksetzen
-        self.parameter_widgets = {}
-
         # Edit-Modus zurücksetzen
         self.edit_mode = False
 
         # Tracking beenden, falls aktiv
         self.stop_position_tracking()
 
-        # Neues Platzhalter-Label erstellen und anzeigen
-        self.placeholder = QLabel("Wähle eine Aktion aus, um Details anzuzeigen")
-        self.main_layout.addWidget(self.placeholder)
+        # Parameter-Widgets zurücksetzen
+        self.parameter_widgets = {}
+        self._current_form = None
+        self.position_display_label = None
+
+        # Platzhalter anzeigen, die gecachten Formulare bleiben erhalten
+        self._stack.setCurrentWidget(self.placeholder)
+
+    def _install_form(self, action_type: ActionType) -> QWidget:
+        """
+        Erstellt das Formular für einen Aktionstyp und legt es im Cache ab
+
+        Überschreitet der Cache MAX_CACHED_EDITOR_FORMS Einträge, wird das am
+        längsten nicht verwendete Formular entfernt.
+
+        Args:
+            action_type: Der Aktionstyp, für den das Formular erstellt wird
+
+        Returns:
+            QWidget: Das neu erstellte Formular
+        """
+        # Updates während des Aufbaus aussetzen, damit nur ein Layout-Durchlauf erfolgt
+        self.setUpdatesEnabled(False)
+        try:
+            form = self._create_parameter_widgets(action_type)
+            self._forms[action_type] = form
+            self._form_stack.addWidget(form)
+
+            while len(self._forms) > MAX_CACHED_EDITOR_FORMS:
+                _, victim = self._forms.popitem(last=False)
+                self._form_stack.removeWidget(victim)
+                victim.deleteLater()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+
+        return form
 
     def get_available_screens(self):
         """Gibt eine Liste der verfügbaren Bildschirme zurück"""
@@ -142,381 +352,464 @@ class ActionEditor(QWidget):
             })
         return screens
 
-    def _create_parameter_widgets(self, action: Action):
+    def _invalidate_screen_cache(self, screen=None):
+        """Verwirft die gecachten Bildschirmdaten nach einer Bildschirmänderung"""
+        self._cached_screens = None
+        self._cached_screen_labels = None
+
+        # Bildschirm-Auswahl der gecachten Formulare aktualisieren
+        for form in self._forms.values():
+            screen_combo = form.parameter_widgets.get("screen_id")
+            if screen_combo is None:
+                continue
+            with QSignalBlocker(screen_combo):
+                index = screen_combo.currentIndex()
+                screen_combo.clear()
+                screen_combo.addItems(self._screen_labels())
+                screen_combo.setCurrentIndex(min(index, screen_combo.count() - 1))
+
+    def _screen_labels(self):
         """
-        Erstellt die Widgets für die Parameter der Aktion
+        Liefert die Beschriftungen für die Bildschirm-Auswahl
 
-        Args:
-            action: Die Aktion, deren Parameter bearbeitet werden sollen
-        """
-        row = 1  # Row 0 ist für den Typ reserviert
-
-        if action.action_type in [ActionType.MOUSE_MOVE, ActionType.MOUSE_CLICK,
-                                ActionType.MOUSE_DOUBLE_CLICK, ActionType.MOUSE_RIGHT_CLICK]:
-            # Bildschirm-Auswahl
-            self.form_layout.addWidget(QLabel("Bildschirm:"), row, 0)
-            screen_combo = QComboBox()
-            for screen in self.get_available_screens():
-                screen_combo.addItem(
-                    f"Bildschirm {screen['id']} ({screen['width']}×{screen['height']})"
-                )
-            screen_combo.setCurrentIndex(action.params.get("screen_id", 0))
-            self.form_layout.addWidget(screen_combo, row, 1)
-            self.parameter_widgets["screen_id"] = screen_combo
-            row += 1
-
-            # X-Koordinate
-            self.form_layout.addWidget(QLabel("X:"), row, 0)
-            x_spinbox = QSpinBox()
-            x_spinbox.setRange(0, 9999)
-            x_spinbox.setValue(action.params.get("x", 0))
-            self.form_layout.addWidget(x_spinbox, row, 1)
-            self.parameter_widgets["x"] = x_spinbox
-            row += 1
-
-            # Y-Koordinate
-            self.form_layout.addWidget(QLabel("Y:"), row, 0)
-            y_spinbox = QSpinBox()
-            y_spinbox.setRange(0, 9999)
-            y_spinbox.setValue(action.params.get("y", 0))
-            self.form_layout.addWidget(y_spinbox, row, 1)
-            self.parameter_widgets["y"] = y_spinbox
-            row += 1
-
-            # Mausposition-Display für Live-Tracking
-            self.position_display_label = QLabel("Aktuelle Mausposition: ---, ---")
-            self.form_layout.addWidget(self.position_display_label, row, 0, 1, 2)
-            row += 1
-
-            # Position loggen Button
-            track_position_btn = QPushButton("Mausposition loggen (Enter = übernehmen)")
-            track_position_btn.clicked.connect(
-                lambda: self.toggle_position_tracking(x_spinbox, y_spinbox, screen_combo)
-            )
-            self.form_layout.addWidget(track_position_btn, row, 0, 1, 2)
-            row += 1
-
-            # Test-Button für Mausposition
-            test_position_btn = QPushButton("Position testen")
-            test_position_btn.clicked.connect(
-                lambda: self._test_mouse_position(x_spinbox.value(), y_spinbox.value(),
-                                              screen_combo.currentIndex())
-            )
-            self.form_layout.addWidget(test_position_btn, row, 0, 1, 2)
-            row += 1
-
-            # Maustaste (nur für Klick-Aktionen)
-            if action.action_type != ActionType.MOUSE_MOVE:
-                self.form_layout.addWidget(QLabel("Taste:"), row, 0)
-                button_combo = QComboBox()
-                button_combo.addItems(["left", "middle", "right"])
-                button_combo.setCurrentText(action.params.get("button", "left"))
-                self.form_layout.addWidget(button_combo, row, 1)
-                self.parameter_widgets["button"] = button_combo
-                row += 1
-
-            # Dauer
-            self.form_layout.addWidget(QLabel("Dauer (s):"), row, 0)
-            duration_spinbox = QDoubleSpinBox()
-            duration_spinbox.setRange(0, 10)
-            duration_spinbox.setSingleStep(0.1)
-            duration_spinbox.setDecimals(1)
-            duration_spinbox.setValue(action.params.get("duration", 0.1))
-            self.form_layout.addWidget(duration_spinbox, row, 1)
-            self.parameter_widgets["duration"] = duration_spinbox
-            row += 1
-
-        elif action.action_type == ActionType.MOUSE_DRAG:
-            # Bildschirm-Auswahl
-            self.form_layout.addWidget(QLabel("Bildschirm:"), row, 0)
-            screen_combo = QComboBox()
-            for screen in self.get_available_screens():
-                screen_combo.addItem(
-                    f"Bildschirm {screen['id']} ({screen['width']}×{screen['height']})"
-                )
-            screen_combo.setCurrentIndex(action.params.get("screen_id", 0))
-            self.form_layout.addWidget(screen_combo, row, 1)
-            self.parameter_widgets["screen_id"] = screen_combo
-            row += 1
-
-            # Start X-Koordinate
-            self.form_layout.addWidget(QLabel("Start X:"), row, 0)
-            start_x_spinbox = QSpinBox()
-            start_x_spinbox.setRange(0, 9999)
-            start_x_spinbox.setValue(action.params.get("start_x", 0))
-            self.form_layout.addWidget(start_x_spinbox, row, 1)
-            self.parameter_widgets["start_x"] = start_x_spinbox
-            row += 1
+        Returns:
+            List[str]: Eine Beschriftung pro Bildschirm, bis zur nächsten
+            Bildschirmänderung gecacht
+        """
+        if self._cached_screen_labels is None:
+            self._cached_screen_labels = [
+                f"Bildschirm {screen['id']} ({screen['width']}×{screen['height']})"
+                for screen in self.get_available_screens()
+            ]
+        return self._cached_screen_labels
+
+    def _screen_offsets(self):
+        """
+        Liefert die (x, y)-Offsets aller Bildschirme
 
-            # Start Y-Koordinate
-            self.form_layout.addWidget(QLabel("Start Y:"), row, 0)
-            start_y_spinbox = QSpinBox()
-            start_y_spinbox.setRange(0, 9999)
-            start_y_spinbox.setValue(action.params.get("start_y", 0))
-            self.form_layout.addWidget(start_y_spinbox, row, 1)
-            self.parameter_widgets["start_y"] = start_y_spinbox
-            row += 1
+        Die Liste wird bei der ersten Abfrage erstellt und bis zur nächsten
+        Bildschirmänderung wiederverwendet.
 
-            # Mausposition-Display für Live-Tracking
-            self.position_display_label = QLabel("Aktuelle Mausposition: ---, ---")
-            self.form_layout.addWidget(self.position_display_label, row, 0, 1, 2)
-            row += 1
+        Returns:
+            List[Tuple[int, int]]: Offset pro Bildschirm-ID
+        """
+        if self._cached_screens is None:
+            self._cached_screens = [
+                (screen.geometry().x(), screen.geometry().y()) for screen in QApplication.screens()
+            ]
+        return self._cached_screens
 
-            # Start-Position loggen Button
-            track_start_position_btn = QPushButton("Start-Position loggen (Enter = übernehmen)")
-            track_start_position_btn.clicked.connect(
-                lambda: self.toggle_position_tracking(start_x_spinbox, start_y_spinbox, screen_combo)
-            )
-            self.form_layout.addWidget(track_start_position_btn, row, 0, 1, 2)
-            row += 1
+    def _tracking_screen_offset(self):
+        """
+        Liefert den Offset des beim Tracking ausgewählten Bildschirms
 
-            # Test-Button für Start-Position
-            test_start_btn = QPushButton("Start-Position testen")
-            test_start_btn.clicked.connect(
-                lambda: self._test_mouse_position(start_x_spinbox.value(), start_y_spinbox.value(),
-                                              screen_combo.currentIndex())
-            )
-            self.form_layout.addWidget(test_start_btn, row, 0, 1, 2)
-            row += 1
+        Returns:
+            Tuple[int, Optional[Tuple[int, int]]]: Bildschirm-ID und (x, y)-Offset,
+            oder None als Offset, wenn der Bildschirm nicht existiert
+        """
+        offsets = self._screen_offsets()
 
-            # End X-Koordinate
-            self.form_layout.addWidget(QLabel("End X:"), row, 0)
-            end_x_spinbox = QSpinBox()
-            end_x_spinbox.setRange(0, 9999)
-            end_x_spinbox.setValue(action.params.get("end_x", 0))
-            self.form_layout.addWidget(end_x_spinbox, row, 1)
-            self.parameter_widgets["end_x"] = end_x_spinbox
-            row += 1
+        screen_id = 0
+        if self.tracking_screen_combo is not None:
+            screen_id = self.tracking_screen_combo.currentIndex()
 
-            # End Y-Koordinate
-            self.form_layout.addWidget(QLabel("End Y:"), row, 0)
-            end_y_spinbox = QSpinBox()
-            end_y_spinbox.setRange(0, 9999)
-            end_y_spinbox.setValue(action.params.get("end_y", 0))
-            self.form_layout.addWidget(end_y_spinbox, row, 1)
-            self.parameter_widgets["end_y"] = end_y_spinbox
-            row += 1
+        if 0 <= screen_id < len(offsets):
+            return screen_id, offsets[screen_id]
+        return screen_id, None
 
-            # End-Position loggen Button
-            track_end_position_btn = QPushButton("End-Position loggen (Enter = übernehmen)")
-            track_end_position_btn.clicked.connect(
-                lambda: self.toggle_position_tracking(end_x_spinbox, end_y_spinbox, screen_combo)
-            )
-            self.form_layout.addWidget(track_end_position_btn, row, 0, 1, 2)
-            row += 1
+    def _new_form(self):
+        """
+        Erstellt ein leeres Parameter-Formular
 
-            # Test-Button für End-Position
-            test_end_btn = QPushButton("End-Position testen")
-            test_end_btn.clicked.connect(
-                lambda: self._test_mouse_position(end_x_spinbox.value(), end_y_spinbox.value(),
-                                              screen_combo.currentIndex())
-            )
-            self.form_layout.addWidget(test_end_btn, row, 0, 1, 2)
-            row += 1
+        Returns:
+            Tuple[QWidget, QGridLayout]: Das Formular-Widget und sein Layout
+        """
+        form = QWidget()
+        form.parameter_widgets = {}
+        form.param_defaults = {}
+        form.position_display_label = None
 
-            # Maustaste
-            self.form_layout.addWidget(QLabel("Taste:"), row, 0)
-            button_combo = QComboBox()
-            button_combo.addItems(["left", "middle", "right"])
-            button_combo.setCurrentText(action.params.get("button", "left"))
-            self.form_layout.addWidget(button_combo, row, 1)
-            self.parameter_widgets["button"] = button_combo
-            row += 1
+        layout = QGridLayout(form)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return form, layout
 
-            # Dauer
-            self.form_layout.addWidget(QLabel("Dauer (s):"), row, 0)
-            duration_spinbox = QDoubleSpinBox()
-            duration_spinbox.setRange(0, 10)
-            duration_spinbox.setSingleStep(0.1)
-            duration_spinbox.setDecimals(1)
-            duration_spinbox.setValue(action.params.get("duration", 0.5))
-            self.form_layout.addWidget(duration_spinbox, row, 1)
-            self.parameter_widgets["duration"] = duration_spinbox
-            row += 1
+    def _make_spinbox(self, cls, minimum, maximum, step=None, decimals=None):
+        """
+        Erstellt eine Spinbox für numerische Parameter
 
-        elif action.action_type == ActionType.KEY_PRESS:
-            # Taste
-            self.form_layout.addWidget(QLabel("Taste:"), row, 0)
-            key_edit = QLineEdit(action.params.get("key", "enter"))
-            self.form_layout.addWidget(key_edit, row, 1)
-            self.parameter_widgets["key"] = key_edit
-            row += 1
+        Keyboard-Tracking ist deaktiviert, damit valueChanged erst bei Enter,
+        Fokusverlust oder Pfeiltasten ausgelöst wird und nicht bei jedem Tastendruck.
 
-        elif action.action_type == ActionType.KEY_COMBO:
-            # Tasten (als kommaseparierte Liste)
-            self.form_layout.addWidget(QLabel("Tasten (mit Komma getrennt):"), row, 0)
-            keys_edit = QLineEdit(",".join(action.params.get("keys", ["ctrl", "c"])))
-            self.form_layout.addWidget(keys_edit, row, 1)
-            self.parameter_widgets["keys"] = keys_edit
-            row += 1
+        Args:
+            cls: QSpinBox oder QDoubleSpinBox
+            minimum: Kleinster erlaubter Wert
+            maximum: Größter erlaubter Wert
+            step: Optional. Schrittweite
+            decimals: Optional. Nachkommastellen (nur QDoubleSpinBox)
+
+        Returns:
+            Die konfigurierte Spinbox
+        """
+        spinbox = cls()
+        spinbox.setRange(minimum, maximum)
+        if step is not None:
+            spinbox.setSingleStep(step)
+        if decimals is not None:
+            spinbox.setDecimals(decimals)
+        spinbox.setKeyboardTracking(False)
+        return spinbox
+
+    def _register_param(self, form: QWidget, param_name: str, widget: QWidget, default):
+        """Registriert ein Parameter-Widget samt Standardwert im Formular"""
+        form.parameter_widgets[param_name] = widget
+        form.param_defaults[param_name] = default
+
+        # Änderungen durch den Benutzer vormerken
+        change_signal = getattr(widget, _CHANGE_SIGNALS[type(widget)])
+        change_signal.connect(partial(self._mark_dirty, param_name))
+
+    def _mark_dirty(self, param_name: str, value=None):
+        """
+        Merkt einen Parameter als geändert vor
 
-        elif action.action_type == ActionType.TEXT_WRITE:
-            # Text
-            self.form_layout.addWidget(QLabel("Text:"), row, 0)
-            text_edit = QLineEdit(action.params.get("text", "Beispieltext"))
-            self.form_layout.addWidget(text_edit, row, 1)
-            self.parameter_widgets["text"] = text_edit
-            row += 1
+        Args:
+            param_name: Name des geänderten Parameters
+            value: Vom Änderungssignal übergeben, wird ignoriert
+        """
+        self._dirty_params[param_name] = None
 
-            # Verzögerung zwischen Tastendrücken
-            self.form_layout.addWidget(QLabel("Verzögerung (s):"), row, 0)
-            interval_spinbox = QDoubleSpinBox()
-            interval_spinbox.setRange(0, 1)
-            interval_spinbox.setSingleStep(0.01)
-            interval_spinbox.setDecimals(2)
-            interval_spinbox.setValue(action.params.get("interval", 0))
-            self.form_layout.addWidget(interval_spinbox, row, 1)
-            self.parameter_widgets["interval"] = interval_spinbox
-            row += 1
+    def _load_params(self, form: QWidget, action: Action):
+        """
+        Lädt die Parameter einer Aktion in ein bestehendes Formular
 
-        elif action.action_type == ActionType.WAIT:
-            # Wartezeit in Sekunden
-            self.form_layout.addWidget(QLabel("Sekunden:"), row, 0)
-            seconds_spinbox = QDoubleSpinBox()
-            seconds_spinbox.setRange(0, 600)
-            seconds_spinbox.setSingleStep(0.5)
-            seconds_spinbox.setDecimals(1)
-            seconds_spinbox.setValue(action.params.get("seconds", 1))
-            self.form_layout.addWidget(seconds_spinbox, row, 1)
-            self.parameter_widgets["seconds"] = seconds_spinbox
-            row += 1
+        Args:
+            form: Das gecachte Formular für den Aktionstyp
+            action: Die Aktion, deren Parameter angezeigt werden sollen
+        """
+        for param_name, widget in form.parameter_widgets.items():
+            value = action.params.get(param_name, form.param_defaults[param_name])
 
-        elif action.action_type == ActionType.WAIT_FOR_COLOR:
-            # Bildschirm-Auswahl
-            self.form_layout.addWidget(QLabel("Bildschirm:"), row, 0)
-            screen_combo = QComboBox()
-            for screen in self.get_available_screens():
-                screen_combo.addItem(
-                    f"Bildschirm {screen['id']} ({screen['width']}×{screen['height']})"
-                )
-            screen_combo.setCurrentIndex(action.params.get("screen_id", 0))
-            self.form_layout.addWidget(screen_combo, row, 1)
-            self.parameter_widgets["screen_id"] = screen_combo
-            row += 1
+            # Signale blockieren, damit das Befüllen keine Änderungen meldet
+            with QSignalBlocker(widget):
+                if isinstance(widget, (QSpinBox, QDoubleSpinBox, _IntListEditor)):
+                    widget.setValue(value)
+                elif isinstance(widget, QComboBox):
+                    if param_name == "screen_id":
+                        widget.setCurrentIndex(value)
+                    else:
+                        widget.setCurrentText(value)
+                elif isinstance(widget, QLineEdit):
+                    if isinstance(value, (list, tuple)):
+                        widget.setText(",".join(map(str, value)))
+                    else:
+                        widget.setText(str(value))
 
-            # X-Koordinate
-            self.form_layout.addWidget(QLabel("X:"), row, 0)
-            x_spinbox = QSpinBox()
-            x_spinbox.setRange(0, 9999)
-            x_spinbox.setValue(action.params.get("x", 0))
-            self.form_layout.addWidget(x_spinbox, row, 1)
-            self.parameter_widgets["x"] = x_spinbox
-            row += 1
+        if form.position_display_label:
+            form.position_display_label.setText(_POSITION_UNKNOWN_TEXT)
+            form.position_display_label.setStyleSheet("")
 
-            # Y-Koordinate
-            self.form_layout.addWidget(QLabel("Y:"), row, 0)
-            y_spinbox = QSpinBox()
-            y_spinbox.setRange(0, 9999)
-            y_spinbox.setValue(action.params.get("y", 0))
-            self.form_layout.addWidget(y_spinbox, row, 1)
-            self.parameter_widgets["y"] = y_spinbox
-            row += 1
+    def _add_screen_combo(self, form: QWidget, layout: QGridLayout, row: int):
+        """
+        Fügt die Bildschirm-Auswahl als Parameter "screen_id" hinzu
 
-            # Mausposition-Display für Live-Tracking
-            self.position_display_label = QLabel("Aktuelle Mausposition: ---, ---")
-            self.form_layout.addWidget(self.position_display_label, row, 0, 1, 2)
-            row += 1
+        Returns:
+            Tuple[QComboBox, int]: Die ComboBox und die nächste freie Zeile
+        """
+        layout.addWidget(QLabel(_LBL_SCREEN), row, 0)
+        screen_combo = QComboBox()
+        screen_combo.addItems(self._screen_labels())
+        layout.addWidget(screen_combo, row, 1)
+        self._register_param(form, "screen_id", screen_combo, 0)
+        return screen_combo, row + 1
+
+    def _add_xy_spinboxes(self, form: QWidget, layout: QGridLayout, row: int,
+                          x_key: str, y_key: str, x_label: str = _LBL_X, y_label: str = _LBL_Y):
+        """
+        Fügt zwei Spinboxen für eine X/Y-Koordinate hinzu
 
-            # Position loggen Button
-            track_position_btn = QPushButton("Mausposition loggen (Enter = übernehmen)")
-            track_position_btn.clicked.connect(
-                lambda: self.toggle_position_tracking(x_spinbox, y_spinbox, screen_combo)
-            )
-            self.form_layout.addWidget(track_position_btn, row, 0, 1, 2)
-            row += 1
+        Args:
+            x_key: Parametername der X-Koordinate
+            y_key: Parametername der Y-Koordinate
+            x_label: Beschriftung der X-Koordinate
+            y_label: Beschriftung der Y-Koordinate
 
-            # Test-Button für Mausposition
-            test_position_btn = QPushButton("Position testen")
-            test_position_btn.clicked.connect(
-                lambda: self._test_mouse_position(x_spinbox.value(), y_spinbox.value(),
-                                              screen_combo.currentIndex())
-            )
-            self.form_layout.addWidget(test_position_btn, row, 0, 1, 2)
+        Returns:
+            Tuple[QSpinBox, QSpinBox, int]: X- und Y-Spinbox sowie die nächste freie Zeile
+        """
+        spinboxes = []
+        for key, label in ((x_key, x_label), (y_key, y_label)):
+            layout.addWidget(QLabel(label), row, 0)
+            spinbox = self._make_spinbox(QSpinBox, 0, 9999)
+            layout.addWidget(spinbox, row, 1)
+            self._register_param(form, key, spinbox, 0)
+            spinboxes.append(spinbox)
             row += 1
+        return spinboxes[0], spinboxes[1], row
 
-            # Farbe
-            self.form_layout.addWidget(QLabel("Farbe (R,G,B):"), row, 0)
-            color = action.params.get("color", [255, 0, 0])
-            color_edit = QLineEdit(",".join(map(str, color)))
-            self.form_layout.addWidget(color_edit, row, 1)
-
-            # Farbe auswählen-Button
-            pick_color_btn = QPushButton("Auswählen")
-            pick_color_btn.clicked.connect(lambda: self._pick_color(color_edit))
-            self.form_layout.addWidget(pick_color_btn, row, 2)
+    def _add_position_display(self, form: QWidget, layout: QGridLayout, row: int) -> int:
+        """Fügt das Label für das Live-Tracking hinzu und gibt die nächste freie Zeile zurück"""
+        form.position_display_label = QLabel(_POSITION_UNKNOWN_TEXT)
+        layout.addWidget(form.position_display_label, row, 0, 1, 2)
+        return row + 1
 
-            self.parameter_widgets["color"] = color_edit
-            row += 1
-
-            # Toleranz
-            self.form_layout.addWidget(QLabel("Toleranz:"), row, 0)
-            tolerance_spinbox = QSpinBox()
-            tolerance_spinbox.setRange(0, 100)
-            tolerance_spinbox.setValue(action.params.get("tolerance", 10))
-            self.form_layout.addWidget(tolerance_spinbox, row, 1)
-            self.parameter_widgets["tolerance"] = tolerance_spinbox
-            row += 1
+    def _add_track_test_buttons(self, layout: QGridLayout, row: int, x_widget, y_widget,
+                                screen_combo, track_text: str, test_text: str) -> int:
+        """
+        Fügt die Buttons zum Loggen und Testen einer Position hinzu
 
-            # Timeout
-            self.form_layout.addWidget(QLabel("Timeout (s):"), row, 0)
-            timeout_spinbox = QSpinBox()
-            timeout_spinbox.setRange(1, 300)
-            timeout_spinbox.setValue(action.params.get("timeout", 10))
-            self.form_layout.addWidget(timeout_spinbox, row, 1)
-            self.parameter_widgets["timeout"] = timeout_spinbox
-            row += 1
+        Args:
+            x_widget: Spinbox der X-Koordinate
+            y_widget: Spinbox der Y-Koordinate
+            screen_combo: ComboBox mit der Bildschirmauswahl
+            track_text: Beschriftung des Logging-Buttons
+            test_text: Beschriftung des Test-Buttons
 
-        elif action.action_type == ActionType.WAIT_FOR_TEXT:
-            # Bildschirm-Auswahl
-            self.form_layout.addWidget(QLabel("Bildschirm:"), row, 0)
-            screen_combo = QComboBox()
-            for screen in self.get_available_screens():
-                screen_combo.addItem(
-                    f"Bildschirm {screen['id']} ({screen['width']}×{screen['height']})"
-                )
-            screen_combo.setCurrentIndex(action.params.get("screen_id", 0))
-            self.form_layout.addWidget(screen_combo, row, 1)
-            self.parameter_widgets["screen_id"] = screen_combo
-            row += 1
+        Returns:
+            int: Die nächste freie Zeile
+        """
+        track_btn = QPushButton(track_text)
+        track_btn.clicked.connect(partial(self._on_track_position, x_widget, y_widget, screen_combo))
+        layout.addWidget(track_btn, row, 0, 1, 2)
+        row += 1
 
-            # Region
-            self.form_layout.addWidget(QLabel("Region [x,y,breite,höhe]:"), row, 0)
-            region = action.params.get("region", [0, 0, 200, 100])
-            region_edit = QLineEdit(",".join(map(str, region)))
-            self.form_layout.addWidget(region_edit, row, 1)
+        test_btn = QPushButton(test_text)
+        test_btn.clicked.connect(partial(self._on_test_position, x_widget, y_widget, screen_combo))
+        layout.addWidget(test_btn, row, 0, 1, 2)
+        return row + 1
 
-            # Region auswählen-Button
-            pick_region_btn = QPushButton("Auswählen")
-            pick_region_btn.clicked.connect(lambda: self._pick_region(region_edit, screen_combo.currentIndex()))
-            self.form_layout.addWidget(pick_region_btn, row, 2)
+    def _create_parameter_widgets(self, action_type: ActionType) -> QWidget:
+        """
+        Erstellt das Parameter-Formular für einen Aktionstyp
 
-            self.parameter_widgets["region"] = region_edit
-            row += 1
+        Args:
+            action_type: Der Aktionstyp, für den das Formular erstellt wird
 
-            # Test-Button für obere linke Ecke der Region
-            if len(region) >= 2:
-                test_region_btn = QPushButton("Region-Position testen")
-                test_region_btn.clicked.connect(
-                    lambda: self._test_mouse_position(region[0], region[1], screen_combo.currentIndex())
-                )
-                self.form_layout.addWidget(test_region_btn, row, 0, 1, 2)
-                row += 1
-
-            # Text
-            self.form_layout.addWidget(QLabel("Text:"), row, 0)
-            text_edit = QLineEdit(action.params.get("text", "Beispieltext"))
-            self.form_layout.addWidget(text_edit, row, 1)
-            self.parameter_widgets["text"] = text_edit
+        Returns:
+            QWidget: Das Formular mit den Parameter-Widgets
+        """
+        builder = self._FORM_BUILDERS.get(action_type)
+        if builder is None:
+            form, _ = self._new_form()
+            return form
+        return builder(self, action_type)
+
+    def _build_form_mouse_point(self, action_type: ActionType) -> QWidget:
+        """Formular für Mausbewegung und Mausklicks"""
+        form, layout = self._new_form()
+
+        screen_combo, row = self._add_screen_combo(form, layout, 0)
+        x_spinbox, y_spinbox, row = self._add_xy_spinboxes(form, layout, row, "x", "y")
+        row = self._add_position_display(form, layout, row)
+        row = self._add_track_test_buttons(
+            layout, row, x_spinbox, y_spinbox, screen_combo,
+            "Mausposition loggen (Enter = übernehmen)", "Position testen"
+        )
+
+        # Maustaste (nur für Klick-Aktionen)
+        if action_type != ActionType.MOUSE_MOVE:
+            layout.addWidget(QLabel(_LBL_BUTTON), row, 0)
+            button_combo = QComboBox()
+            button_combo.addItems(["left", "middle", "right"])
+            layout.addWidget(button_combo, row, 1)
+            self._register_param(form, "button", button_combo, "left")
             row += 1
 
-            # Timeout
-            self.form_layout.addWidget(QLabel("Timeout (s):"), row, 0)
-            timeout_spinbox = QSpinBox()
-            timeout_spinbox.setRange(1, 300)
-            timeout_spinbox.setValue(action.params.get("timeout", 10))
-            self.form_layout.addWidget(timeout_spinbox, row, 1)
-            self.parameter_widgets["timeout"] = timeout_spinbox
-            row += 1
+        # Dauer
+        layout.addWidget(QLabel(_LBL_DURATION), row, 0)
+        duration_spinbox = self._make_spinbox(QDoubleSpinBox, 0, 10, 0.1, 1)
+        layout.addWidget(duration_spinbox, row, 1)
+        self._register_param(form, "duration", duration_spinbox, 0.1)
+
+        return form
+
+    def _build_form_mouse_drag(self, action_type: ActionType) -> QWidget:
+        """Formular für das Ziehen mit der Maus"""
+        form, layout = self._new_form()
+
+        screen_combo, row = self._add_screen_combo(form, layout, 0)
+
+        # Start-Position
+        start_x, start_y, row = self._add_xy_spinboxes(
+            form, layout, row, "start_x", "start_y", "Start X:", "Start Y:"
+        )
+        row = self._add_position_display(form, layout, row)
+        row = self._add_track_test_buttons(
+            layout, row, start_x, start_y, screen_combo,
+            "Start-Position loggen (Enter = übernehmen)", "Start-Position testen"
+        )
+
+        # End-Position
+        end_x, end_y, row = self._add_xy_spinboxes(
+            form, layout, row, "end_x", "end_y", "End X:", "End Y:"
+        )
+        row = self._add_track_test_buttons(
+            layout, row, end_x, end_y, screen_combo,
+            "End-Position loggen (Enter = übernehmen)", "End-Position testen"
+        )
+
+        # Maustaste
+        layout.addWidget(QLabel(_LBL_BUTTON), row, 0)
+        button_combo = QComboBox()
+        button_combo.addItems(["left", "middle", "right"])
+        layout.addWidget(button_combo, row, 1)
+        self._register_param(form, "button", button_combo, "left")
+        row += 1
+
+        # Dauer
+        layout.addWidget(QLabel(_LBL_DURATION), row, 0)
+        duration_spinbox = self._make_spinbox(QDoubleSpinBox, 0, 10, 0.1, 1)
+        layout.addWidget(duration_spinbox, row, 1)
+        self._register_param(form, "duration", duration_spinbox, 0.5)
+
+        return form
+
+    def _build_form_key_press(self, action_type: ActionType) -> QWidget:
+        """Formular für einen einzelnen Tastendruck"""
+        form, layout = self._new_form()
+
+        # Taste
+        layout.addWidget(QLabel(_LBL_BUTTON), 0, 0)
+        key_edit = QLineEdit()
+        layout.addWidget(key_edit, 0, 1)
+        self._register_param(form, "key", key_edit, "enter")
+
+        return form
+
+    def _build_form_key_combo(self, action_type: ActionType) -> QWidget:
+        """Formular für eine Tastenkombination"""
+        form, layout = self._new_form()
+
+        # Tasten (als kommaseparierte Liste)
+        layout.addWidget(QLabel("Tasten (mit Komma getrennt):"), 0, 0)
+        keys_edit = QLineEdit()
+        layout.addWidget(keys_edit, 0, 1)
+        self._register_param(form, "keys", keys_edit, ["ctrl", "c"])
+
+        return form
+
+    def _build_form_text_write(self, action_type: ActionType) -> QWidget:
+        """Formular für die Texteingabe"""
+        form, layout = self._new_form()
+
+        # Text
+        layout.addWidget(QLabel(_LBL_TEXT), 0, 0)
+        text_edit = QLineEdit()
+        layout.addWidget(text_edit, 0, 1)
+        self._register_param(form, "text", text_edit, "Beispieltext")
+
+        # Verzögerung zwischen Tastendrücken
+        layout.addWidget(QLabel("Verzögerung (s):"), 1, 0)
+        interval_spinbox = self._make_spinbox(QDoubleSpinBox, 0, 1, 0.01, 2)
+        layout.addWidget(interval_spinbox, 1, 1)
+        self._register_param(form, "interval", interval_spinbox, 0)
+
+        return form
+
+    def _build_form_wait(self, action_type: ActionType) -> QWidget:
+        """Formular für eine feste Wartezeit"""
+        form, layout = self._new_form()
+
+        # Wartezeit in Sekunden
+        layout.addWidget(QLabel("Sekunden:"), 0, 0)
+        seconds_spinbox = self._make_spinbox(QDoubleSpinBox, 0, 600, 0.5, 1)
+        layout.addWidget(seconds_spinbox, 0, 1)
+        self._register_param(form, "seconds", seconds_spinbox, 1)
+
+        return form
+
+    def _build_form_wait_for_color(self, action_type: ActionType) -> QWidget:
+        """Formular für das Warten auf eine Farbe"""
+        form, layout = self._new_form()
+
+        screen_combo, row = self._add_screen_combo(form, layout, 0)
+        x_spinbox, y_spinbox, row = self._add_xy_spinboxes(form, layout, row, "x", "y")
+        row = self._add_position_display(form, layout, row)
+        row = self._add_track_test_buttons(
+            layout, row, x_spinbox, y_spinbox, screen_combo,
+            "Mausposition loggen (Enter = übernehmen)", "Position testen"
+        )
+
+        # Farbe
+        layout.addWidget(QLabel("Farbe (R,G,B):"), row, 0)
+        color_edit = _ColorEditor()
+        layout.addWidget(color_edit, row, 1)
+
+        # Farbe auswählen-Button
+        pick_color_btn = QPushButton("Auswählen")
+        pick_color_btn.clicked.connect(partial(self._pick_color, color_edit))
+        layout.addWidget(pick_color_btn, row, 2)
+
+        self._register_param(form, "color", color_edit, [255, 0, 0])
+        row += 1
+
+        # Toleranz
+        layout.addWidget(QLabel("Toleranz:"), row, 0)
+        tolerance_spinbox = self._make_spinbox(QSpinBox, 0, 100)
+        layout.addWidget(tolerance_spinbox, row, 1)
+        self._register_param(form, "tolerance", tolerance_spinbox, 10)
+        row += 1
+
+        # Timeout
+        layout.addWidget(QLabel(_LBL_TIMEOUT), row, 0)
+        timeout_spinbox = self._make_spinbox(QSpinBox, 1, 300)
+        layout.addWidget(timeout_spinbox, row, 1)
+        self._register_param(form, "timeout", timeout_spinbox, 10)
+
+        return form
+
+    def _build_form_wait_for_text(self, action_type: ActionType) -> QWidget:
+        """Formular für das Warten auf einen Text"""
+        form, layout = self._new_form()
+
+        screen_combo, row = self._add_screen_combo(form, layout, 0)
+
+        # Region
+        layout.addWidget(QLabel("Region [x,y,breite,höhe]:"), row, 0)
+        region_edit = _RegionEditor()
+        layout.addWidget(region_edit, row, 1)
+
+        # Region auswählen-Button
+        pick_region_btn = QPushButton("Auswählen")
+        pick_region_btn.clicked.connect(partial(self._on_pick_region, region_edit, screen_combo))
+        layout.addWidget(pick_region_btn, row, 2)
+
+        self._register_param(form, "region", region_edit, [0, 0, 200, 100])
+        row += 1
+
+        # Test-Button für obere linke Ecke der Region
+        test_region_btn = QPushButton("Region-Position testen")
+        test_region_btn.clicked.connect(
+            partial(self._test_region_position, region_edit, screen_combo)
+        )
+        layout.addWidget(test_region_btn, row, 0, 1, 2)
+        row += 1
+
+        # Text
+        layout.addWidget(QLabel(_LBL_TEXT), row, 0)
+        text_edit = QLineEdit()
+        layout.addWidget(text_edit, row, 1)
+        self._register_param(form, "text", text_edit, "Beispieltext")
+        row += 1
+
+        # Timeout
+        layout.addWidget(QLabel(_LBL_TIMEOUT), row, 0)
+        timeout_spinbox = self._make_spinbox(QSpinBox, 1, 300)
+        layout.addWidget(timeout_spinbox, row, 1)
+        self._register_param(form, "timeout", timeout_spinbox, 10)
+
+        return form
+
+    # Formular-Builder pro Aktionstyp
+    _FORM_BUILDERS = {
+        **dict.fromkeys(_MOUSE_POINT_TYPES, _build_form_mouse_point),
+        ActionType.MOUSE_DRAG: _build_form_mouse_drag,
+        ActionType.KEY_PRESS: _build_form_key_press,
+        ActionType.KEY_COMBO: _build_form_key_combo,
+        ActionType.TEXT_WRITE: _build_form_text_write,
+        ActionType.WAIT: _build_form_wait,
+        ActionType.WAIT_FOR_COLOR: _build_form_wait_for_color,
+        ActionType.WAIT_FOR_TEXT: _build_form_wait_for_text,
+    }
 
     def _on_type_changed(self, new_type_str: str):
         """
@@ -529,18 +822,37 @@ class ActionEditor(QWidget):
             return
 
         # Nur fortfahren, wenn sich der Typ tatsächlich geändert hat
-        new_type = next((t for t in ActionType if t.value == new_type_str), None)
+        new_type = ActionType.from_value(new_type_str)
         if new_type and new_type != self.action.action_type:
+            # Ohne Bestätigung wechseln, wenn keine Parameter verloren gehen können
+            if new_type.expected_params.issuperset(self.action.params):
+                self.type_changed.emit(new_type)
+                return
+
             # Bestätigungsdialog anzeigen
+            dialog = self._get_type_change_dialog()
+            self._type_change_message.setText(
+                f"Möchtest du den Aktionstyp wirklich ändern? "
+                f"Von '{self.action.action_type.value}' zu '{new_type.value}'?\n\n"
+                f"Hinweis: Einige Parameter könnten verloren gehen.")
+
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self.type_changed.emit(new_type)
+            else:
+                # Auswahl auf den bisherigen Typ zurücksetzen
+                with QSignalBlocker(self.type_combo):
+                    self.type_combo.setCurrentText(self.action.action_type.value)
+
+    def _get_type_change_dialog(self) -> QDialog:
+        """Erstellt den Bestätigungsdialog für Typänderungen beim ersten Aufruf"""
+        if self._type_change_dialog is None:
             dialog = QDialog(self)
             dialog.setWindowTitle("Aktionstyp ändern")
             dialog_layout = QVBoxLayout(dialog)
 
-            message = QLabel(f"Möchtest du den Aktionstyp wirklich ändern? "
-                           f"Von '{self.action.action_type.value}' zu '{new_type.value}'?\n\n"
-                           f"Hinweis: Einige Parameter könnten verloren gehen.")
-            message.setWordWrap(True)
-            dialog_layout.addWidget(message)
+            self._type_change_message = QLabel()
+            self._type_change_message.setWordWrap(True)
+            dialog_layout.addWidget(self._type_change_message)
 
             button_box = QDialogButtonBox(
                 QDialogButtonBox.StandardButton.Yes | QDialogButtonBox.StandardButton.No)
@@ -548,51 +860,44 @@ class ActionEditor(QWidget):
             button_box.rejected.connect(dialog.reject)
             dialog_layout.addWidget(button_box)
 
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                self.type_changed.emit(new_type)
+            self._type_change_dialog = dialog
+
+        return self._type_change_dialog
 
     def _apply_changes(self):
         """Sammelt die Änderungen aus den Widgets und gibt sie weiter"""
         if not self.edit_mode or not self.action:
             return
 
-        for param_name, widget in self.parameter_widgets.items():
-            if param_name in self.action.params:
-                old_value = self.action.params[param_name]
+        # Getippte, noch nicht bestätigte Spinbox-Werte übernehmen (ohne Tastatur-Tracking
+        # sonst erst bei Enter oder Fokusverlust; ein Klick auf Übernehmen nimmt unter
+        # macOS keinen Fokus). Geänderte Werte lösen valueChanged und damit _mark_dirty aus.
+        if self._current_form is not None:
+            for spinbox in self._current_form.findChildren(QAbstractSpinBox):
+                spinbox.interpretText()
 
-                if isinstance(widget, QSpinBox) or isinstance(widget, QDoubleSpinBox):
-                    new_value = widget.value()
-                elif isinstance(widget, QComboBox):
-                    if param_name == "screen_id":
-                        new_value = widget.currentIndex()  # Speichere den Index, nicht den Text
-                    else:
-                        new_value = widget.currentText()
-                elif isinstance(widget, QLineEdit):
-                    # Spezielle Behandlung für bestimmte Parameter
-                    if param_name == "keys":
-                        new_value = [k.strip() for k in widget.text().split(",")]
-                    elif param_name == "color":
-                        valid, color = validate_color(widget.text())
-                        if valid:
-                            new_value = color
-                        else:
-                            continue  # Ungültige Farbe, überspringen
-                    elif param_name == "region":
-                        valid, region = validate_region(widget.text())
-                        if valid:
-                            new_value = region
-                        else:
-                            continue  # Ungültige Region, überspringen
-                    else:
-                        new_value = widget.text()
-                else:
-                    continue  # Unbekannter Widget-Typ
+        changes = []
+
+        # Nur Parameter prüfen, deren Widgets seit dem Laden geändert wurden
+        dirty_params, self._dirty_params = self._dirty_params, {}
+        for param_name in dirty_params:
+            widget = self.parameter_widgets.get(param_name)
+            if widget is None or param_name not in self.action.params:
+                continue
+
+            old_value = self.action.params[param_name]
+
+            valid, new_value = _extract_widget_value(widget, param_name)
+            if not valid:
+                continue  # Unbekannter Widget-Typ oder ungültige Eingabe
 
-                if new_value != old_value:
-                    # Parameteränderung senden
-                    self.parameter_changed.emit(
-                        ActionParameterChangeEvent(param_name, old_value, new_value)
-                    )
+            if new_value != old_value:
+                # Parameteränderung vormerken
+                changes.append(ActionParameterChangeEvent(param_name, old_value, new_value))
+
+        # Alle Änderungen gesammelt senden
+        if changes:
+            self.parameters_changed.emit(changes)
 
     def toggle_position_tracking(self, x_widget, y_widget, screen_combo=None):
         """
@@ -623,17 +928,19 @@ class ActionEditor(QWidget):
 
         # Tracking-Status setzen
         self.tracking_active = True
-        self.tracking_target_widget = (x_widget, y_widget)
-        self.tracking_screen_combo = screen_combo
+        # Nur schwache Referenzen, damit das Tracking keine Widgets am Leben hält
+        self.tracking_target_widget = (weakref.proxy(x_widget), weakref.proxy(y_widget))
+        self.tracking_screen_combo = weakref.proxy(screen_combo) if screen_combo is not None else None
+        self._cached_screens = None  # Bildschirmanordnung zu Beginn neu einlesen
+        self._last_pos_text = None
+        self._pos_template = None
 
         # Shortcut aktivieren
-        if hasattr(self, 'enter_shortcut'):
-            self.enter_shortcut.setEnabled(True)
+        self.enter_shortcut.setEnabled(True)
 
-        # Timer für Mausverfolgung starten
-        self.tracking_timer = QTimer()
-        self.tracking_timer.timeout.connect(self.update_mouse_position)
-        self.tracking_timer.start(50)  # Alle 50 ms aktualisieren
+        # Mausabfrage im Worker-Thread starten
+        self._ensure_cursor_poller()
+        self._cursor_polling_started.emit()
 
         # Status-Label aktualisieren
         if self.position_display_label:
@@ -644,51 +951,64 @@ class ActionEditor(QWidget):
         if not self.tracking_active:
             return
 
-        # Timer stoppen
-        if self.tracking_timer:
-            self.tracking_timer.stop()
-            self.tracking_timer = None
+        # Mausabfrage im Worker-Thread anhalten
+        if self._cursor_poller is not None:
+            self._cursor_polling_stopped.emit()
 
         # Tracking-Status zurücksetzen
         self.tracking_active = False
         self.tracking_target_widget = None
+        self.tracking_screen_combo = None
 
         # Shortcut deaktivieren
-        if hasattr(self, 'enter_shortcut'):
-            self.enter_shortcut.setEnabled(False)
+        self.enter_shortcut.setEnabled(False)
 
         # Status-Label zurücksetzen
         if self.position_display_label:
             self.position_display_label.setStyleSheet("")
 
-    def update_mouse_position(self):
-        """Aktualisiert das Label mit der aktuellen Mausposition"""
+    def update_mouse_position(self, x: int, y: int):
+        """
+        Aktualisiert das Label mit der aktuellen Mausposition
+
+        Wird vom CursorPoller im Worker-Thread nur bei Mausbewegungen ausgelöst.
+
+        Args:
+            x: Globale X-Koordinate des Mauszeigers
+            y: Globale Y-Koordinate des Mauszeigers
+        """
         if not self.tracking_active or not self.position_display_label:
             return
 
-        # Aktuelle globale Mausposition abrufen
-        global_pos = pyautogui.position()
-
-        # Wenn wir einen Bildschirm-Selektor haben, die relativen Koordinaten berechnen
-        screen_id = 0
-        if self.tracking_screen_combo:
-            screen_id = self.tracking_screen_combo.currentIndex()
+        # Offset des ausgewählten Bildschirms aus dem Cache holen
+        try:
+            screen_id, offset = self._tracking_screen_offset()
+        except (ReferenceError, RuntimeError):
+            # Bildschirm-Auswahl wurde inzwischen gelöscht
+            self.stop_position_tracking()
+            return
 
-        # Bildschirminformationen holen
-        screens = self.get_available_screens()
-        if 0 <= screen_id < len(screens):
-            screen = screens[screen_id]
+        if offset is not None:
             # Relative Position zum ausgewählten Bildschirm berechnen
-            rel_x = global_pos[0] - screen["x"]
-            rel_y = global_pos[1] - screen["y"]
-
-            # Display aktualisieren mit relativen Koordinaten
-            self.position_display_label.setText(
-                f"Position auf Bildschirm {screen_id}: {rel_x}, {rel_y}"
-            )
+            x -= offset[0]
+            y -= offset[1]
         else:
             # Fallback auf absolute Koordinaten
-            self.position_display_label.setText(f"Globale Position: {global_pos[0]}, {global_pos[1]}")
+            screen_id = None
+
+        # Textvorlage nur bei einem Bildschirmwechsel neu erstellen
+        if self._pos_template_screen != screen_id or self._pos_template is None:
+            self._pos_template_screen = screen_id
+            if screen_id is None:
+                self._pos_template = "Globale Position: {}, {}"
+            else:
+                self._pos_template = f"Position auf Bildschirm {screen_id}: {{}}, {{}}"
+        text = self._pos_template.format(x, y)
+
+        # Label nur neu setzen (und neu zeichnen), wenn sich der Text geändert hat
+        if text != self._last_pos_text:
+            self._last_pos_text = text
+            self.position_display_label.setText(text)
 
     def apply_tracked_position(self):
         """Übernimmt die aktuelle Mausposition in die Zielfelder"""
@@ -696,48 +1016,63 @@ class ActionEditor(QWidget):
             return
 
         # Aktuelle globale Mausposition abrufen
-        global_pos = pyautogui.position()
+        global_pos = _cursor_xy()
 
-        # Bildschirm-ID für die Konvertierung holen
-        screen_id = 0
-        if self.tracking_screen_combo:
-            screen_id = self.tracking_screen_combo.currentIndex()
+        try:
+            # Offset des ausgewählten Bildschirms aus dem Cache holen
+            screen_id, offset = self._tracking_screen_offset()
+            if offset is not None:
+                # Relative Position zum ausgewählten Bildschirm berechnen
+                x = global_pos[0] - offset[0]
+                y = global_pos[1] - offset[1]
+                message = f"Position übernommen: {x}, {y} (Bildschirm {screen_id})"
+            else:
+                # Fallback auf absolute Koordinaten
+                x, y = global_pos
+                message = f"Position übernommen: {x}, {y}"
+
+            # Werte in die Felder eintragen
+            x_widget, y_widget = self.tracking_target_widget
+            x_widget.setValue(x)
+            y_widget.setValue(y)
+        except (ReferenceError, RuntimeError):
+            # Zielfelder wurden inzwischen gelöscht
+            self.stop_position_tracking()
+            return
 
-        # Bildschirminformationen holen
-        screens = self.get_available_screens()
-        if 0 <= screen_id < len(screens):
-            screen = screens[screen_id]
-            # Relative Position zum ausgewählten Bildschirm berechnen
-            rel_x = global_pos[0] - screen["x"]
-            rel_y = global_pos[1] - screen["y"]
+        # Tracking beenden
+        self.stop_position_tracking()
 
-            # Werte in die Felder eintragen (relative Koordinaten)
-            x_widget, y_widget = self.tracking_target_widget
-            x_widget.setValue(rel_x)
-            y_widget.setValue(rel_y)
+        # Bestätigungsnachricht anzeigen
+        if self.position_display_label:
+            self.position_display_label.setText(message)
 
-            # Tracking beenden
-            self.stop_position_tracking()
+    def _update_cursor_polling(self, state=None):
+        """
+        Pausiert die Mausabfrage bei verstecktem Editor oder inaktiver Anwendung
+        und setzt sie danach fort; das laufende Tracking bleibt dabei erhalten
 
-            # Bestätigungsnachricht anzeigen
-            if self.position_display_label:
-                self.position_display_label.setText(
-                    f"Position übernommen: {rel_x}, {rel_y} (Bildschirm {screen_id})"
-                )
+        Args:
+            state: Vom applicationStateChanged-Signal übergeben, wird ignoriert
+        """
+        if not self.tracking_active or self._cursor_poller is None:
+            return
+
+        app_active = QApplication.applicationState() == Qt.ApplicationState.ApplicationActive
+        if self.isVisible() and app_active:
+            self._cursor_polling_started.emit()
         else:
-            # Fallback auf absolute Koordinaten
-            x_widget, y_widget = self.tracking_target_widget
-            x_widget.setValue(global_pos[0])
-            y_widget.setValue(global_pos[1])
+            self._cursor_polling_stopped.emit()
 
-            # Tracking beenden
-            self.stop_position_tracking()
+    def showEvent(self, event):
+        """Setzt eine pausierte Mausabfrage fort"""
+        super().showEvent(event)
+        self._update_cursor_polling()
 
-            # Bestätigungsnachricht anzeigen
-            if self.position_display_label:
-                self.position_display_label.setText(
-                    f"Position übernommen: {global_pos[0]}, {global_pos[1]}"
-                )
+    def hideEvent(self, event):
+        """Pausiert die Mausabfrage, solange der Editor nicht sichtbar ist"""
+        super().hideEvent(event)
+        self._update_cursor_polling()
 
     def keyPressEvent(self, event):
         """Behandelt Tastatureingaben"""
@@ -756,46 +1091,145 @@ class ActionEditor(QWidget):
             y: Y-Koordinate (relativ zum Bildschirm)
             screen_id: ID des Bildschirms
         """
-        # Aktuelle Mausposition speichern
-        original_pos = pyautogui.position()
+        # Bildschirmoffset für absolute Koordinaten hinzufügen
+        offsets = self._screen_offsets()
+        abs_x, abs_y = x, y
+
+        if 0 <= screen_id < len(offsets):
+            offset_x, offset_y = offsets[screen_id]
+            abs_x = offset_x + x
+            abs_y = offset_y + y
+
+        # Bewegung im Worker-Thread ausführen, damit die UI nicht blockiert
+        self._ensure_mouse_tester()
+        # (die Ausgangsposition der Maus fragt der Worker selbst ab)
+        self._mouse_test_requested.emit(abs_x, abs_y)
+
+    def _ensure_mouse_tester(self):
+        """Erstellt den Worker-Thread für Positionstests beim ersten Aufruf"""
+        if self._mouse_thread is not None:
+            return
 
-        try:
-            # Bildschirmoffset für absolute Koordinaten hinzufügen
-            screens = self.get_available_screens()
-            abs_x, abs_y = x, y
+        self._mouse_thread = QThread()
+        self._mouse_tester = MousePositionTester()
+        self._mouse_tester.moveToThread(self._mouse_thread)
+
+        self._mouse_test_requested.connect(self._mouse_tester.test,
+                                           Qt.ConnectionType.QueuedConnection)
+        self._mouse_tester.error_occurred.connect(self._on_mouse_test_error)
+        self._mouse_thread.finished.connect(self._mouse_tester.deleteLater)
+        QApplication.instance().aboutToQuit.connect(self._stop_mouse_tester)
+
+        self._mouse_thread.start()
+
+    def _stop_mouse_tester(self):
+        """Beendet den Worker-Thread für Positionstests"""
+        if self._mouse_thread is None:
+            return
+
+        self._mouse_thread.quit()
+        self._mouse_thread.wait(2000)
+        self._mouse_thread = None
+        self._mouse_tester = None
+
+    def _ensure_cursor_poller(self):
+        """Erstellt den Worker-Thread für die Mausabfrage beim ersten Tracking"""
+        if self._cursor_thread is not None:
+            return
 
-            if 0 <= screen_id < len(screens):
-                screen = screens[screen_id]
-                abs_x = screen["x"] + x
-                abs_y = screen["y"] + y
+        self._cursor_thread = QThread()
+        self._cursor_poller = CursorPoller(MOUSE_TRACKING_INTERVAL)
+        self._cursor_poller.moveToThread(self._cursor_thread)
 
-            # Maus zur gewünschten Position bewegen
-            pyautogui.moveTo(abs_x, abs_y, duration=0.2)
+        self._cursor_polling_started.connect(self._cursor_poller.start,
+                                             Qt.ConnectionType.QueuedConnection)
+        self._cursor_polling_stopped.connect(self._cursor_poller.stop,
+                                             Qt.ConnectionType.QueuedConnection)
+        self._cursor_poller.position_changed.connect(self.update_mouse_position,
+                                                     Qt.ConnectionType.QueuedConnection)
+        self._cursor_thread.finished.connect(self._cursor_poller.deleteLater)
+        QApplication.instance().aboutToQuit.connect(self._stop_cursor_poller)
 
-            # Funktion, um die Maus nach einer Verzögerung zurückzubewegen
-            def move_back():
-                time.sleep(1.5)  # 1,5 Sekunden warten
-                pyautogui.moveTo(original_pos[0], original_pos[1], duration=0.2)
+        self._cursor_thread.start()
 
-            # Thread starten, um die Maus zurückzubewegen
-            thread = threading.Thread(target=move_back)
-            thread.daemon = True  # Thread als Daemon markieren, damit er das Programm nicht blockiert
-            thread.start()
+    def _stop_cursor_poller(self):
+        """Beendet den Worker-Thread für die Mausabfrage"""
+        if self._cursor_thread is None:
+            return
+
+        self._cursor_thread.quit()
+        self._cursor_thread.wait(2000)
+        self._cursor_thread = None
+        self._cursor_poller = None
+
+    def _on_mouse_test_error(self, error_message: str):
+        """Wird aufgerufen, wenn der Positionstest im Worker fehlschlägt"""
+        QMessageBox.warning(self, "Positionstest fehlgeschlagen",
+                            f"Fehler beim Testen der Position: {error_message}")
+
+    def _on_track_position(self, x_widget: QSpinBox, y_widget: QSpinBox,
+                           screen_combo: QComboBox, checked: bool = False):
+        """
+        Slot für die Logging-Buttons: schaltet das Positions-Tracking um
+
+        Args:
+            x_widget: Widget für die X-Koordinate
+            y_widget: Widget für die Y-Koordinate
+            screen_combo: ComboBox mit der Bildschirmauswahl
+            checked: Vom clicked-Signal übergeben, wird ignoriert
+        """
+        self.toggle_position_tracking(x_widget, y_widget, screen_combo)
+
+    def _on_test_position(self, x_widget: QSpinBox, y_widget: QSpinBox,
+                          screen_combo: QComboBox, checked: bool = False):
+        """
+        Slot für die Test-Buttons: liest die Koordinaten erst beim Klick aus
+
+        Args:
+            x_widget: Widget für die X-Koordinate
+            y_widget: Widget für die Y-Koordinate
+            screen_combo: ComboBox mit der Bildschirmauswahl
+            checked: Vom clicked-Signal übergeben, wird ignoriert
+        """
+        self._test_mouse_position(x_widget.value(), y_widget.value(), screen_combo.currentIndex())
+
+    def _test_region_position(self, region_edit: "_RegionEditor", screen_combo: QComboBox,
+                              checked: bool = False):
+        """
+        Bewegt die Maus zur oberen linken Ecke der eingegebenen Region
 
-        except Exception as e:
-            QMessageBox.warning(self, "Positionstest fehlgeschlagen", f"Fehler beim Testen der Position: {str(e)}")
+        Args:
+            region_edit: Das Eingabefeld für die Region
+            screen_combo: ComboBox mit der Bildschirmauswahl
+            checked: Vom clicked-Signal übergeben, wird ignoriert
+        """
+        x, y, _, _ = region_edit.value()
+        self._test_mouse_position(x, y, screen_combo.currentIndex())
 
-    def _pick_color(self, color_edit: QLineEdit):
+    def _pick_color(self, color_edit: _ColorEditor, checked: bool = False):
         """
         Öffnet den Farbwähler und setzt die ausgewählte Farbe in das Eingabefeld
 
         Args:
             color_edit: Das Eingabefeld für die Farbe
+            checked: Vom clicked-Signal übergeben, wird ignoriert
         """
         # Placeholder, tatsächliche Implementierung würde den ColorPicker verwenden
         pass
 
-    def _pick_region(self, region_edit: QLineEdit, screen_id: int = 0):
+    def _on_pick_region(self, region_edit: _RegionEditor, screen_combo: QComboBox,
+                        checked: bool = False):
+        """
+        Slot für den Region-Auswählen-Button
+
+        Args:
+            region_edit: Das Eingabefeld für die Region
+            screen_combo: ComboBox mit der Bildschirmauswahl
+            checked: Vom clicked-Signal übergeben, wird ignoriert
+        """
+        self._pick_region(region_edit, screen_combo.currentIndex())
+
+    def _pick_region(self, region_edit: _RegionEditor, screen_id: int = 0):
         """
         Öffnet den Regionswähler und setzt die ausgewählte Region in das Eingabefeld
 
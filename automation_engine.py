@@ -3,17 +3,217 @@ Hauptlogik für die Automatisierung von Benutzerinteraktionen.
 Enthält die AutomationEngine Klasse, die die Ausführung von Workflows handhabt.
 """
 
+import os
+import sys
 import time
 import json
+import hashlib
+import threading
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pyautogui
 import pytesseract
 from PIL import Image, ImageGrab
 from PyQt6.QtWidgets import QApplication
 from typing import List, Dict, Any, Optional, Tuple, Callable
 
+# Tesseract soll pro Erkennung nur einen Kern verwenden, da mehrere
+# Bildschirme parallel erkannt werden (sonst Überbelegung durch OpenMP)
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    # Optional: OCR im eigenen Prozess mit dauerhaft geladenem Sprachmodell
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+try:
+    # Optional: schnellere Bildschirmaufnahmen als mit ImageGrab
+    import mss
+except ImportError:
+    mss = None
+
+try:
+    # Optional: schnellere JSON-Verarbeitung für Workflow-Dateien
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: globaler Tastatur-Hook für die Abbruchtaste
+    import keyboard
+except ImportError:
+    keyboard = None
+
+if sys.platform == "win32":
+    # Direkter Pixelzugriff über die GDI statt eines Screenshots pro Pixel
+    import ctypes
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+else:
+    _user32 = _gdi32 = None
+
+from constants import (COLOR_SEARCH_BAND_ROWS, DEFAULT_BETWEEN_ACTIONS_DELAY, OCR_CACHE_SIZE,
+                       OCR_UPSCALE_FACTOR, OCR_UPSCALE_MAX_HEIGHT, OCR_TILE_MAX_PIXELS,
+                       OCR_TILE_OVERLAP, WAIT_POLL_MIN_INTERVAL,
+                       WAIT_POLL_MAX_INTERVAL, WAIT_POLL_BACKOFF, WORKFLOW_IO_BUFFER_SIZE)
 from models import Action, ActionType
 
 
+def _otsu_threshold(gray: np.ndarray) -> int:
+    """
+    Bestimmt die Binarisierungsschwelle eines Graustufenbildes nach Otsu
+
+    Args:
+        gray: Graustufenbild als uint8-Array
+
+    Returns:
+        int: Schwellwert (0-255)
+    """
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    omega = np.cumsum(hist) / gray.size          # Anteil der Pixel bis zur Schwelle
+    mu = np.cumsum(hist * np.arange(256)) / gray.size
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between_var = (mu[-1] * omega - mu) ** 2 / (omega * (1.0 - omega))
+    return int(np.argmax(np.nan_to_num(between_var)))
+
+
+def _noop():
+    """Platzhalter für Aktionen ohne Handler"""
+
+
+def _find_first_color(pixels: np.ndarray, target_color: List[int],
+                      tolerance: int) -> Optional[Tuple[int, int]]:
+    """
+    Sucht den ersten Pixel (zeilenweise), dessen Kanäle jeweils höchstens
+    um tolerance von der Zielfarbe abweichen
+
+    Das Bild wird in Streifen verglichen, damit auch bei großen Bildschirmen
+    nur kleine Zwischenergebnisse entstehen und die Suche beim ersten Treffer endet.
+
+    Args:
+        pixels: RGB-Bild als uint8-Array (Höhe, Breite, 3)
+        target_color: Die zu suchende Farbe [r, g, b]
+        tolerance: Erlaubte Abweichung pro Farbkanal
+
+    Returns:
+        Optional[Tuple[int, int]]: Position (x, y) des Treffers oder None
+    """
+    # Toleranzbereich als uint8-Grenzen, so ist kein vorzeichenbehafteter Zwischenpuffer nötig
+    target = np.asarray(target_color[:3], dtype=np.int16)
+    lower = np.clip(target - tolerance, 0, 255).astype(np.uint8)
+    upper = np.clip(target + tolerance, 0, 255).astype(np.uint8)
+
+    height, width = pixels.shape[:2]
+    for top in range(0, height, COLOR_SEARCH_BAND_ROWS):
+        band = pixels[top:top + COLOR_SEARCH_BAND_ROWS]
+        mask = ((band >= lower) & (band <= upper)).all(axis=2)
+
+        # argmax bricht bei bool am ersten True ab
+        index = int(mask.argmax())
+        if mask.flat[index]:
+            y, x = divmod(index, width)
+            return (x, top + y)
+    return None
+
+
+def _find_exact_color_bgra(bgra: np.ndarray, target_color: List[int]) -> Optional[Tuple[int, int]]:
+    """
+    Sucht den ersten Pixel (zeilenweise) mit genau der Zielfarbe in einer BGRA-Aufnahme
+
+    Jeder Pixel wird als ein 32-Bit-Wert verglichen statt als drei einzelne Kanäle.
+
+    Args:
+        bgra: BGRA-Aufnahme als zusammenhängendes uint8-Array (Höhe, Breite, 4)
+        target_color: Die zu suchende Farbe [r, g, b]
+
+    Returns:
+        Optional[Tuple[int, int]]: Position (x, y) des Treffers oder None
+    """
+    r, g, b = (int(c) for c in target_color[:3])
+    target = (r << 16) | (g << 8) | b  # BGRA-Bytes als little-endian uint32: 0xAARRGGBB
+
+    packed = bgra.view("<u4")[:, :, 0]
+    height, width = packed.shape
+    for top in range(0, height, COLOR_SEARCH_BAND_ROWS):
+        # Alphakanal ausblenden
+        mask = (packed[top:top + COLOR_SEARCH_BAND_ROWS] & 0x00FFFFFF) == target
+
+        index = int(mask.argmax())
+        if mask.flat[index]:
+            y, x = divmod(index, width)
+            return (x, top + y)
+    return None
+
+
+def _preprocess_for_ocr(img: Image.Image) -> Tuple[Image.Image, int]:
+    """
+    Bereitet ein Bild für Tesseract auf: Graustufen, Binarisierung und
+    Vergrößerung kleiner Regionen
+
+    Args:
+        img: Der Bildschirmausschnitt
+
+    Returns:
+        Tuple[Image.Image, int]: Aufbereitetes Bild und Vergrößerungsfaktor
+    """
+    gray = np.asarray(img.convert("L"))
+    binary = np.where(gray > _otsu_threshold(gray), 255, 0).astype(np.uint8)
+
+    # Tesseract erwartet dunkle Schrift auf hellem Grund
+    if binary.mean() < 127:
+        binary = 255 - binary
+
+    result = Image.fromarray(binary)
+    scale = OCR_UPSCALE_FACTOR if img.height < OCR_UPSCALE_MAX_HEIGHT else 1
+    if scale > 1:
+        result = result.resize((img.width * scale, img.height * scale), Image.Resampling.BICUBIC)
+    return result, scale
+
+
+def _find_text_box(data: Dict[str, List[Any]], text: str,
+                   confidence_threshold: float) -> Optional[List[int]]:
+    """
+    Sucht einen Text in den Wörtern einer Texterkennung
+
+    Zuerst wird ein einzelnes Wort mit ausreichender Konfidenz gesucht,
+    danach (für Texte aus mehreren Wörtern) eine ganze Zeile.
+
+    Args:
+        data: Ergebnis von _ocr_data
+        text: Der zu suchende Text
+        confidence_threshold: Minimale Konfidenz eines Wortes in Prozent
+
+    Returns:
+        Optional[List[int]]: [x, y, width, height] des Wortes bzw. der Zeile, oder None
+    """
+    needle = text.lower()
+    lines = {}
+
+    for i, word in enumerate(data["text"]):
+        if not word or not word.strip():
+            continue
+
+        if needle in word.lower() and float(data["conf"][i]) >= confidence_threshold:
+            return [data["left"][i], data["top"][i], data["width"][i], data["height"][i]]
+
+        line_key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines.setdefault(line_key, []).append(i)
+
+    for indices in lines.values():
+        line_text = " ".join(data["text"][i] for i in indices).lower()
+        if needle in line_text:
+            left = min(data["left"][i] for i in indices)
+            top = min(data["top"][i] for i in indices)
+            right = max(data["left"][i] + data["width"][i] for i in indices)
+            bottom = max(data["top"][i] + data["height"][i] for i in indices)
+            return [left, top, right - left, bottom - top]
+
+    return None
+
+
 class AutomationEngine:
     """Hauptklasse für die Ausführung von Automatisierungsworkflows"""
 
@@ -25,7 +225,55 @@ class AutomationEngine:
         self.loop_enabled = False       # Neues Attribut für Dauerhafte Ausführung
         self.loop_pause = 1.0          # Pause zwischen Wiederholungen in Sekunden
         self.abort_key = "esc"         # Taste zum Abbrechen der Dauerausführung
-        self.screen_info = self._get_screen_info()
+        self.between_actions_delay = DEFAULT_BETWEEN_ACTIONS_DELAY / 1000  # Pause nach jeder Aktion in Sekunden
+        self._abort_event = threading.Event()  # Wird durch die Abbruchtaste oder stop_playback gesetzt
+        self._refresh_screen_info()
+
+        # Bildschirmdaten nur neu erfassen, wenn sich die Bildschirme ändern
+        app = QApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._refresh_screen_info)
+            app.screenRemoved.connect(self._refresh_screen_info)
+
+        # Tesseract-Instanzen für tesserocr, eine pro Thread (nicht threadsicher)
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_lock = threading.Lock()
+
+        # Thread-Pool für die parallele Texterkennung mehrerer Bildschirme
+        # (bleibt bestehen, damit die Tesseract-Instanzen der Threads erhalten bleiben)
+        self._ocr_pool = None
+
+        # mss-Instanzen pro Thread (nicht threadsicher, werden bei Bedarf erstellt)
+        self._capture_local = threading.local()
+        self._scts = []
+        self._capture_lock = threading.Lock()
+
+        # Erkennungsergebnisse pro Bildinhalt (LRU), spart OCR bei unverändertem Bildschirm
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+
+        # Ausführungsfunktion je Aktionstyp
+        self._action_handlers: Dict[ActionType, Callable[[Dict[str, Any], int, int], None]] = {
+            ActionType.MOUSE_MOVE: self._do_mouse_move,
+            ActionType.MOUSE_CLICK: self._do_mouse_click,
+            ActionType.MOUSE_DOUBLE_CLICK: self._do_mouse_double_click,
+            ActionType.MOUSE_RIGHT_CLICK: self._do_mouse_right_click,
+            ActionType.MOUSE_DRAG: self._do_mouse_drag,
+            ActionType.KEY_PRESS: self._do_key_press,
+            ActionType.KEY_COMBO: self._do_key_combo,
+            ActionType.TEXT_WRITE: self._do_text_write,
+            ActionType.WAIT: self._do_wait,
+            ActionType.WAIT_FOR_COLOR: self._do_wait_for_color,
+            ActionType.WAIT_FOR_TEXT: self._do_wait_for_text,
+        }
+
+    def _refresh_screen_info(self, screen=None):
+        """Erfasst die Bildschirmdaten neu (bei Start und wenn Bildschirme hinzukommen oder wegfallen)"""
+        screen_info = self._get_screen_info()
+        # Versatz (x, y) jedes Bildschirms, nach Screen ID indiziert
+        self._screen_offsets = [(info["x"], info["y"]) for info in screen_info["screens"]]
+        self.screen_info = screen_info
 
     def _get_screen_info(self) -> Dict[str, Any]:
         """Erfasst Informationen über alle angeschlossenen Bildschirme"""
@@ -92,8 +340,24 @@ class AutomationEngine:
             "actions": [action.to_dict() for action in self.workflow]
         }
 
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        # Erst vollständig serialisieren, dann in einem Schreibvorgang speichern
+        # (json.dump schreibt jedes Token einzeln in die Datei)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        # In eine temporäre Datei schreiben und erst danach ersetzen, damit ein
+        # Absturz beim Speichern die bestehende Workflow-Datei nicht zerstört
+        temp_filename = filename + ".tmp"
+        try:
+            with open(temp_filename, 'wb', buffering=WORKFLOW_IO_BUFFER_SIZE) as f:
+                f.write(payload)
+            os.replace(temp_filename, filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
 
     def load_workflow(self, filename: str) -> int:
         """
@@ -102,8 +366,9 @@ class AutomationEngine:
         Returns:
             int: Anzahl der geladenen Aktionen
         """
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        with open(filename, 'rb', buffering=WORKFLOW_IO_BUFFER_SIZE) as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         # Lade Workflow-Einstellungen, falls vorhanden
         if "settings" in data:
@@ -127,15 +392,22 @@ class AutomationEngine:
             return
 
         self.is_playing = True
+        self._abort_event.clear()
+        abort_hotkey = self._register_abort_hotkey()
 
         try:
             # Ausführungsschleife
             while self.is_playing:
-                for i, action in enumerate(self.workflow):
+                # Handler und Bildschirmversatz jeder Aktion einmal pro Durchlauf auflösen;
+                # der Plan wird je Durchlauf neu erstellt, damit Änderungen am Workflow
+                # während einer Dauerausführung ab dem nächsten Durchlauf gelten
+                plan = [(action, self._compile_action(action)) for action in self.workflow]
+
+                for i, (action, step) in enumerate(plan):
                     if not self.is_playing:
                         break
 
-                    self._execute_action(action)
+                    self._execute_action(action, step)
 
                     if callback:
                         callback(i)
@@ -145,33 +417,59 @@ class AutomationEngine:
                         self.is_playing = False
                         break
 
+                    # Eine Pause pro Aktion (ersetzt die Pause von PyAutoGUI nach jedem Aufruf)
+                    if self.between_actions_delay > 0:
+                        self._abort_event.wait(self.between_actions_delay)
+
                 # Wenn Loop nicht aktiviert ist oder abgebrochen wurde, beenden
                 if not self.loop_enabled or not self.is_playing:
                     break
 
-                # Pause zwischen den Durchläufen
-                if self.loop_pause > 0:
-                    time.sleep(self.loop_pause)
-
-                    # Während der Pause noch einmal prüfen, ob abgebrochen wurde
-                    if self._check_abort_key():
-                        self.is_playing = False
-                        break
+                # Pause zwischen den Durchläufen (endet sofort, wenn abgebrochen wird)
+                if self.loop_pause > 0 and self._abort_event.wait(self.loop_pause):
+                    self.is_playing = False
+                    break
         except Exception as e:
             print(f"Fehler bei Workflow-Ausführung: {e}")
         finally:
             self.is_playing = False
+            self._unregister_abort_hotkey(abort_hotkey)
+            # Jede Ausführung läuft in einem neuen Thread; dessen Instanzen nicht anhäufen
+            self._release_thread_resources()
 
     def _check_abort_key(self) -> bool:
-        """Prüft, ob die Abbruchtaste gedrückt wurde"""
+        """Prüft, ob die Abbruchtaste gedrückt oder die Ausführung gestoppt wurde"""
+        return self._abort_event.is_set()
+
+    def _register_abort_hotkey(self):
+        """
+        Registriert die Abbruchtaste als globalen Hotkey, falls das Modul keyboard verfügbar ist
+
+        Returns:
+            Der registrierte Hotkey oder None
+        """
+        if keyboard is None:
+            return None
+        try:
+            return keyboard.add_hotkey(self.abort_key, self._abort_event.set)
+        except Exception as e:
+            # z. B. fehlende Berechtigungen für den Tastatur-Hook
+            print(f"Abbruchtaste konnte nicht registriert werden: {e}")
+            return None
+
+    def _unregister_abort_hotkey(self, hotkey):
+        """Entfernt einen mit _register_abort_hotkey registrierten Hotkey"""
+        if hotkey is None:
+            return
         try:
-            return pyautogui.isKeyDown(self.abort_key)
-        except:
-            return False
+            keyboard.remove_hotkey(hotkey)
+        except (KeyError, ValueError):
+            pass
 
     def stop_playback(self):
         """Stoppt die Ausführung des Workflows"""
         self.is_playing = False
+        self._abort_event.set()
 
     def _get_absolute_coordinates(self, x: int, y: int, screen_id: int = 0) -> Tuple[int, int]:
         """
@@ -185,124 +483,54 @@ class AutomationEngine:
         Returns:
             Tuple[int, int]: Absolute Bildschirmkoordinaten (x, y)
         """
-        screen_offset_x, screen_offset_y = 0, 0
+        screen_offset_x, screen_offset_y = self._screen_offset(screen_id)
+        return (screen_offset_x + x, screen_offset_y + y)
+
+    def _screen_offset(self, screen_id: int = 0) -> Tuple[int, int]:
+        """
+        Liefert den Versatz eines Bildschirms im virtuellen Desktop
 
-        if 0 <= screen_id < len(self.screen_info["screens"]):
-            screen = self.screen_info["screens"][screen_id]
-            screen_offset_x = screen["x"]
-            screen_offset_y = screen["y"]
+        Args:
+            screen_id: ID des Bildschirms
 
-        return (screen_offset_x + x, screen_offset_y + y)
+        Returns:
+            Tuple[int, int]: Position (x, y) der oberen linken Ecke, (0, 0) bei unbekannter ID
+        """
+        if 0 <= screen_id < len(self._screen_offsets):
+            return self._screen_offsets[screen_id]
+        return (0, 0)
 
-    def _execute_action(self, action: Action):
-        """Führt eine einzelne Aktion aus"""
+    def _compile_action(self, action: Action) -> Callable[[], None]:
+        """
+        Bindet eine Aktion an ihren Handler und den Versatz ihres Bildschirms
+
+        Args:
+            action: Die auszuführende Aktion
+
+        Returns:
+            Callable[[], None]: Funktion ohne Argumente, die die Aktion ausführt
+        """
+        handler = self._action_handlers.get(action.action_type)
+        if handler is None:
+            return _noop
+
+        # Versatz des Bildschirms der Aktion (Screen ID 0, falls nicht angegeben)
+        params = action.params
+        offset_x, offset_y = self._screen_offset(params.get("screen_id", 0))
+        return partial(handler, params, offset_x, offset_y)
+
+    def _execute_action(self, action: Action, step: Optional[Callable[[], None]] = None):
+        """
+        Führt eine einzelne Aktion aus
+
+        Args:
+            action: Die auszuführende Aktion
+            step: Optional. Bereits mit _compile_action gebundene Ausführung der Aktion
+        """
         try:
-            # Screen ID abrufen, falls vorhanden
-            screen_id = action.params.get("screen_id", 0)
-
-            if action.action_type == ActionType.MOUSE_MOVE:
-                # Absolute Position berechnen
-                abs_x, abs_y = self._get_absolute_coordinates(
-                    action.params["x"], action.params["y"], screen_id
-                )
-
-                pyautogui.moveTo(abs_x, abs_y, duration=action.params.get("duration", 0.1))
-
-            elif action.action_type == ActionType.MOUSE_CLICK:
-                # Absolute Position berechnen
-                abs_x, abs_y = self._get_absolute_coordinates(
-                    action.params["x"], action.params["y"], screen_id
-                )
-
-                pyautogui.click(abs_x, abs_y,
-                             button=action.params.get("button", "left"),
-                             duration=action.params.get("duration", 0.1))
-
-            elif action.action_type == ActionType.MOUSE_DOUBLE_CLICK:
-                # Absolute Position berechnen
-                abs_x, abs_y = self._get_absolute_coordinates(
-                    action.params["x"], action.params["y"], screen_id
-                )
-
-                pyautogui.doubleClick(abs_x, abs_y,
-                                   button=action.params.get("button", "left"),
-                                   duration=action.params.get("duration", 0.1))
-
-            elif action.action_type == ActionType.MOUSE_RIGHT_CLICK:
-                # Absolute Position berechnen
-                abs_x, abs_y = self._get_absolute_coordinates(
-                    action.params["x"], action.params["y"], screen_id
-                )
-
-                pyautogui.rightClick(abs_x, abs_y,
-                                  duration=action.params.get("duration", 0.1))
-
-            elif action.action_type == ActionType.MOUSE_DRAG:
-                # Absolute Positionen berechnen
-                abs_start_x, abs_start_y = self._get_absolute_coordinates(
-                    action.params.get("start_x", 0),
-                    action.params.get("start_y", 0),
-                    screen_id
-                )
-
-                abs_end_x, abs_end_y = self._get_absolute_coordinates(
-                    action.params["end_x"],
-                    action.params["end_y"],
-                    screen_id
-                )
-
-                # Erst zur Startposition bewegen, dann ziehen
-                pyautogui.moveTo(abs_start_x, abs_start_y,
-                              duration=action.params.get("duration", 0.1) / 2)
-
-                # Jetzt zur Endposition ziehen
-                pyautogui.dragTo(abs_end_x, abs_end_y,
-                              button=action.params.get("button", "left"),
-                              duration=action.params.get("duration", 0.5),
-                              mouseDownUp=True)
-
-            elif action.action_type == ActionType.KEY_PRESS:
-                pyautogui.press(action.params["key"])
-
-            elif action.action_type == ActionType.KEY_COMBO:
-                pyautogui.hotkey(*action.params["keys"])
-
-            elif action.action_type == ActionType.TEXT_WRITE:
-                pyautogui.write(action.params["text"], interval=action.params.get("interval", 0))
-
-            elif action.action_type == ActionType.WAIT:
-                time.sleep(action.params["seconds"])
-
-            elif action.action_type == ActionType.WAIT_FOR_COLOR:
-                # Absolute Position für den Farbvergleich berechnen
-                abs_x, abs_y = self._get_absolute_coordinates(
-                    action.params["x"], action.params["y"], screen_id
-                )
-
-                self._wait_for_color(
-                    abs_x,
-                    abs_y,
-                    action.params["color"],
-                    action.params.get("tolerance", 10),
-                    action.params.get("timeout", 10)
-                )
-
-            elif action.action_type == ActionType.WAIT_FOR_TEXT:
-                # Absolute Regionkoordinaten berechnen
-                region = action.params["region"]
-                if len(region) >= 4:
-                    abs_x, abs_y = self._get_absolute_coordinates(
-                        region[0], region[1], screen_id
-                    )
-                    abs_region = [abs_x, abs_y, region[2], region[3]]
-
-                    self._wait_for_text(
-                        abs_region,
-                        action.params["text"],
-                        action.params.get("timeout", 10)
-                    )
-                else:
-                    raise ValueError("Region muss 4 Werte enthalten: [x, y, width, height]")
+            if step is None:
+                step = self._compile_action(action)
+            step()
 
         except pyautogui.FailSafeException:
             # Spezieller Umgang mit dem PyAutoGUI-Failsafe
@@ -312,6 +540,69 @@ class AutomationEngine:
             print(f"Fehler bei Ausführung von Aktion {action.action_type}: {e}")
             raise
 
+    # Ausführung der einzelnen Aktionstypen (params, Bildschirmversatz x, Bildschirmversatz y)
+
+    def _do_mouse_move(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.moveTo(offset_x + params["x"], offset_y + params["y"],
+                         duration=params.get("duration", 0.1))
+
+    def _do_mouse_click(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.click(offset_x + params["x"], offset_y + params["y"],
+                        button=params.get("button", "left"),
+                        duration=params.get("duration", 0.1))
+
+    def _do_mouse_double_click(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.doubleClick(offset_x + params["x"], offset_y + params["y"],
+                              button=params.get("button", "left"),
+                              duration=params.get("duration", 0.1))
+
+    def _do_mouse_right_click(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.rightClick(offset_x + params["x"], offset_y + params["y"],
+                             duration=params.get("duration", 0.1))
+
+    def _do_mouse_drag(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        # Erst zur Startposition bewegen, dann ziehen
+        pyautogui.moveTo(offset_x + params.get("start_x", 0),
+                         offset_y + params.get("start_y", 0),
+                         duration=params.get("duration", 0.1) / 2)
+
+        # Jetzt zur Endposition ziehen
+        pyautogui.dragTo(offset_x + params["end_x"], offset_y + params["end_y"],
+                         button=params.get("button", "left"),
+                         duration=params.get("duration", 0.5),
+                         mouseDownUp=True)
+
+    def _do_key_press(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.press(params["key"])
+
+    def _do_key_combo(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.hotkey(*params["keys"])
+
+    def _do_text_write(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        pyautogui.write(params["text"], interval=params.get("interval", 0))
+
+    def _do_wait(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        # Wartet auf das Abbruch-Event, damit Stoppen nicht bis zum Ende der Wartezeit dauert
+        self._abort_event.wait(params["seconds"])
+
+    def _do_wait_for_color(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        self._wait_for_color(
+            offset_x + params["x"],
+            offset_y + params["y"],
+            params["color"],
+            params.get("tolerance", 10),
+            params.get("timeout", 10)
+        )
+
+    def _do_wait_for_text(self, params: Dict[str, Any], offset_x: int, offset_y: int):
+        region = params["region"]
+        if len(region) < 4:
+            raise ValueError("Region muss 4 Werte enthalten: [x, y, width, height]")
+
+        # Absolute Regionkoordinaten berechnen
+        abs_region = [offset_x + region[0], offset_y + region[1], region[2], region[3]]
+        self._wait_for_text(abs_region, params["text"], params.get("timeout", 10))
+
     def _wait_for_color(self, x: int, y: int, target_color: List[int],
                       tolerance: int = 10, timeout: int = 10) -> bool:
         """
@@ -325,24 +616,32 @@ class AutomationEngine:
             timeout: Maximale Wartezeit in Sekunden
 
         Returns:
-            bool: True wenn die Farbe gefunden wurde, False bei Timeout
+            bool: True wenn die Farbe gefunden wurde, False bei Timeout oder Abbruch
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        # Zielfarbe einmal entpacken statt bei jedem Vergleich zu zippen
+        target_r, target_g, target_b = target_color[:3]
+
+        # Kurz beginnen und nach jedem Fehlversuch länger warten, damit schnelle
+        # Änderungen sofort erkannt werden, ohne den Bildschirm dauerhaft abzufragen
+        interval = WAIT_POLL_MIN_INTERVAL
+
+        # Häufig genutzte Funktionen vor der Schleife lokal binden
+        now, wait_abort, get_pixel = time.monotonic, self._abort_event.wait, self._get_pixel_fast
+        deadline = now() + timeout
+        while now() < deadline:
+            poll_start = now()
             try:
-                img = ImageGrab.grab(bbox=(x, y, x+1, y+1))
-                pixel_color = img.getpixel((0, 0))
-
-                # Stelle sicher, dass wir mit RGB-Werten vergleichen
-                if len(pixel_color) > 3:  # RGBA Format
-                    pixel_color = pixel_color[0:3]  # Ignoriere Alpha-Kanal
+                r, g, b = get_pixel(x, y)
 
-                if all(abs(a-b) <= tolerance for a, b in zip(pixel_color, target_color)):
+                if max(abs(r - target_r), abs(g - target_g), abs(b - target_b)) <= tolerance:
                     return True
             except Exception as e:
                 print(f"Fehler bei Farbprüfung: {e}")
 
-            time.sleep(0.1)
+            # Die Dauer der Prüfung zählt zum Intervall; die Pause endet sofort, wenn gestoppt wird
+            if wait_abort(max(0.0, interval - (now() - poll_start))):
+                break
+            interval = min(interval * WAIT_POLL_BACKOFF, WAIT_POLL_MAX_INTERVAL)
 
         return False
 
@@ -356,30 +655,309 @@ class AutomationEngine:
             timeout: Maximale Wartezeit in Sekunden
 
         Returns:
-            bool: True wenn der Text gefunden wurde, False bei Timeout
+            bool: True wenn der Text gefunden wurde, False bei Timeout oder Abbruch
         """
         if len(region) != 4:
             raise ValueError("Region muss 4 Werte enthalten: [x, y, width, height]")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        interval = WAIT_POLL_MIN_INTERVAL
+        last_digest = None
+        region_x, region_y, region_width, region_height = region
+
+        # Häufig genutzte Funktionen vor der Schleife lokal binden
+        now, wait_abort, md5 = time.monotonic, self._abort_event.wait, hashlib.md5
+        grab, ocr_text = self._grab_region, self._ocr_text
+        deadline = now() + timeout
+        while now() < deadline:
+            poll_start = now()
             try:
-                # Region: [x, y, width, height]
-                img = ImageGrab.grab(bbox=(region[0], region[1],
-                                         region[0]+region[2],
-                                         region[1]+region[3]))
+                img = grab(region_x, region_y, region_width, region_height)
 
-                recognized_text = pytesseract.image_to_string(img)
+                # Texterkennung nur, wenn sich der Bereich seit der letzten Prüfung verändert hat
+                digest = md5(img.tobytes()).digest()
+                if digest != last_digest:
+                    last_digest = digest
+                    recognized_text = ocr_text(img, digest)
 
-                if text in recognized_text:
-                    return True
+                    if text in recognized_text:
+                        return True
             except Exception as e:
                 print(f"Fehler bei OCR: {e}")
 
-            time.sleep(0.5)
+            # Aufnahme und Texterkennung zählen zum Intervall; die Pause endet sofort, wenn gestoppt wird
+            if wait_abort(max(0.0, interval - (now() - poll_start))):
+                break
+            interval = min(interval * WAIT_POLL_BACKOFF, WAIT_POLL_MAX_INTERVAL)
 
         return False
 
+    def _grab_region(self, x: int, y: int, width: int, height: int) -> Image.Image:
+        """
+        Nimmt einen Bildschirmbereich an absoluten Koordinaten auf
+
+        Verwendet mss, falls installiert, sonst PIL.ImageGrab.
+
+        Args:
+            x: Absolute X-Koordinate der oberen linken Ecke
+            y: Absolute Y-Koordinate der oberen linken Ecke
+            width: Breite des Bereichs
+            height: Höhe des Bereichs
+
+        Returns:
+            Image.Image: Aufnahme des Bereichs im RGB-Format
+        """
+        if mss is None:
+            # all_screens wird für Koordinaten auf Zweitbildschirmen unter Windows benötigt
+            img = ImageGrab.grab(bbox=(x, y, x + width, y + height), all_screens=True)
+            # Einmal auf RGB bringen (macOS liefert RGBA), statt den Alphakanal bei jedem Aufrufer zu behandeln
+            return img if img.mode == "RGB" else img.convert("RGB")
+
+        shot = self._get_sct().grab({"left": x, "top": y, "width": width, "height": height})
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+    def _grab_region_array(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Nimmt einen Bildschirmbereich auf und liefert ihn als RGB-Array
+
+        Mit mss wird der Aufnahmepuffer direkt verwendet, ohne Umweg über ein PIL-Bild.
+
+        Args:
+            x: Absolute X-Koordinate der oberen linken Ecke
+            y: Absolute Y-Koordinate der oberen linken Ecke
+            width: Breite des Bereichs
+            height: Höhe des Bereichs
+
+        Returns:
+            np.ndarray: uint8-Array der Form (Höhe, Breite, 3)
+        """
+        if mss is None:
+            return np.asarray(self._grab_region(x, y, width, height))
+
+        # BGRA -> RGB (Ansicht, keine Kopie)
+        return self._grab_region_bgra(x, y, width, height)[:, :, 2::-1]
+
+    def _grab_region_bgra(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Nimmt einen Bildschirmbereich mit mss auf und liefert den rohen BGRA-Puffer
+
+        Args:
+            x: Absolute X-Koordinate der oberen linken Ecke
+            y: Absolute Y-Koordinate der oberen linken Ecke
+            width: Breite des Bereichs
+            height: Höhe des Bereichs
+
+        Returns:
+            np.ndarray: uint8-Array der Form (Höhe, Breite, 4)
+        """
+        shot = self._get_sct().grab({"left": x, "top": y, "width": width, "height": height})
+        return np.frombuffer(shot.bgra, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def _get_sct(self):
+        """Gibt die mss-Instanz des aktuellen Threads zurück (mss ist nicht threadsicher)"""
+        sct = getattr(self._capture_local, "sct", None)
+        if sct is None:
+            sct = self._capture_local.sct = mss.mss()
+            with self._capture_lock:
+                self._scts.append(sct)
+        return sct
+
+    def _get_tess_api(self):
+        """
+        Gibt die dauerhaft geladene Tesseract-Instanz des aktuellen Threads zurück
+        (nur mit tesserocr)
+
+        Die Instanz wird bei der ersten Texterkennung im Thread erstellt und behält
+        das Sprachmodell im Speicher, statt es bei jedem Aufruf neu zu laden.
+        """
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = self._tess_local.api = tesserocr.PyTessBaseAPI()
+            with self._tess_lock:
+                self._tess_apis.append(api)
+        return api
+
+    def _release_thread_resources(self):
+        """
+        Gibt die mss- und Tesseract-Instanz des aktuellen Threads frei
+
+        Für Threads, die nach ihrer Arbeit enden (z. B. ein WorkflowThread pro
+        Ausführung); die Instanzen der Pool-Threads bleiben bis close() bestehen.
+        """
+        sct = getattr(self._capture_local, "sct", None)
+        if sct is not None:
+            del self._capture_local.sct
+            with self._capture_lock:
+                self._scts.remove(sct)
+            sct.close()
+
+        api = getattr(self._tess_local, "api", None)
+        if api is not None:
+            del self._tess_local.api
+            with self._tess_lock:
+                self._tess_apis.remove(api)
+            api.End()
+
+    def _ocr_cached(self, kind: str, img: Image.Image, recognize: Callable[[Image.Image], Any],
+                    digest: Optional[bytes] = None):
+        """
+        Führt eine Texterkennung aus oder liefert das Ergebnis für ein identisches Bild aus dem Cache
+
+        Args:
+            kind: Art der Erkennung (Teil des Cache-Schlüssels)
+            img: Das zu erkennende Bild
+            recognize: Funktion, die die eigentliche Erkennung ausführt
+            digest: Optional. Bereits berechneter MD5-Digest von img.tobytes()
+
+        Returns:
+            Das (ggf. gecachte) Ergebnis von recognize
+        """
+        if digest is None:
+            digest = hashlib.md5(img.tobytes()).digest()
+        key = (kind, img.mode, img.size, digest)
+        with self._ocr_cache_lock:
+            if key in self._ocr_cache:
+                self._ocr_cache.move_to_end(key)
+                return self._ocr_cache[key]
+
+        result = recognize(img)
+
+        with self._ocr_cache_lock:
+            self._ocr_cache[key] = result
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return result
+
+    def _ocr_text(self, img: Image.Image, digest: Optional[bytes] = None) -> str:
+        """Erkennt den Text in einem Bild (aufbereitet und gecacht, digest siehe _ocr_cached)"""
+        return self._ocr_cached("text", img, self._recognize_text_preprocessed, digest)
+
+    def _ocr_data(self, img: Image.Image) -> Dict[str, List[Any]]:
+        """Erkennt die Wörter in einem Bild (aufbereitet und gecacht)"""
+        return self._ocr_cached("data", img, self._recognize_data_preprocessed)
+
+    def _recognize_text_preprocessed(self, img: Image.Image) -> str:
+        """Bereitet das Bild auf und erkennt den Text"""
+        prepared, _ = _preprocess_for_ocr(img)
+        return self._recognize_text(prepared)
+
+    def _recognize_data_preprocessed(self, img: Image.Image) -> Dict[str, List[Any]]:
+        """Bereitet das Bild auf, erkennt die Wörter und rechnet die Positionen zurück"""
+        prepared, scale = _preprocess_for_ocr(img)
+        data = self._recognize_data(prepared)
+        if scale > 1:
+            for column in ("left", "top", "width", "height"):
+                data[column] = [value // scale for value in data[column]]
+        return data
+
+    def _recognize_text(self, img: Image.Image) -> str:
+        """
+        Erkennt den Text in einem Bild
+
+        Args:
+            img: Das zu erkennende Bild
+
+        Returns:
+            str: Erkannter Text
+        """
+        if tesserocr is None:
+            return pytesseract.image_to_string(img)
+
+        api = self._get_tess_api()
+        self._set_tess_image(api, img)
+        return api.GetUTF8Text()
+
+    @staticmethod
+    def _set_tess_image(api, img: Image.Image):
+        """
+        Übergibt ein Bild an eine tesserocr-Instanz
+
+        Graustufenbilder (wie von _preprocess_for_ocr geliefert) werden als rohe
+        8-Bit-Pixel übergeben; SetImage würde sie erst als Bitmap kodieren.
+
+        Args:
+            api: Die tesserocr-Instanz
+            img: Das zu erkennende Bild
+        """
+        if img.mode == "L":
+            api.SetImageBytes(img.tobytes(), img.width, img.height, 1, img.width)
+        else:
+            api.SetImage(img)
+
+    def _recognize_data(self, img: Image.Image) -> Dict[str, List[Any]]:
+        """
+        Erkennt die Wörter in einem Bild samt Position und Konfidenz
+
+        Args:
+            img: Das zu erkennende Bild
+
+        Returns:
+            Dict[str, List[Any]]: Spalten wie bei pytesseract.image_to_data
+                                  (text, conf, left, top, width, height,
+                                  block_num, par_num, line_num)
+        """
+        if tesserocr is None:
+            return pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+
+        data = {"text": [], "conf": [], "left": [], "top": [], "width": [], "height": [],
+                "block_num": [], "par_num": [], "line_num": []}
+        line_num = 0
+        api = self._get_tess_api()
+        self._set_tess_image(api, img)
+        api.Recognize()
+
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(api.GetIterator(), level):
+            box = word.BoundingBox(level)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line_num += 1
+            data["block_num"].append(0)
+            data["par_num"].append(0)
+            data["line_num"].append(line_num)
+            data["text"].append(word.GetUTF8Text(level))
+            data["conf"].append(word.Confidence(level))
+            data["left"].append(x1)
+            data["top"].append(y1)
+            data["width"].append(x2 - x1)
+            data["height"].append(y2 - y1)
+        return data
+
+    def _get_ocr_pool(self) -> ThreadPoolExecutor:
+        """
+        Gibt den Thread-Pool für die Texterkennung zurück
+
+        Der Pool hat eine feste Größe (ein Thread pro Kern) und wird nie ersetzt,
+        damit keine Tesseract- und mss-Instanzen ausgedienter Threads zurückbleiben.
+        Weniger Aufträge belegen einfach weniger Threads.
+
+        Returns:
+            ThreadPoolExecutor: Der Pool
+        """
+        if self._ocr_pool is None:
+            self._ocr_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                thread_name_prefix="ocr")
+        return self._ocr_pool
+
+    def close(self):
+        """Beendet den OCR-Thread-Pool und gibt die Tesseract- und mss-Instanzen frei"""
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=True, cancel_futures=True)
+            self._ocr_pool = None
+
+        with self._tess_lock:
+            for api in self._tess_apis:
+                api.End()
+            self._tess_apis = []
+        self._tess_local = threading.local()
+
+        with self._capture_lock:
+            for sct in self._scts:
+                sct.close()
+            self._scts = []
+        self._capture_local = threading.local()
+
     def get_pixel_color(self, x: int, y: int, screen_id: int = 0) -> Tuple[int, int, int]:
         """
         Gibt die Farbe des Pixels an Position (x,y) zurück
@@ -394,15 +972,39 @@ class AutomationEngine:
         """
         # Absolute Koordinaten berechnen
         abs_x, abs_y = self._get_absolute_coordinates(x, y, screen_id)
+        return self._get_pixel_fast(abs_x, abs_y)
 
-        # Screenshot des Pixels machen
-        img = ImageGrab.grab(bbox=(abs_x, abs_y, abs_x+1, abs_y+1))
-        color = img.getpixel((0, 0))
+    def _get_pixel_fast(self, x: int, y: int) -> Tuple[int, int, int]:
+        """
+        Liest die Farbe eines einzelnen Pixels an absoluten Koordinaten
 
-        # Stelle sicher, dass wir RGB zurückgeben
-        if len(color) > 3:  # RGBA Format
-            return color[0:3]  # Ignoriere Alpha-Kanal
-        return color
+        Unter Windows wird der Pixel direkt über GetPixel gelesen, sonst
+        (oder wenn GetPixel fehlschlägt) über einen 1x1-Screenshot.
+
+        Args:
+            x: Absolute X-Koordinate
+            y: Absolute Y-Koordinate
+
+        Returns:
+            Tuple[int, int, int]: RGB-Werte des Pixels
+        """
+        if _gdi32 is not None:
+            hdc = _user32.GetDC(0)
+            try:
+                colorref = _gdi32.GetPixel(hdc, x, y)
+            finally:
+                _user32.ReleaseDC(0, hdc)
+
+            if colorref != 0xFFFFFFFF:  # CLR_INVALID
+                # COLORREF ist 0x00BBGGRR
+                return (colorref & 0xFF, (colorref >> 8) & 0xFF, (colorref >> 16) & 0xFF)
+
+        if mss is not None:
+            # Pixel direkt aus dem Aufnahmepuffer lesen
+            return self._get_sct().grab({"left": x, "top": y, "width": 1, "height": 1}).pixel(0, 0)
+
+        # Screenshot des Pixels machen (_grab_region liefert immer RGB)
+        return self._grab_region(x, y, 1, 1).getpixel((0, 0))
 
     def find_color_on_screen(self, target_color: List[int], screen_id: int = None,
                            tolerance: int = 10) -> Optional[Tuple[int, int]]:
@@ -434,33 +1036,16 @@ class AutomationEngine:
                 screen_width, screen_height = screen["width"], screen["height"]
 
                 # Region des Bildschirms erfassen
-                screen_shot = ImageGrab.grab(bbox=(
-                    screen_x, screen_y,
-                    screen_x + screen_width,
-                    screen_y + screen_height
-                ))
-
-                # Bildschirm nach der Farbe durchsuchen
-                for x in range(0, screen_width, 5):  # Für bessere Performance in 5er-Schritten
-                    for y in range(0, screen_height, 5):
-                        pixel_color = screen_shot.getpixel((x, y))
-
-                        # Stelle sicher, dass wir mit RGB-Werten vergleichen
-                        if len(pixel_color) > 3:  # RGBA Format
-                            pixel_color = pixel_color[0:3]  # Ignoriere Alpha-Kanal
-
-                        if all(abs(a-b) <= tolerance for a, b in zip(pixel_color, target_color)):
-                            # Fine-tuning: Jetzt genau den Pixel finden
-                            for dx in range(-5, 6):
-                                for dy in range(-5, 6):
-                                    nx, ny = x + dx, y + dy
-                                    if 0 <= nx < screen_width and 0 <= ny < screen_height:
-                                        pixel_color = screen_shot.getpixel((nx, ny))
-                                        if len(pixel_color) > 3:
-                                            pixel_color = pixel_color[0:3]
-                                        if all(abs(a-b) <= tolerance for a, b in zip(pixel_color, target_color)):
-                                            # Relative Koordinaten auf dem Bildschirm zurückgeben
-                                            return (nx, ny)
+                if tolerance <= 0 and mss is not None:
+                    # Exakte Farbe: ganze Pixel im BGRA-Puffer vergleichen
+                    bgra = self._grab_region_bgra(screen_x, screen_y, screen_width, screen_height)
+                    match = _find_exact_color_bgra(bgra, target_color)
+                else:
+                    pixels = self._grab_region_array(screen_x, screen_y, screen_width, screen_height)
+                    match = _find_first_color(pixels, target_color, tolerance)
+                if match is not None:
+                    # Relative Koordinaten auf dem Bildschirm zurückgeben
+                    return match
 
         except Exception as e:
             print(f"Fehler bei Farbsuche: {e}")
@@ -486,8 +1071,61 @@ class AutomationEngine:
         width, height = region[2], region[3]
 
         # Region: [x, y, width, height]
-        img = ImageGrab.grab(bbox=(abs_x, abs_y, abs_x + width, abs_y + height))
-        return pytesseract.image_to_string(img)
+        img = self._grab_region(abs_x, abs_y, width, height)
+        return self._ocr_text(img)
+
+    def _screen_tiles(self, screen: Dict[str, Any]) -> List[Tuple[Dict[str, Any], int, int]]:
+        """
+        Teilt einen Bildschirm für die Textsuche in waagerechte Streifen
+
+        Bildschirme bis OCR_TILE_MAX_PIXELS bleiben ein einziger Streifen. Größere werden so
+        geteilt, dass sich benachbarte Streifen um OCR_TILE_OVERLAP Pixel überlappen.
+
+        Args:
+            screen: Bildschirminformationen aus screen_info
+
+        Returns:
+            List[Tuple[Dict[str, Any], int, int]]: (screen, top, height) je Streifen
+        """
+        width, height = screen["width"], screen["height"]
+        count = max(1, -(-width * height // OCR_TILE_MAX_PIXELS))  # aufrunden
+        if count == 1:
+            return [(screen, 0, height)]
+
+        band_height = -(-height // count)
+        return [(screen, top, min(band_height + OCR_TILE_OVERLAP, height - top))
+                for top in range(0, height, band_height)]
+
+    def _find_text_in_screen(self, screen: Dict[str, Any], text: str,
+                             confidence_threshold: float, top: int = 0,
+                             height: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Sucht einen Text auf einem einzelnen Bildschirm (oder einem Streifen davon)
+
+        Args:
+            screen: Bildschirminformationen aus screen_info
+            text: Der zu suchende Text
+            confidence_threshold: Minimale Konfidenz eines Wortes in Prozent
+            top: Oberkante des Streifens relativ zum Bildschirm
+            height: Höhe des Streifens, None für den restlichen Bildschirm
+
+        Returns:
+            Optional[List[int]]: [rel_x, rel_y, width, height, screen_id] oder None
+        """
+        if height is None:
+            height = screen["height"] - top
+
+        # Bereich einmal erfassen und einmal erkennen
+        screen_shot = self._grab_region(screen["x"], screen["y"] + top, screen["width"], height)
+        data = self._ocr_data(screen_shot)
+
+        box = _find_text_box(data, text, confidence_threshold)
+        if box is None:
+            return None
+
+        # Gefundene Position zurückgeben, relativ zum Bildschirm
+        box[1] += top
+        return box + [screen["id"]]
 
     def find_text_on_screen(self, text: str, screen_id: int = None,
                           min_confidence: float = 0.7) -> Optional[List[int]]:
@@ -500,8 +1138,8 @@ class AutomationEngine:
             min_confidence: Minimale Konfidenz für die Texterkennung (0-1)
 
         Returns:
-            Optional[List[int]]: [rel_x, rel_y, width, height] der gefundenen Region
-                                relativ zum Bildschirm, oder None
+            Optional[List[int]]: [rel_x, rel_y, width, height, screen_id] der gefundenen
+                                Region relativ zum Bildschirm, oder None
         """
         try:
             # Bestimme die zu durchsuchenden Bildschirme
@@ -513,50 +1151,31 @@ class AutomationEngine:
                 # Alle Bildschirme durchsuchen
                 screens_to_search = self.screen_info["screens"]
 
-            for screen in screens_to_search:
-                current_screen_id = screen["id"]
-                screen_x, screen_y = screen["x"], screen["y"]
-                screen_width, screen_height = screen["width"], screen["height"]
+            confidence_threshold = min_confidence * 100  # Umrechnung in Prozent
 
-                # Bildschirm in Regionen mit adaptiver Größe unterteilen
-                max_regions = 9  # 3x3 Grid
-                region_width = screen_width // int(max_regions ** 0.5)
-                region_height = screen_height // int(max_regions ** 0.5)
-
-                for x in range(0, screen_width, region_width):
-                    for y in range(0, screen_height, region_height):
-                        actual_width = min(region_width, screen_width - x)
-                        actual_height = min(region_height, screen_height - y)
-
-                        # Absoluten Bildschirmbereich erfassen
-                        abs_x = screen_x + x
-                        abs_y = screen_y + y
-
-                        region_img = ImageGrab.grab(bbox=(
-                            abs_x, abs_y,
-                            abs_x + actual_width,
-                            abs_y + actual_height
-                        ))
-
-                        recognized_text = pytesseract.image_to_string(region_img)
-
-                        if text.lower() in recognized_text.lower():
-                            # Verbesserte Erkennung mit OCR-spezifischen Optionen
-                            data = pytesseract.image_to_data(region_img, output_type=pytesseract.Output.DICT)
-                            confidence_threshold = min_confidence * 100  # Umrechnung in Prozent
-
-                            # Suche nach dem erkannten Text
-                            for i, word in enumerate(data['text']):
-                                if word and text.lower() in word.lower() and float(data['conf'][i]) >= confidence_threshold:
-                                    # Gefundene Position zurückgeben, relativ zum Bildschirm
-                                    word_x = x + data['left'][i]
-                                    word_y = y + data['top'][i]
-                                    word_w = data['width'][i]
-                                    word_h = data['height'][i]
-                                    return [word_x, word_y, word_w, word_h, current_screen_id]
-
-                            # Wenn keine genauere Position gefunden wurde, gib die Region zurück
-                            return [x, y, actual_width, actual_height, current_screen_id]
+            tiles = [tile for screen in screens_to_search for tile in self._screen_tiles(screen)]
+            if len(tiles) == 1:
+                return self._find_text_in_screen(tiles[0][0], text, confidence_threshold)
+
+            # Bildschirme bzw. Streifen parallel erkennen (Tesseract läuft außerhalb
+            # des GIL) und den ersten Treffer in Bildschirmreihenfolge verwenden
+            pool = self._get_ocr_pool()
+            futures = [
+                pool.submit(self._find_text_in_screen, screen, text, confidence_threshold,
+                            top, height)
+                for screen, top, height in tiles
+            ]
+            try:
+                # In Reihenfolge der Aufträge auswerten, nicht nach Fertigstellung,
+                # damit bei mehreren Treffern immer derselbe gewinnt
+                for future in futures:
+                    result = future.result()
+                    if result is not None:
+                        return result
+            finally:
+                # Noch nicht gestartete Suchen verwerfen
+                for future in futures:
+                    future.cancel()
 
         except Exception as e:
             print(f"Fehler bei Textsuche: {e}")
@@ -8,8 +8,9 @@ mit der Maus für die Farberkennungsfunktion des Desktop-Automatisierungstools.
 import sys
 from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt, QPoint, QTimer
-from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QImage, QFont
-from PIL import ImageGrab
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QCursor, QPixmap
+
+from constants import MAGNIFIER_INTERVAL, MAGNIFIER_IDLE_INTERVAL, MAGNIFIER_IDLE_TICKS
 
 
 class ColorPicker(QWidget):
@@ -24,8 +25,8 @@ class ColorPicker(QWidget):
         super().__init__()
         
         # Bildschirmgeometrie ermitteln
-        self.screen = QApplication.primaryScreen()
-        self.screen_geometry = self.screen.geometry()
+        self._capture_screen = QApplication.primaryScreen()
+        self.screen_geometry = self._capture_screen.geometry()
         
         # Widget für die Farbauswahl einrichten
         self.setWindowTitle("Farbe auswählen")
@@ -60,64 +61,122 @@ class ColorPicker(QWidget):
         self.magnifier.setFixedSize(self.magnifier_size, self.magnifier_size)
         self.magnifier.setStyleSheet(f"border: 2px solid {ACCENT_COLOR}; border-radius: 75px;")
         layout.addWidget(self.magnifier)
+        self._overlay = self._create_overlay()
+        
+        # Feste Maße für die Aktualisierung der Lupe vorab berechnen
+        self._capture_size = self.zoom_factor * self.magnifier_size
+        self._screen_width = self.screen_geometry.width()
+        self._screen_height = self.screen_geometry.height()
         
         # Mausposition und aktuell ausgewählte Farbe
         self.mouse_pos = QPoint(0, 0)
         self.current_color = None
+        self._idle_ticks = 0  # Timer-Aufrufe ohne Mausbewegung
         
         # Callback-Funktion speichern
         self.callback = callback
         
         # Timer für regelmäßiges Update
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_magnifier)
-        self.update_timer.start(50)  # Alle 50ms aktualisieren
+        self.update_timer.timeout.connect(self._on_timer)
+        self.update_timer.start(MAGNIFIER_INTERVAL)
         
         # Maus verfolgen
         self.setMouseTracking(True)
         self.setCursor(Qt.CursorShape.CrossCursor)
         
+    def _create_overlay(self) -> QPixmap:
+        """
+        Zeichnet das Fadenkreuz der Lupe einmalig auf einen transparenten Hintergrund
+
+        Returns:
+            QPixmap: Overlay in der Größe der Lupe
+        """
+        overlay = QPixmap(self.magnifier_size, self.magnifier_size)
+        overlay.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(overlay)
+        pen = QPen(QColor(255, 255, 255))
+        pen.setWidth(1)
+        painter.setPen(pen)
+
+        # Horizontale Linie
+        painter.drawLine(0, self.magnifier_size // 2, self.magnifier_size, self.magnifier_size // 2)
+
+        # Vertikale Linie
+        painter.drawLine(self.magnifier_size // 2, 0, self.magnifier_size // 2, self.magnifier_size)
+
+        # Zentralen Punkt markieren
+        pen.setColor(QColor(0, 0, 0))
+        painter.setPen(pen)
+        painter.drawEllipse(
+            self.magnifier_size // 2 - 2,
+            self.magnifier_size // 2 - 2,
+            4, 4
+        )
+
+        painter.end()
+        return overlay
+
+    def _on_timer(self):
+        """
+        Aktualisiert die Lupe, sobald sich die Maus bewegt hat
+
+        Ruht die Maus für MAGNIFIER_IDLE_TICKS Aufrufe, wird der Timer auf
+        MAGNIFIER_IDLE_INTERVAL verlangsamt; die Lupe wird dann nur noch in diesem
+        Abstand aufgefrischt, damit Änderungen des Bildschirminhalts sichtbar bleiben.
+        """
+        if QCursor.pos() != self.mouse_pos:
+            self._idle_ticks = 0
+            self.update_timer.setInterval(MAGNIFIER_INTERVAL)
+            self.update_magnifier()
+            return
+
+        self._idle_ticks += 1
+        if self._idle_ticks >= MAGNIFIER_IDLE_TICKS:
+            self.update_timer.setInterval(MAGNIFIER_IDLE_INTERVAL)
+            self.update_magnifier()
+
     def update_magnifier(self):
         """Aktualisiert die Lupe mit dem Bildschirminhalt unter dem Mauszeiger"""
         # Aktuelle Mausposition abrufen
-        self.mouse_pos = QApplication.primaryScreen().cursor().pos()
+        self.mouse_pos = QCursor.pos()
+        
+        mouse_x, mouse_y = self.mouse_pos.x(), self.mouse_pos.y()
         
         # Fensterposition aktualisieren, um dem Mauszeiger zu folgen
-        window_pos = QPoint(
-            self.mouse_pos.x() + 20,
-            self.mouse_pos.y() + 20
-        )
+        window_pos = QPoint(mouse_x + 20, mouse_y + 20)
         
         # Sicherstellen, dass das Fenster innerhalb des Bildschirms bleibt
-        if window_pos.x() + self.width() > self.screen_geometry.width():
-            window_pos.setX(self.mouse_pos.x() - 20 - self.width())
-        if window_pos.y() + self.height() > self.screen_geometry.height():
-            window_pos.setY(self.mouse_pos.y() - 20 - self.height())
+        if window_pos.x() + self.width() > self._screen_width:
+            window_pos.setX(mouse_x - 20 - self.width())
+        if window_pos.y() + self.height() > self._screen_height:
+            window_pos.setY(mouse_y - 20 - self.height())
             
         self.move(window_pos)
         
         # Screenshot des Bereichs unter dem Mauszeiger
-        x = self.mouse_pos.x() - self.zoom_factor * self.magnifier_size // 2
-        y = self.mouse_pos.y() - self.zoom_factor * self.magnifier_size // 2
-        width = self.zoom_factor * self.magnifier_size
-        height = self.zoom_factor * self.magnifier_size
+        width = height = self._capture_size
+        x = mouse_x - width // 2
+        y = mouse_y - height // 2
         
         # Bildschirmkoordinaten korrigieren
-        x = max(0, min(x, self.screen_geometry.width() - width))
-        y = max(0, min(y, self.screen_geometry.height() - height))
+        x = max(0, min(x, self._screen_width - width))
+        y = max(0, min(y, self._screen_height - height))
         
-        # Screenshot mit PIL machen
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+        # Screenshot des Bereichs direkt als QPixmap (ohne Umweg über PIL)
+        screenshot = self._capture_screen.grabWindow(0, x, y, width, height)
         
         # Farbe des Pixels unter dem Mauszeiger ermitteln
-        pixel_x = self.mouse_pos.x() - x
-        pixel_y = self.mouse_pos.y() - y
+        pixel_x = mouse_x - x
+        pixel_y = mouse_y - y
         
         if 0 <= pixel_x < width and 0 <= pixel_y < height:
-            self.current_color = screenshot.getpixel((pixel_x, pixel_y))
-            
-            if len(self.current_color) > 3:  # Bei RGBA-Format das Alpha entfernen
-                self.current_color = self.current_color[:3]
+            # Nur den einen Pixel in ein QImage umwandeln (Aufnahme ist in Gerätepixeln)
+            ratio = screenshot.devicePixelRatio()
+            pixel_image = screenshot.copy(int(pixel_x * ratio), int(pixel_y * ratio), 1, 1).toImage()
+            pixel = pixel_image.pixelColor(0, 0)
+            self.current_color = (pixel.red(), pixel.green(), pixel.blue())
                 
             r, g, b = self.current_color
             hex_color = f"#{r:02x}{g:02x}{b:02x}"
@@ -132,38 +191,27 @@ class ColorPicker(QWidget):
                 border-radius: 75px;
             """)
         
-        # Screenshot in QImage konvertieren und anzeigen
-        screenshot = screenshot.resize((self.magnifier_size, self.magnifier_size))
-        qim = screenshot.tobytes("raw", "RGB")
-        qimg = QImage(qim, screenshot.width, screenshot.height, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
-        
-        # Overlay mit Fadenkreuz zeichnen
-        painter = QPainter(pixmap)
-        pen = QPen(QColor(255, 255, 255))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        
-        # Horizontale Linie
-        painter.drawLine(0, self.magnifier_size // 2, self.magnifier_size, self.magnifier_size // 2)
-        
-        # Vertikale Linie
-        painter.drawLine(self.magnifier_size // 2, 0, self.magnifier_size // 2, self.magnifier_size)
-        
-        # Zentralen Punkt markieren
-        pen.setColor(QColor(0, 0, 0))
-        painter.setPen(pen)
-        painter.drawEllipse(
-            self.magnifier_size // 2 - 2,
-            self.magnifier_size // 2 - 2,
-            4, 4
+        # Screenshot auf die Größe der Lupe skalieren
+        pixmap = screenshot.scaled(
+            self.magnifier_size, self.magnifier_size,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation
         )
+        pixmap.setDevicePixelRatio(1.0)
         
+        # Vorab gezeichnetes Fadenkreuz einblenden
+        painter = QPainter(pixmap)
+        painter.drawPixmap(0, 0, self._overlay)
         painter.end()
         
         # Aktualisierte Lupe anzeigen
         self.magnifier.setPixmap(pixmap)
         
+    def closeEvent(self, event):
+        """Beendet die Aktualisierung"""
+        self.update_timer.stop()
+        super().closeEvent(event)
+        
     def mousePressEvent(self, event):
         """Wählt die Farbe unter dem Mauszeiger aus"""
         if event.button() == Qt.MouseButton.LeftButton and self.current_color:
@@ -21,6 +21,16 @@ DEFAULT_DURATION = 0.1      # Standarddauer für Mausbewegungen in Sekunden
 DEFAULT_WAIT_TIME = 1.0     # Standardwartezeit in Sekunden
 DEFAULT_TIMEOUT = 10.0      # Standard-Timeout in Sekunden
 DEFAULT_COLOR_TOLERANCE = 10  # Standardtoleranz für Farbvergleiche
+COLOR_SEARCH_BAND_ROWS = 64   # Bildzeilen, die bei der Farbsuche auf einmal verglichen werden
+OCR_CACHE_SIZE = 32         # Maximal gecachte OCR-Ergebnisse (pro Bildinhalt)
+OCR_UPSCALE_FACTOR = 2      # Vergrößerung kleiner Regionen vor der Texterkennung
+OCR_UPSCALE_MAX_HEIGHT = 300  # Regionen ab dieser Höhe (px) werden nicht vergrößert
+OCR_TILE_MAX_PIXELS = 1920 * 1080  # Größere Bildschirme werden für die Textsuche in Streifen geteilt
+OCR_TILE_OVERLAP = 64       # Überlappung der Streifen (px), damit keine Textzeile zerschnitten wird
+WAIT_POLL_MIN_INTERVAL = 0.01  # Erstes Prüfintervall beim Warten auf Farbe/Text (s)
+WAIT_POLL_MAX_INTERVAL = 0.2   # Maximales Prüfintervall beim Warten auf Farbe/Text (s)
+WAIT_POLL_BACKOFF = 1.5        # Faktor, um den das Prüfintervall nach jedem Fehlversuch wächst
+WORKFLOW_IO_BUFFER_SIZE = 64 * 1024  # Puffergröße beim Lesen/Schreiben von Workflow-Dateien (Bytes)
 
 # UI-Einstellungen
 MIN_WINDOW_WIDTH = 900
@@ -29,7 +39,16 @@ ACTION_ICON_SIZE = 16
 TOOLBAR_ICON_SIZE = 24
 BUTTON_MIN_WIDTH = 80
 STATUSBAR_TIMEOUT = 3000  # ms
+PLAYBACK_PROGRESS_INTERVAL = 33  # ms, maximale Aktualisierungsrate der Fortschrittsanzeige (~30 Hz)
+SETTINGS_SAVE_DELAY = 500  # ms, Verzögerung, mit der geänderte Einstellungen gesammelt gespeichert werden
 DEFAULT_BETWEEN_ACTIONS_DELAY = 100  # ms
+MAX_CACHED_EDITOR_FORMS = 4  # Maximal gecachte Parameter-Formulare im Aktionseditor
+MOUSE_TRACKING_INTERVAL = 50  # ms
+MAGNIFIER_INTERVAL = 16  # ms, Prüfintervall der Farbauswahl-Lupe bei bewegter Maus (~60 Hz)
+MAGNIFIER_IDLE_INTERVAL = 200  # ms, Prüf- und Aktualisierungsintervall der Lupe bei ruhender Maus
+MAGNIFIER_IDLE_TICKS = 5  # Aufrufe ohne Bewegung, bis die Lupe auf das langsame Intervall wechselt
+RECORDING_MERGE_TOLERANCE = 3  # px, Abweichung, bis zu der aufgezeichnete Mausbewegungen zusammengefasst werden
+MIN_REGION_SIZE = 5  # px, Breite und Höhe einer Bildschirmregion müssen größer sein
 
 # Dateipfade
 HOME_DIR = ""  # Wird zur Laufzeit gesetzt
@@ -49,3 +68,5 @@ SHORTCUT_DELETE_ACTION = "Delete"
 SHORTCUT_DUPLICATE_ACTION = "Ctrl+D"
 SHORTCUT_MOVE_UP = "Ctrl+Up"
 SHORTCUT_MOVE_DOWN = "Ctrl+Down"
+SHORTCUT_UNDO = "Ctrl+Z"
+SHORTCUT_REDO = "Ctrl+Shift+Z"
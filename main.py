@@ -12,7 +12,7 @@ import sys
 
 import pyautogui
 import pytesseract
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QAction, QColor, QPalette, QShortcut, QKeySequence
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                              QFileDialog, QMessageBox,
@@ -21,13 +21,82 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVB
 from automation_engine import AutomationEngine
 from constants import *
 # Eigene Module
-from models import Action
+from models import Action, ActionType
 from threads import WorkflowThread, RecordingThread
 from utils import (load_settings, save_settings, get_default_tesseract_path,
                  init_config_directories, update_last_directory, get_last_directory,
                  get_workflows_directory)
 from workflow_tab import WorkflowTab
 
+# Stylesheet der Anwendung, hängt nur von den Farbkonstanten ab
+_STYLESHEET = f"""
+            QMainWindow, QDialog, QWidget, QTabWidget::pane, QTabBar::tab {{
+                background-color: {PRIMARY_COLOR};
+                color: {TEXT_COLOR};
+            }}
+
+            QTabBar::tab:selected {{
+                background-color: {ACCENT_COLOR};
+            }}
+
+            QPushButton {{
+                background-color: {ACCENT_COLOR};
+                color: {TEXT_COLOR};
+                border: none;
+                border-radius: 4px;
+                padding: 8px 16px;
+                font-weight: bold;
+                min-width: {BUTTON_MIN_WIDTH}px;
+            }}
+
+            QPushButton:hover {{
+                background-color: {ACCENT_COLOR}BB;
+            }}
+
+            QPushButton:pressed {{
+                background-color: {ACCENT_COLOR}99;
+            }}
+
+            QPushButton:disabled {{
+                background-color: {SECONDARY_BG};
+                color: {TEXT_COLOR}99;
+            }}
+
+            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
+                background-color: {SECONDARY_BG};
+                color: {TEXT_COLOR};
+                border: 1px solid {ACCENT_COLOR};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+
+            QListView {{
+                background-color: {SECONDARY_BG};
+                color: {TEXT_COLOR};
+                border: 1px solid {ACCENT_COLOR};
+                border-radius: 4px;
+            }}
+
+            QScrollBar {{
+                background-color: {SECONDARY_BG};
+            }}
+
+            QLabel {{
+                color: {TEXT_COLOR};
+            }}
+
+            QToolBar {{
+                background-color: {PRIMARY_COLOR};
+                spacing: 5px;
+                border: none;
+            }}
+
+            QStatusBar {{
+                background-color: {SECONDARY_BG};
+                color: {TEXT_COLOR};
+            }}
+        """
+
 
 class MainWindow(QMainWindow):
 	"""Hauptfenster der Anwendung"""
@@ -40,16 +109,26 @@ class MainWindow(QMainWindow):
 
 		# Grundlegende Einstellungen
 		pyautogui.FAILSAFE = True  # Sicherheitsfunktion: Maus in die Ecke bewegen stoppt Programm
+		pyautogui.PAUSE = 0  # Keine Pause nach jedem PyAutoGUI-Aufruf, die Engine pausiert einmal pro Aktion
 		self.settings = load_settings()
 		pytesseract.pytesseract.tesseract_cmd = self.settings.get("tesseract_path",
 		                                                          get_default_tesseract_path())
 
 		# Automatisierungs-Engine initialisieren
 		self.engine = AutomationEngine()
+		self.engine.between_actions_delay = self.settings.get("between_actions_delay",
+		                                                      DEFAULT_BETWEEN_ACTIONS_DELAY) / 1000
 
 		# Threads für Aufzeichnung und Ausführung
 		self.workflow_thread = None
 		self.recording_thread = None
+		self._recording_start_index = 0  # Erste Aktion der laufenden Aufnahme
+
+		# Geänderte Einstellungen verzögert speichern (mehrere Änderungen ergeben einen Schreibvorgang)
+		self._settings_timer = QTimer(self)
+		self._settings_timer.setSingleShot(True)
+		self._settings_timer.setInterval(SETTINGS_SAVE_DELAY)
+		self._settings_timer.timeout.connect(self._flush_settings)
 
 		# UI-Status
 		self.current_file = None
@@ -116,74 +195,8 @@ class MainWindow(QMainWindow):
 
 		app.setPalette(palette)
 
-		# Stylesheet für weitere Anpassungen
-		self.setStyleSheet(f"""
-            QMainWindow, QDialog, QWidget, QTabWidget::pane, QTabBar::tab {{
-                background-color: {PRIMARY_COLOR};
-                color: {TEXT_COLOR};
-            }}
-
-            QTabBar::tab:selected {{
-                background-color: {ACCENT_COLOR};
-            }}
-
-            QPushButton {{
-                background-color: {ACCENT_COLOR};
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: {BUTTON_MIN_WIDTH}px;
-            }}
-
-            QPushButton:hover {{
-                background-color: {ACCENT_COLOR}BB;
-            }}
-
-            QPushButton:pressed {{
-                background-color: {ACCENT_COLOR}99;
-            }}
-
-            QPushButton:disabled {{
-                background-color: {SECONDARY_BG};
-                color: {TEXT_COLOR}99;
-            }}
-
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {SECONDARY_BG};
-                color: {TEXT_COLOR};
-                border: 1px solid {ACCENT_COLOR};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-
-            QListWidget {{
-                background-color: {SECONDARY_BG};
-                color: {TEXT_COLOR};
-                border: 1px solid {ACCENT_COLOR};
-                border-radius: 4px;
-            }}
-
-            QScrollBar {{
-                background-color: {SECONDARY_BG};
-            }}
-
-            QLabel {{
-                color: {TEXT_COLOR};
-            }}
-
-            QToolBar {{
-                background-color: {PRIMARY_COLOR};
-                spacing: 5px;
-                border: none;
-            }}
-
-            QStatusBar {{
-                background-color: {SECONDARY_BG};
-                color: {TEXT_COLOR};
-            }}
-        """)
+		# Stylesheet für weitere Anpassungen (einmalig beim Import erzeugt)
+		self.setStyleSheet(_STYLESHEET)
 
 	def create_toolbar(self):
 		"""Erstellt die Werkzeugleiste"""
@@ -273,8 +286,9 @@ class MainWindow(QMainWindow):
 			# Workflow laden
 			count = self.engine.load_workflow(filename)
 
-			# UI aktualisieren (refresh_workflow_list aktualisiert auch die Loop-Einstellungen)
+			# UI aktualisieren (die Datei enthält auch die Loop-Einstellungen)
 			self.workflow_tab.refresh_workflow_list()
+			self.workflow_tab.update_loop_settings()
 
 			# Status aktualisieren
 			self.current_file = filename
@@ -282,7 +296,7 @@ class MainWindow(QMainWindow):
 			self.workflow_tab.set_modified(False)
 
 			# Zu den zuletzt verwendeten Workflows hinzufügen
-			add_recent_workflow(filename)
+			self.add_recent_workflow(filename)
 
 			# Statusmeldung
 			self.show_status_message(f"{count} Aktionen geladen aus {os.path.basename(filename)}")
@@ -312,7 +326,7 @@ class MainWindow(QMainWindow):
 			self.workflow_tab.set_modified(False)
 
 			# Zu den zuletzt verwendeten Workflows hinzufügen
-			add_recent_workflow(self.current_file)
+			self.add_recent_workflow(self.current_file)
 
 			# Statusmeldung
 			self.show_status_message(f"Workflow gespeichert als {os.path.basename(self.current_file)}")
@@ -353,7 +367,7 @@ class MainWindow(QMainWindow):
 			self.workflow_tab.set_modified(False)
 
 			# Zu den zuletzt verwendeten Workflows hinzufügen
-			add_recent_workflow(filename)
+			self.add_recent_workflow(filename)
 
 			# Statusmeldung
 			self.show_status_message(f"Workflow gespeichert als {os.path.basename(filename)}")
@@ -371,7 +385,8 @@ class MainWindow(QMainWindow):
 			self.record_action.setChecked(checked)
 
 		if checked:
-			# Aufnahme starten
+			# Aufnahme starten (vorhandene Aktionen werden nicht mit Aufgezeichnetem zusammengefasst)
+			self._recording_start_index = len(self.engine.workflow)
 			self.engine.start_recording()
 
 			# Thread für die Aufzeichnung starten
@@ -406,11 +421,12 @@ class MainWindow(QMainWindow):
 
 	def on_action_recorded(self, action: Action):
 		"""Wird aufgerufen, wenn eine Aktion aufgezeichnet wurde"""
-		# Aktion zum Workflow hinzufügen
-		self.engine.add_action(action)
-
-		# UI aktualisieren
-		self.workflow_tab.refresh_workflow_list()
+		if self._merge_recorded_move(action):
+			# Nur den Eintrag der verlängerten Bewegung aktualisieren
+			self.workflow_tab.update_action_item(len(self.engine.workflow) - 1)
+		else:
+			# Aktion zum Workflow hinzufügen (nur den neuen Listeneintrag anhängen)
+			self.workflow_tab.append_action(action)
 
 		# Status aktualisieren
 		self.is_modified = True
@@ -419,6 +435,52 @@ class MainWindow(QMainWindow):
 		# Statusmeldung
 		self.show_status_message(f"Aktion aufgezeichnet: {action.get_description()}")
 
+	def _merge_recorded_move(self, action: Action) -> bool:
+		"""
+		Fasst eine aufgezeichnete Mausbewegung mit der vorherigen zusammen, wenn alle drei
+		Punkte (vorletzte, letzte und neue Position) auf einer Linie in gleicher Richtung liegen
+
+		Die letzte Bewegung wird dann bis zur neuen Position verlängert und ihre Dauer erhöht.
+		Nur Bewegungen der laufenden Aufnahme werden zusammengefasst, Aktionen von vor dem
+		Aufnahmestart bleiben unverändert.
+
+		Args:
+			action: Die neu aufgezeichnete Aktion
+
+		Returns:
+			bool: True, wenn die Aktion in die vorherige Bewegung übernommen wurde
+		"""
+		workflow = self.engine.workflow
+		if (action.action_type != ActionType.MOUSE_MOVE
+				or len(workflow) - 2 < self._recording_start_index
+				or workflow[-1].action_type != ActionType.MOUSE_MOVE
+				or workflow[-2].action_type != ActionType.MOUSE_MOVE):
+			return False
+
+		first, last, new = workflow[-2].params, workflow[-1].params, action.params
+		if (first.get("screen_id", 0) != last.get("screen_id", 0)
+				or last.get("screen_id", 0) != new.get("screen_id", 0)):
+			return False
+
+		# Richtung der zusammengefassten Bewegung
+		dx, dy = new["x"] - first["x"], new["y"] - first["y"]
+		length = (dx * dx + dy * dy) ** 0.5
+		if length == 0:
+			return False
+
+		# Abstand der letzten Position von der Linie und Fortsetzung in gleicher Richtung
+		off_x, off_y = last["x"] - first["x"], last["y"] - first["y"]
+		distance = abs(dx * off_y - dy * off_x) / length
+		same_direction = (off_x * (new["x"] - last["x"]) + off_y * (new["y"] - last["y"])) > 0
+		if distance > RECORDING_MERGE_TOLERANCE or not same_direction:
+			return False
+
+		last_action = workflow[-1]
+		last_action.set_param("x", new["x"])
+		last_action.set_param("y", new["y"])
+		last_action.set_param("duration", round(last.get("duration", 0.1) + new.get("duration", 0.1), 3))
+		return True
+
 	def on_recording_error(self, error_message: str):
 		"""Wird aufgerufen, wenn ein Fehler bei der Aufzeichnung auftritt"""
 		self.toggle_recording(False)  # Aufzeichnung stoppen
@@ -493,10 +555,15 @@ class MainWindow(QMainWindow):
 		self.show_status_message("Notfall-Stopp ausgeführt!", 5000)
 
 	def update_playback_progress(self, index: int):
-		"""Aktualisiert die Fortschrittsanzeige während der Ausführung"""
+		"""
+		Aktualisiert die Fortschrittsanzeige während der Ausführung
+
+		WorkflowThread sendet den Fortschritt bereits höchstens alle
+		PLAYBACK_PROGRESS_INTERVAL ms, daher wird jeder Index direkt angezeigt.
+		"""
 		if 0 <= index < len(self.engine.workflow):
 			# Aktion in der Liste auswählen
-			self.workflow_tab.workflow_list.setCurrentRow(index)
+			self.workflow_tab.set_current_row(index)
 
 			# Statusmeldung
 			action = self.engine.workflow[index]
@@ -606,29 +673,55 @@ class MainWindow(QMainWindow):
 				self.workflow_thread.terminate()
 				self.workflow_thread.wait()
 
-		# Einstellungen speichern
+		# OCR-Ressourcen der Engine freigeben
+		self.engine.close()
+
+		# Einstellungen speichern (ersetzt ein noch ausstehendes verzögertes Speichern)
+		self._settings_timer.stop()
 		save_settings(self.settings)
 
 		# Event akzeptieren (Fenster schließen)
 		event.accept()
 
+	def add_recent_workflow(self, filename, max_entries=10):
+		"""
+		Fügt einen Workflow zur Liste der zuletzt verwendeten Workflows hinzu
+
+		Die Liste wird in den geladenen Einstellungen geändert und nach
+		SETTINGS_SAVE_DELAY gespeichert, statt die Datei jedes Mal zu lesen und zu schreiben.
+
+		Args:
+			filename: Pfad zur Workflow-Datei
+			max_entries: Maximale Anzahl der Einträge in der Liste
+		"""
+		recent = self.settings.get("recent_workflows", [])
+		last_directories = self.settings.setdefault("last_directories", {})
+		directory = os.path.dirname(filename)
+
+		# Bereits der neueste Eintrag mit demselben Verzeichnis: nichts zu ändern
+		if (recent and recent[0] == filename
+				and (not directory or last_directories.get("workflow") == directory)):
+			return
 
-def add_recent_workflow(filename, max_entries=10):
-	"""Fügt einen Workflow zur Liste der zuletzt verwendeten Workflows hinzu"""
-	settings = load_settings()
-	recent = settings.get("recent_workflows", [])
+		# Entferne den Eintrag, falls er bereits vorhanden ist
+		if filename in recent:
+			recent.remove(filename)
 
-	# Entferne den Eintrag, falls er bereits vorhanden ist
-	if filename in recent:
-		recent.remove(filename)
+		# Füge den Eintrag am Anfang der Liste hinzu
+		recent.insert(0, filename)
 
-	# Füge den Eintrag am Anfang der Liste hinzu
-	recent.insert(0, filename)
+		# Begrenze die Anzahl der Einträge
+		self.settings["recent_workflows"] = recent[:max_entries]
 
-	# Begrenze die Anzahl der Einträge
-	settings["recent_workflows"] = recent[:max_entries]
+		# Merke auch das Verzeichnis für den nächsten Dialog
+		if directory:
+			last_directories["workflow"] = directory
 
-	save_settings(settings)
+		self._settings_timer.start()
+
+	def _flush_settings(self):
+		"""Speichert die Einstellungen nach verzögerten Änderungen"""
+		save_settings(self.settings)
 
 
 def main():
@@ -4,7 +4,7 @@ Enthält die Definitionen für Aktionstypen und Aktionen.
 """
 
 from enum import Enum
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable
 
 
 class ActionType(Enum):
@@ -21,10 +21,81 @@ class ActionType(Enum):
     WAIT_FOR_COLOR = "Auf Farbe warten"
     WAIT_FOR_TEXT = "Auf Text warten"
 
+    # Mitglieder sind Einzelinstanzen und werden per Identität verglichen; der
+    # Identitäts-Hash erspart bei jedem Nachschlagen in den Tabellen (Handler,
+    # Standardparameter, Beschreibungen) den Python-Aufruf von Enum.__hash__
+    __hash__ = object.__hash__
+
+    @classmethod
+    def from_value(cls, value: str):
+        """
+        Liefert den Aktionstyp zu einem angezeigten bzw. gespeicherten Wert
+
+        Args:
+            value: Der Wert des Aktionstyps (z.B. "Mausklick")
+
+        Returns:
+            Der passende ActionType oder None, wenn der Wert unbekannt ist
+        """
+        return _ACTION_TYPE_BY_VALUE.get(value)
+
+    @property
+    def expected_params(self) -> frozenset:
+        """Namen der Parameter, die dieser Aktionstyp verwendet"""
+        return frozenset(_DEFAULT_PARAMS.get(self, ()))
+
+
+# Aktionstyp je gespeichertem Wert (einmalig beim Import erstellt, für from_dict)
+_ACTION_TYPE_BY_VALUE = {t.value: t for t in ActionType}
+
+_MOUSE_PARAMS = {"x": 0, "y": 0, "duration": 0.1, "screen_id": 0}
+
+# Standardparameter je Aktionstyp (werden bei jeder Abfrage kopiert)
+_DEFAULT_PARAMS: Dict[ActionType, Dict[str, Any]] = {
+    ActionType.MOUSE_MOVE: _MOUSE_PARAMS,
+    ActionType.MOUSE_CLICK: _MOUSE_PARAMS,
+    ActionType.MOUSE_DOUBLE_CLICK: _MOUSE_PARAMS,
+    ActionType.MOUSE_RIGHT_CLICK: _MOUSE_PARAMS,
+    ActionType.MOUSE_DRAG: {"start_x": 0, "start_y": 0, "end_x": 100, "end_y": 100,
+                            "duration": 0.5, "screen_id": 0},
+    ActionType.KEY_PRESS: {"key": "enter"},
+    ActionType.KEY_COMBO: {"keys": ["ctrl", "c"]},
+    ActionType.TEXT_WRITE: {"text": "Beispieltext", "interval": 0.0},
+    ActionType.WAIT: {"seconds": 1},
+    ActionType.WAIT_FOR_COLOR: {"x": 0, "y": 0, "color": [255, 0, 0], "tolerance": 10,
+                                "timeout": 10, "screen_id": 0},
+    ActionType.WAIT_FOR_TEXT: {"region": [0, 0, 200, 100], "text": "Beispieltext",
+                               "timeout": 10, "screen_id": 0},
+}
+
+
+def _describe_position(params: Dict[str, Any], screen_info: str) -> str:
+    return f" ({params['x']}, {params['y']}){screen_info}"
+
+
+# Beschreibungszusatz je Aktionstyp: (params, screen_info) -> Text nach dem Typnamen
+_DESCRIBERS: Dict[ActionType, Callable[[Dict[str, Any], str], str]] = {
+    ActionType.MOUSE_MOVE: _describe_position,
+    ActionType.MOUSE_CLICK: _describe_position,
+    ActionType.MOUSE_DOUBLE_CLICK: _describe_position,
+    ActionType.MOUSE_RIGHT_CLICK: _describe_position,
+    ActionType.MOUSE_DRAG: lambda p, s: (f" ({p.get('start_x', 0)}, {p.get('start_y', 0)}) -> "
+                                         f"({p['end_x']}, {p['end_y']}){s}"),
+    ActionType.KEY_PRESS: lambda p, s: f" {p['key']}",
+    ActionType.KEY_COMBO: lambda p, s: f" {'+'.join(p['keys'])}",
+    ActionType.TEXT_WRITE: lambda p, s: f" '{p['text']}'",
+    ActionType.WAIT: lambda p, s: f" {p['seconds']}s",
+    ActionType.WAIT_FOR_COLOR: lambda p, s: f" an{_describe_position(p, s)}",
+    ActionType.WAIT_FOR_TEXT: lambda p, s: f" '{p['text']}'{s}",
+}
+
 
 class Action:
     """Klasse für eine einzelne Aktion im Workflow"""
 
+    # Kein __dict__ pro Instanz (lange Aufzeichnungen enthalten sehr viele Aktionen)
+    __slots__ = ("action_type", "params", "_description")
+
     def __init__(self, action_type: ActionType, params: Dict[str, Any]):
         """
         Erstellt eine neue Aktion
@@ -35,6 +106,21 @@ class Action:
         """
         self.action_type = action_type
         self.params = params
+        self._description = None  # Zwischengespeicherte Beschreibung (siehe get_description)
+
+    def set_param(self, name: str, value: Any):
+        """
+        Setzt einen Parameter der Aktion
+
+        Parameter sollten über diese Methode geändert werden, damit die
+        zwischengespeicherte Beschreibung verworfen wird.
+
+        Args:
+            name: Name des Parameters
+            value: Neuer Wert
+        """
+        self.params[name] = value
+        self._description = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert die Aktion in ein Dictionary für die JSON-Serialisierung"""
@@ -46,36 +132,24 @@ class Action:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Action':
         """Erstellt eine Aktion aus einem Dictionary (für die JSON-Deserialisierung)"""
-        action_type = next(t for t in ActionType if t.value == data["type"])
-        return cls(action_type, data["params"])
+        return cls(_ACTION_TYPE_BY_VALUE[data["type"]], data["params"])
 
+    @staticmethod
     def get_default_params(action_type: ActionType) -> Dict[str, Any]:
         """Gibt Standardparameter für einen Aktionstyp zurück"""
-        if action_type in [ActionType.MOUSE_MOVE, ActionType.MOUSE_CLICK,
-                           ActionType.MOUSE_DOUBLE_CLICK, ActionType.MOUSE_RIGHT_CLICK]:
-            return {"x": 0, "y": 0, "duration": 0.1, "screen_id": 0}
-        elif action_type == ActionType.MOUSE_DRAG:
-            return {"start_x": 0, "start_y": 0, "end_x": 100, "end_y": 100,
-                    "duration": 0.5, "screen_id": 0}
-        elif action_type == ActionType.KEY_PRESS:
-            return {"key": "enter"}
-        elif action_type == ActionType.KEY_COMBO:
-            return {"keys": ["ctrl", "c"]}
-        elif action_type == ActionType.TEXT_WRITE:
-            return {"text": "Beispieltext", "interval": 0.0}
-        elif action_type == ActionType.WAIT:
-            return {"seconds": 1}
-        elif action_type == ActionType.WAIT_FOR_COLOR:
-            return {"x": 0, "y": 0, "color": [255, 0, 0], "tolerance": 10,
-                    "timeout": 10, "screen_id": 0}
-        elif action_type == ActionType.WAIT_FOR_TEXT:
-            return {"region": [0, 0, 200, 100], "text": "Beispieltext",
-                    "timeout": 10, "screen_id": 0}
-        else:
-            return {}
+        # Parameter sind flach: nur Listenwerte (z. B. color, region) brauchen eine eigene Kopie
+        return {name: list(value) if isinstance(value, list) else value
+                for name, value in _DEFAULT_PARAMS.get(action_type, {}).items()}
 
     def get_description(self) -> str:
         """Gibt eine Beschreibung der Aktion zurück, die in der UI angezeigt werden kann"""
+        # Beschreibung nur nach Parameteränderungen neu erstellen
+        if self._description is None:
+            self._description = self._build_description()
+        return self._description
+
+    def _build_description(self) -> str:
+        """Erstellt die Beschreibung der Aktion aus Typ und Parametern"""
         description = f"{self.action_type.value}"
 
         # Füge Bildschirm zur Beschreibung hinzu, wenn vorhanden
@@ -84,25 +158,8 @@ class Action:
             screen_id = self.params["screen_id"]
             screen_info = f" (Bildschirm {screen_id})"
 
-        if self.action_type == ActionType.MOUSE_MOVE:
-            description += f" ({self.params['x']}, {self.params['y']}){screen_info}"
-        elif self.action_type in [ActionType.MOUSE_CLICK, ActionType.MOUSE_DOUBLE_CLICK,
-                                  ActionType.MOUSE_RIGHT_CLICK]:
-            description += f" ({self.params['x']}, {self.params['y']}){screen_info}"
-        elif self.action_type == ActionType.MOUSE_DRAG:
-            description += f" ({self.params.get('start_x', 0)}, {self.params.get('start_y', 0)}) -> "
-            description += f"({self.params['end_x']}, {self.params['end_y']}){screen_info}"
-        elif self.action_type == ActionType.KEY_PRESS:
-            description += f" {self.params['key']}"
-        elif self.action_type == ActionType.KEY_COMBO:
-            description += f" {'+'.join(self.params['keys'])}"
-        elif self.action_type == ActionType.TEXT_WRITE:
-            description += f" '{self.params['text']}'"
-        elif self.action_type == ActionType.WAIT:
-            description += f" {self.params['seconds']}s"
-        elif self.action_type == ActionType.WAIT_FOR_COLOR:
-            description += f" an ({self.params['x']}, {self.params['y']}){screen_info}"
-        elif self.action_type == ActionType.WAIT_FOR_TEXT:
-            description += f" '{self.params['text']}'{screen_info}"
+        describe = _DESCRIBERS.get(self.action_type)
+        if describe is not None:
+            description += describe(self.params, screen_info)
 
         return description
\ No newline at end of file
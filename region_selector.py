@@ -10,6 +10,8 @@ from PyQt6.QtWidgets import QApplication, QWidget
 from PyQt6.QtCore import Qt, QRect, QPoint
 from PyQt6.QtGui import QPainter, QPen, QColor, QScreen
 
+from constants import ACCENT_COLOR, MIN_REGION_SIZE
+
 
 class RegionSelector(QWidget):
     def __init__(self, callback=None):
@@ -35,10 +37,21 @@ class RegionSelector(QWidget):
         self.start_point = None
         self.current_rect = None
         self.is_drawing = False
+        self._painted_rect = QRect()  # Zuletzt gezeichneter Bereich von Region und Beschriftung
+        self._label_text = ""  # Beschriftung der aktuellen Region und deren Position
+        self._label_rect = QRect()
         
         # Callback-Funktion speichern
         self.callback = callback
         
+        # Farben, Stift und Ausrichtung einmalig erstellen (paintEvent läuft bei jeder Mausbewegung)
+        self._background_color = QColor(0, 0, 0, 100)
+        self._region_fill_color = QColor(255, 255, 255, 50)
+        self._border_pen = QPen(QColor(ACCENT_COLOR), 2)
+        self._text_background_color = QColor(0, 0, 0, 180)
+        self._text_color = QColor(255, 255, 255)
+        self._text_alignment = Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight
+        
         self.setMouseTracking(True)
         self.setCursor(Qt.CursorShape.CrossCursor)
         
@@ -46,31 +59,27 @@ class RegionSelector(QWidget):
         """Zeichnet das Overlay für die Regionauswahl"""
         painter = QPainter(self)
         
-        # Halbtransparenten Hintergrund zeichnen
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        # Halbtransparenten Hintergrund zeichnen (nur im neu zu zeichnenden Bereich)
+        painter.fillRect(event.rect(), self._background_color)
         
-        # Wenn eine Region ausgewählt wird, zeichne sie
-        if self.current_rect:
+        # Wenn eine Region ausgewählt wird, zeichne sie (nicht bei bloßem Klick oder Minimalregion)
+        if self.current_rect and self._is_valid_region(self.current_rect):
             # Transparentes Inneres für die ausgewählte Region
-            painter.fillRect(self.current_rect, QColor(255, 255, 255, 50))
+            painter.fillRect(self.current_rect, self._region_fill_color)
             
             # Rahmen um die Region zeichnen
-            pen = QPen(QColor(ACCENT_COLOR), 2)
-            painter.setPen(pen)
+            painter.setPen(self._border_pen)
             painter.drawRect(self.current_rect)
             
-            # Abmessungen anzeigen
-            width = self.current_rect.width()
-            height = self.current_rect.height()
-            text = f"{width} x {height}"
+            # Abmessungen anzeigen (Text und Position bereits bei der Mausbewegung berechnet)
+            text = self._label_text
             
             # Text mit Hintergrund für bessere Sichtbarkeit
-            text_rect = painter.boundingRect(self.current_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, text)
-            painter.fillRect(text_rect, QColor(0, 0, 0, 180))
+            painter.fillRect(self._label_rect, self._text_background_color)
             
             # Text in Weiß zeichnen
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(self.current_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, text)
+            painter.setPen(self._text_color)
+            painter.drawText(self.current_rect, self._text_alignment, text)
     
     def mousePressEvent(self, event):
         """Startet die Regionauswahl bei Mausklick"""
@@ -78,6 +87,7 @@ class RegionSelector(QWidget):
             self.start_point = event.position().toPoint()
             self.current_rect = QRect(self.start_point, self.start_point)
             self.is_drawing = True
+            self._painted_rect = self._update_overlay(self.current_rect)
             self.update()
     
     def mouseMoveEvent(self, event):
@@ -85,7 +95,43 @@ class RegionSelector(QWidget):
         if self.is_drawing:
             end_point = event.position().toPoint()
             self.current_rect = QRect(self.start_point, end_point).normalized()
-            self.update()
+            
+            # Nur den alten und den neuen Bereich neu zeichnen statt des ganzen Bildschirms
+            overlay_rect = self._update_overlay(self.current_rect)
+            self.update(overlay_rect.united(self._painted_rect))
+            self._painted_rect = overlay_rect
+    
+    def _update_overlay(self, rect: QRect) -> QRect:
+        """
+        Berechnet Beschriftung und Bereich der Region für den nächsten paintEvent
+
+        Die Beschriftung wird so nur einmal pro Mausbewegung gesetzt und vermessen.
+
+        Args:
+            rect: Die ausgewählte Region
+
+        Returns:
+            QRect: Region samt Beschriftung (die bei kleinen Regionen übersteht) und Rahmenbreite
+        """
+        if not self._is_valid_region(rect):
+            # Wird nicht gezeichnet, keine Beschriftung nötig
+            self._label_text = ""
+            self._label_rect = QRect()
+            return rect.adjusted(-2, -2, 2, 2)
+
+        self._label_text = self._size_label(rect)
+        self._label_rect = self.fontMetrics().boundingRect(rect, self._text_alignment, self._label_text)
+        return rect.united(self._label_rect).adjusted(-2, -2, 2, 2)
+    
+    @staticmethod
+    def _is_valid_region(rect: QRect) -> bool:
+        """Prüft, ob eine Region groß genug für eine Auswahl ist"""
+        return rect.width() > MIN_REGION_SIZE and rect.height() > MIN_REGION_SIZE
+    
+    @staticmethod
+    def _size_label(rect: QRect) -> str:
+        """Beschriftung mit den Abmessungen einer Region"""
+        return f"{rect.width()} x {rect.height()}"
     
     def mouseReleaseEvent(self, event):
         """Beendet die Regionauswahl bei Mausloslassen"""
@@ -95,7 +141,7 @@ class RegionSelector(QWidget):
             self.is_drawing = False
             
             # Wenn eine gültige Region ausgewählt wurde und ein Callback existiert
-            if self.current_rect.width() > 5 and self.current_rect.height() > 5 and self.callback:
+            if self._is_valid_region(self.current_rect) and self.callback:
                 region = [
                     self.current_rect.x(),
                     self.current_rect.y(),
@@ -112,10 +158,6 @@ class RegionSelector(QWidget):
             self.close()
 
 
-# Konstanten
-ACCENT_COLOR = "#5D5FEF"  # Helles Blau für Akzente (muss mit main.py übereinstimmen)
-
-
 # Beispielnutzung
 if __name__ == "__main__":
     def on_region_selected(region):
@@ -3,11 +3,20 @@ Thread-Klassen für die Ausführung von Workflows und die Aufzeichnung von Aktio
 """
 
 import time
+import threading
+from functools import partial
 import pyautogui
-from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QWaitCondition
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from automation_engine import AutomationEngine
+from constants import PLAYBACK_PROGRESS_INTERVAL
 from models import Action, ActionType
 
+try:
+    # Optional: Mausbewegungen als Ereignisse statt durch Abfrage aufzeichnen
+    from pynput import mouse as pynput_mouse
+except ImportError:
+    pynput_mouse = None
+
 
 class WorkflowThread(QThread):
     """Thread für die Ausführung eines Workflows"""
@@ -25,27 +34,53 @@ class WorkflowThread(QThread):
         """
         super().__init__()
         self.engine = engine
-        self.mutex = QMutex()
-        self.condition = QWaitCondition()
-        self.paused = False
+        # Gesetzt, solange nicht pausiert; die Prüfung nach jeder Aktion braucht so keine Sperre
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        
+    @property
+    def paused(self) -> bool:
+        """Gibt an, ob die Ausführung pausiert ist"""
+        return not self._resume_event.is_set()
         
     def run(self):
         """Führt den Workflow aus"""
+        resume_event = self._resume_event
+        emit_progress = self.progress_updated.emit
+        now = time.monotonic
+        
+        # Fortschritt höchstens alle PLAYBACK_PROGRESS_INTERVAL ms an den UI-Thread senden
+        interval = PLAYBACK_PROGRESS_INTERVAL / 1000
+        last_emit = -interval
+        pending_index = -1
+        
+        def update_progress(index):
+            """Callback für Fortschrittsanzeige"""
+            nonlocal last_emit, pending_index
+            current_time = now()
+            if current_time - last_emit >= interval:
+                emit_progress(index)
+                last_emit = current_time
+                pending_index = -1
+            else:
+                pending_index = index
+            
+            # Unterstütze Pausieren (vorher den aktuellen Stand anzeigen)
+            if not resume_event.is_set():
+                if pending_index >= 0:
+                    emit_progress(pending_index)
+                    pending_index = -1
+                resume_event.wait()
+        
         try:
-            def update_progress(index):
-                """Callback für Fortschrittsanzeige"""
-                self.progress_updated.emit(index)
-                
-                # Unterstütze Pausieren
-                self.mutex.lock()
-                if self.paused:
-                    self.condition.wait(self.mutex)
-                self.mutex.unlock()
-                
             self.engine.play_workflow(callback=update_progress)
         except Exception as e:
             self.error_occurred.emit(str(e))
         finally:
+            # Zuletzt zurückgehaltenen Fortschritt noch melden
+            if pending_index >= 0:
+                emit_progress(pending_index)
+                
             # Sicherstellen, dass is_playing auf False gesetzt wird
             self.engine.is_playing = False
             self.finished.emit()
@@ -57,10 +92,7 @@ class WorkflowThread(QThread):
         self.engine.stop_playback()
 
         # Stelle sicher, dass der Thread nicht im pausierten Zustand hängt
-        self.mutex.lock()
-        self.paused = False
-        self.condition.wakeAll()
-        self.mutex.unlock()
+        self._resume_event.set()
 
         # Warte maximal 1 Sekunde auf Beendigung
         if not self.wait(1000):
@@ -70,16 +102,11 @@ class WorkflowThread(QThread):
 
     def pause(self):
         """Pausiert die Ausführung des Workflows"""
-        self.mutex.lock()
-        self.paused = True
-        self.mutex.unlock()
+        self._resume_event.clear()
 
     def resume(self):
         """Setzt die Ausführung des Workflows fort"""
-        self.mutex.lock()
-        self.paused = False
-        self.condition.wakeAll()
-        self.mutex.unlock()
+        self._resume_event.set()
 
 
 class RecordingThread(QThread):
@@ -96,21 +123,25 @@ class RecordingThread(QThread):
         """
         super().__init__()
         self.engine = engine
-        self.mutex = QMutex()
-        self.running = True
+        self._stop_event = threading.Event()  # Gesetzt, sobald die Aufzeichnung beendet werden soll
         self.last_mouse_position = None
         self.last_mouse_time = 0
         self.min_move_distance = 10  # Mindestabstand für Mausbewegungen in Pixeln
         self.min_move_interval = 0.2  # Minimales Zeitintervall zwischen Aufzeichnungen
+        self._wakeup = threading.Event()  # Gesetzt bei Mausbewegung (pynput) und beim Stoppen
+
+    @property
+    def running(self) -> bool:
+        """Gibt an, ob die Aufzeichnung noch läuft"""
+        return not self._stop_event.is_set()
 
     def run(self):
         """Hauptmethode für die Aufzeichnung"""
         try:
-            # Mock-Implementation mit tatsächlichem Tracking
-            # In einer realen Implementation würden wir System-spezifische Event-Hooks verwenden
+            # Aufzeichnung von Mausbewegungen (Startposition, danach jede ausreichend große Bewegung)
             initial_mouse_pos = pyautogui.position()
             self.last_mouse_position = initial_mouse_pos
-            self.last_mouse_time = time.time()
+            self.last_mouse_time = time.monotonic()
 
             # Aufzeichnen der Startposition
             start_action = Action(
@@ -119,47 +150,184 @@ class RecordingThread(QThread):
             )
             self.action_recorded.emit(start_action)
 
-            while self.running:
-                self.mutex.lock()
-                still_running = self.running
-                self.mutex.unlock()
+            # Ereignisgesteuert, falls pynput verfügbar ist, sonst Abfrage der Position
+            if pynput_mouse is not None:
+                self._record_with_listener()
+            else:
+                self._record_by_polling()
+        except Exception as e:
+            self.error_occurred.emit(f"Fehler bei der Aufzeichnung: {str(e)}")
 
-                if not still_running:
-                    break
+    def _record_by_polling(self):
+        """Zeichnet Mausbewegungen durch regelmäßige Abfrage der Mausposition auf"""
+        # Im Abfrageloop nur lokale Namen und quadrierte Abstände verwenden
+        position = pyautogui.position
+        now = time.monotonic
+        min_distance_sq = self.min_move_distance ** 2
+        last_x, last_y = self.last_mouse_position
+        stop_event = self._stop_event
 
-                # Mausposition prüfen
-                current_mouse_pos = pyautogui.position()
-                current_time = time.time()
+        while not stop_event.is_set():
+            # Mausposition prüfen
+            x, y = position()
+            current_time = now()
 
-                # Wenn sich die Maus genug bewegt hat und genug Zeit vergangen ist
-                if (self._distance(current_mouse_pos, self.last_mouse_position) > self.min_move_distance and
-                    current_time - self.last_mouse_time > self.min_move_interval):
+            # Wenn sich die Maus genug bewegt hat und genug Zeit vergangen ist
+            dx, dy = x - last_x, y - last_y
+            if (dx * dx + dy * dy > min_distance_sq and
+                current_time - self.last_mouse_time > self.min_move_interval):
 
-                    # Mausbewegung aufzeichnen
-                    move_action = Action(
-                        ActionType.MOUSE_MOVE,
-                        {"x": current_mouse_pos[0], "y": current_mouse_pos[1], "duration": 0.1}
-                    )
-                    self.action_recorded.emit(move_action)
+                # Mausbewegung aufzeichnen
+                self._emit_move(x, y, current_time)
+                last_x, last_y = x, y
 
-                    self.last_mouse_position = current_mouse_pos
-                    self.last_mouse_time = current_time
+            # Kurze Pause, um CPU-Last zu reduzieren (endet sofort beim Stoppen)
+            stop_event.wait(0.05)
 
-                # Kurze Pause, um CPU-Last zu reduzieren
-                time.sleep(0.05)
-        except Exception as e:
-            self.error_occurred.emit(f"Fehler bei der Aufzeichnung: {str(e)}")
+    def _record_with_listener(self):
+        """
+        Zeichnet Mausbewegungen über die Ereignisse von pynput auf
+
+        Der Thread schläft, bis eine Bewegung gemeldet wird. Ist seit der letzten
+        Aufzeichnung noch nicht min_move_interval vergangen, wird die Position nach
+        Ablauf des Intervalls erneut geprüft, damit auch die Endposition einer kurzen
+        Bewegung aufgezeichnet wird.
+        """
+        latest = None
+
+        def on_move(x, y):
+            nonlocal latest
+            latest = (int(x), int(y))
+            self._wakeup.set()
+
+        listener = pynput_mouse.Listener(on_move=on_move)
+        listener.start()
+        try:
+            min_distance_sq = self.min_move_distance ** 2
+            last_x, last_y = self.last_mouse_position
+            timeout = None
+
+            while self.running:
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                if not self.running or latest is None:
+                    continue
+
+                x, y = latest
+                dx, dy = x - last_x, y - last_y
+                if dx * dx + dy * dy <= min_distance_sq:
+                    timeout = None
+                    continue
+
+                # Zu früh: erneut prüfen, sobald das Mindestintervall abgelaufen ist
+                current_time = time.monotonic()
+                remaining = self.min_move_interval - (current_time - self.last_mouse_time)
+                if remaining > 0:
+                    timeout = remaining
+                    continue
+
+                self._emit_move(x, y, current_time)
+                last_x, last_y = x, y
+                timeout = None
+        finally:
+            listener.stop()
+
+    def _emit_move(self, x: int, y: int, timestamp: float):
+        """
+        Meldet eine aufgezeichnete Mausbewegung
+
+        Args:
+            x: X-Koordinate der neuen Mausposition
+            y: Y-Koordinate der neuen Mausposition
+            timestamp: Zeitpunkt der Aufzeichnung (time.monotonic())
+        """
+        move_action = Action(
+            ActionType.MOUSE_MOVE,
+            {"x": x, "y": y, "duration": 0.1}
+        )
+        self.action_recorded.emit(move_action)
 
-    def _distance(self, pos1, pos2):
-        """Berechnet die Entfernung zwischen zwei Punkten"""
-        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
+        self.last_mouse_position = (x, y)
+        self.last_mouse_time = timestamp
 
     def stop(self):
         """Stoppt die Aufzeichnung"""
-        self.mutex.lock()
-        self.running = False
-        self.mutex.unlock()
+        self._stop_event.set()
+        self._wakeup.set()  # Ereignisgesteuerte Aufzeichnung aufwecken
 
         # Warte maximal 1 Sekunde auf Beendigung
         if not self.wait(1000):
-            self.terminate()  # Nur als letzte Möglichkeit
\ No newline at end of file
+            self.terminate()  # Nur als letzte Möglichkeit
+
+
+class MousePositionTester(QObject):
+    """Worker, der Testbewegungen der Maus außerhalb des UI-Threads ausführt"""
+    error_occurred = pyqtSignal(str)
+
+    @pyqtSlot(int, int)
+    def test(self, x: int, y: int):
+        """
+        Bewegt die Maus zur Testposition und anschließend zurück
+
+        Args:
+            x: Absolute X-Koordinate der Testposition
+            y: Absolute Y-Koordinate der Testposition
+        """
+        try:
+            # Ausgangsposition erst im Worker abfragen
+            original_x, original_y = pyautogui.position()
+            pyautogui.moveTo(x, y, duration=0.2)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+            return
+
+        # Nach 1,5 Sekunden zurückbewegen, ohne den Worker-Thread zu blockieren
+        QTimer.singleShot(1500, partial(self._move_back, original_x, original_y))
+
+    def _move_back(self, x: int, y: int):
+        """Bewegt die Maus zurück zur ursprünglichen Position"""
+        try:
+            pyautogui.moveTo(x, y, duration=0.2)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class CursorPoller(QObject):
+    """Worker, der die Mausposition für das Positions-Tracking außerhalb des UI-Threads abfragt"""
+    position_changed = pyqtSignal(int, int)
+
+    def __init__(self, interval: int):
+        """
+        Initialisiert den Poller
+
+        Args:
+            interval: Abfrageintervall in Millisekunden
+        """
+        super().__init__()
+        self.interval = interval
+        self._timer = None
+        self._last_position = None
+
+    @pyqtSlot()
+    def start(self):
+        """Startet die Abfrage; der Timer wird im Worker-Thread erstellt"""
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self._poll)
+
+        # Erste Position nach dem Start immer melden
+        self._last_position = None
+        self._timer.start(self.interval)
+
+    @pyqtSlot()
+    def stop(self):
+        """Hält die Abfrage an"""
+        if self._timer is not None:
+            self._timer.stop()
+
+    def _poll(self):
+        """Fragt die Mausposition ab und meldet sie nur bei einer Bewegung"""
+        position = tuple(pyautogui.position())
+        if position != self._last_position:
+            self._last_position = position
+            self.position_changed.emit(position[0], position[1])
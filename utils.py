@@ -3,294 +3,35 @@ Hilfsfunktionen für das Desktop-Automatisierungstool.
 """
 
 import os
+import re
 import sys
-import time
+import copy
 import json
-import pyautogui
 from typing import List, Tuple, Dict, Any, Optional
-from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout
-from PyQt6.QtCore import Qt, QRect, QPoint, QTimer
-from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QImage, QFont
-from PIL import ImageGrab
+
+try:
+    # Optional: schnellere JSON-Verarbeitung für die Einstellungsdatei
+    import orjson
+except ImportError:
+    orjson = None
 
 # Importiere Konstanten
 import constants
 from constants import *
 
+# ColorPicker und RegionSelector sind in eigenen Modulen definiert (hier für bestehende Importe verfügbar)
+from color_picker import ColorPicker
+from region_selector import RegionSelector
 
-class RegionSelector(QWidget):
-    """Widget zur Auswahl einer Region auf dem Bildschirm"""
-    
-    def __init__(self, callback=None):
-        """
-        Initialisiert den Region-Selector
-        
-        Args:
-            callback: Funktion, die mit der ausgewählten Region aufgerufen wird
-                     nach der Auswahl. Format: [x, y, width, height]
-        """
-        super().__init__()
-        
-        # Bildschirmgeometrie ermitteln
-        self.screen_geometry = QApplication.primaryScreen().geometry()
-        
-        # Widget für die gesamte Bildschirmfläche einrichten
-        self.setGeometry(self.screen_geometry)
-        self.setWindowTitle("Region auswählen")
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        
-        # Variablen für die Regionauswahl
-        self.start_point = None
-        self.current_rect = None
-        self.is_drawing = False
-        
-        # Callback-Funktion speichern
-        self.callback = callback
-        
-        self.setMouseTracking(True)
-        self.setCursor(Qt.CursorShape.CrossCursor)
-        
-    def paintEvent(self, event):
-        """Zeichnet das Overlay für die Regionauswahl"""
-        painter = QPainter(self)
-        
-        # Halbtransparenten Hintergrund zeichnen
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
-        
-        # Wenn eine Region ausgewählt wird, zeichne sie
-        if self.current_rect:
-            # Transparentes Inneres für die ausgewählte Region
-            painter.fillRect(self.current_rect, QColor(255, 255, 255, 50))
-            
-            # Rahmen um die Region zeichnen
-            pen = QPen(QColor(ACCENT_COLOR), 2)
-            painter.setPen(pen)
-            painter.drawRect(self.current_rect)
-            
-            # Abmessungen anzeigen
-            width = self.current_rect.width()
-            height = self.current_rect.height()
-            text = f"{width} x {height}"
-            
-            # Text mit Hintergrund für bessere Sichtbarkeit
-            text_rect = painter.boundingRect(self.current_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, text)
-            painter.fillRect(text_rect, QColor(0, 0, 0, 180))
-            
-            # Text in Weiß zeichnen
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(self.current_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, text)
-    
-    def mousePressEvent(self, event):
-        """Startet die Regionauswahl bei Mausklick"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.start_point = event.position().toPoint()
-            self.current_rect = QRect(self.start_point, self.start_point)
-            self.is_drawing = True
-            self.update()
-    
-    def mouseMoveEvent(self, event):
-        """Aktualisiert die Region während der Mausbewegung"""
-        if self.is_drawing:
-            end_point = event.position().toPoint()
-            self.current_rect = QRect(self.start_point, end_point).normalized()
-            self.update()
-    
-    def mouseReleaseEvent(self, event):
-        """Beendet die Regionauswahl bei Mausloslassen"""
-        if event.button() == Qt.MouseButton.LeftButton and self.is_drawing:
-            end_point = event.position().toPoint()
-            self.current_rect = QRect(self.start_point, end_point).normalized()
-            self.is_drawing = False
-            
-            # Wenn eine gültige Region ausgewählt wurde und ein Callback existiert
-            if self.current_rect.width() > 5 and self.current_rect.height() > 5 and self.callback:
-                region = [
-                    self.current_rect.x(),
-                    self.current_rect.y(),
-                    self.current_rect.width(),
-                    self.current_rect.height()
-                ]
-                self.callback(region)
-            
-            self.close()
-    
-    def keyPressEvent(self, event):
-        """Ermöglicht das Abbrechen der Auswahl mit Escape"""
-        if event.key() == Qt.Key.Key_Escape:
-            self.close()
+# Eingabeformate für validate_color und validate_region (vorkompiliert, da bei jeder Eingabe geprüft)
+_INT = r"\s*([-+]?\d+)\s*"
+_RGB_PATTERN = re.compile(rf"{_INT},{_INT},{_INT}(?:,\s*[-+]?\d+\s*)*")
+_HEX_COLOR_PATTERN = re.compile(r"#([0-9a-fA-F]{6})")
+_REGION_PATTERN = re.compile(rf"{_INT},{_INT},{_INT},{_INT}")
 
-
-class ColorPicker(QWidget):
-    """Widget zur Auswahl einer Farbe auf dem Bildschirm"""
-    
-    def __init__(self, callback=None):
-        """
-        Initialisiert den Color-Picker
-        
-        Args:
-            callback: Funktion, die mit der ausgewählten Farbe aufgerufen wird
-                     nach der Auswahl. Format: (r, g, b)
-        """
-        super().__init__()
-        
-        # Bildschirmgeometrie ermitteln
-        self.screen = QApplication.primaryScreen()
-        self.screen_geometry = self.screen.geometry()
-        
-        # Widget für die Farbauswahl einrichten
-        self.setWindowTitle("Farbe auswählen")
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        
-        # Größe und Position des Widgets
-        self.setFixedSize(180, 180)
-        
-        # Layout erstellen
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Label für Farbe und Werte
-        self.color_info = QLabel("")
-        self.color_info.setStyleSheet(f"""
-            background-color: {PRIMARY_COLOR}; 
-            color: {TEXT_COLOR};
-            border: 1px solid {ACCENT_COLOR};
-            border-radius: 5px;
-            padding: 5px;
-        """)
-        self.color_info.setFont(QFont("Arial", 9))
-        self.color_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.color_info)
-        
-        # Lupe initialisieren
-        self.magnifier_size = 150
-        self.zoom_factor = 4
-        
-        self.magnifier = QLabel()
-        self.magnifier.setFixedSize(self.magnifier_size, self.magnifier_size)
-        self.magnifier.setStyleSheet(f"border: 2px solid {ACCENT_COLOR}; border-radius: 75px;")
-        layout.addWidget(self.magnifier)
-        
-        # Mausposition und aktuell ausgewählte Farbe
-        self.mouse_pos = QPoint(0, 0)
-        self.current_color = None
-        self.pixel_info = {}  # Speichert Informationen über jeden Pixel in der Lupe
-        
-        # Callback-Funktion speichern
-        self.callback = callback
-        
-        # Timer für regelmäßiges Update
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_magnifier)
-        self.update_timer.start(50)  # Alle 50ms aktualisieren
-        
-        # Maus verfolgen
-        self.setMouseTracking(True)
-        self.setCursor(Qt.CursorShape.CrossCursor)
-        
-    def update_magnifier(self):
-        """Aktualisiert die Lupe mit dem Bildschirminhalt unter dem Mauszeiger"""
-        # Aktuelle Mausposition abrufen
-        self.mouse_pos = QApplication.primaryScreen().cursor().pos()
-        
-        # Fensterposition aktualisieren, um dem Mauszeiger zu folgen
-        window_pos = QPoint(
-            self.mouse_pos.x() + 20,
-            self.mouse_pos.y() + 20
-        )
-        
-        # Sicherstellen, dass das Fenster innerhalb des Bildschirms bleibt
-        if window_pos.x() + self.width() > self.screen_geometry.width():
-            window_pos.setX(self.mouse_pos.x() - 20 - self.width())
-        if window_pos.y() + self.height() > self.screen_geometry.height():
-            window_pos.setY(self.mouse_pos.y() - 20 - self.height())
-            
-        self.move(window_pos)
-        
-        try:
-            # Screenshot des Bereichs unter dem Mauszeiger
-            x = self.mouse_pos.x() - self.zoom_factor * self.magnifier_size // 2
-            y = self.mouse_pos.y() - self.zoom_factor * self.magnifier_size // 2
-            width = self.zoom_factor * self.magnifier_size
-            height = self.zoom_factor * self.magnifier_size
-            
-            # Bildschirmkoordinaten korrigieren
-            x = max(0, min(x, self.screen_geometry.width() - width))
-            y = max(0, min(y, self.screen_geometry.height() - height))
-            
-            # Screenshot mit PIL machen
-            screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
-            
-            # Farbe des Pixels unter dem Mauszeiger ermitteln
-            pixel_x = self.mouse_pos.x() - x
-            pixel_y = self.mouse_pos.y() - y
-            
-            if 0 <= pixel_x < width and 0 <= pixel_y < height:
-                self.current_color = screenshot.getpixel((pixel_x, pixel_y))
-                
-                if len(self.current_color) > 3:  # Bei RGBA-Format das Alpha entfernen
-                    self.current_color = self.current_color[:3]
-                    
-                r, g, b = self.current_color
-                hex_color = f"#{r:02x}{g:02x}{b:02x}"
-                
-                # Farb-Info aktualisieren
-                self.color_info.setText(f"RGB: {r}, {g}, {b}\nHEX: {hex_color}")
-                
-                # Rahmenfarbe basierend auf Helligkeit anpassen
-                brightness = (0.299 * r + 0.587 * g + 0.114 * b)
-                self.magnifier.setStyleSheet(f"""
-                    border: 2px solid {'#ffffff' if brightness < 128 else '#000000'};
-                    border-radius: 75px;
-                """)
-            
-            # Screenshot in QImage konvertieren und anzeigen
-            screenshot = screenshot.resize((self.magnifier_size, self.magnifier_size))
-            qim = screenshot.tobytes("raw", "RGB")
-            qimg = QImage(qim, screenshot.width, screenshot.height, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimg)
-            
-            # Overlay mit Fadenkreuz zeichnen
-            painter = QPainter(pixmap)
-            pen = QPen(QColor(255, 255, 255))
-            pen.setWidth(1)
-            painter.setPen(pen)
-            
-            # Horizontale Linie
-            painter.drawLine(0, self.magnifier_size // 2, self.magnifier_size, self.magnifier_size // 2)
-            
-            # Vertikale Linie
-            painter.drawLine(self.magnifier_size // 2, 0, self.magnifier_size // 2, self.magnifier_size)
-            
-            # Zentralen Punkt markieren
-            pen.setColor(QColor(0, 0, 0))
-            painter.setPen(pen)
-            painter.drawEllipse(
-                self.magnifier_size // 2 - 2,
-                self.magnifier_size // 2 - 2,
-                4, 4
-            )
-            
-            painter.end()
-            
-            # Aktualisierte Lupe anzeigen
-            self.magnifier.setPixmap(pixmap)
-            
-        except Exception as e:
-            print(f"Fehler beim Aktualisieren der Lupe: {e}")
-        
-    def mousePressEvent(self, event):
-        """Wählt die Farbe unter dem Mauszeiger aus"""
-        if event.button() == Qt.MouseButton.LeftButton and self.current_color:
-            if self.callback:
-                self.callback(self.current_color)
-            self.close()
-    
-    def keyPressEvent(self, event):
-        """Ermöglicht das Abbrechen der Auswahl mit Escape"""
-        if event.key() == Qt.Key.Key_Escape:
-            self.close()
+# Zuletzt gelesene bzw. gespeicherte Einstellungen samt Änderungszeit der Datei
+# (None = noch nicht geladen)
+_settings_cache: Optional[Tuple[Optional[int], Dict[str, Any]]] = None
 
 
 def get_platform():
@@ -324,21 +65,20 @@ def validate_color(color_str: str) -> Tuple[bool, Optional[List[int]]]:
     Returns:
         Tuple[bool, Optional[List[int]]]: (ist_gültig, [r, g, b])
     """
-    try:
-        # Versuche, als RGB zu parsen
-        if ',' in color_str:
-            rgb = [int(c.strip()) for c in color_str.split(',')]
-            if len(rgb) >= 3 and all(0 <= c <= 255 for c in rgb[:3]):
-                return True, rgb[:3]
-        
-        # Versuche, als Hex zu parsen
-        elif color_str.startswith('#') and len(color_str) == 7:
-            r = int(color_str[1:3], 16)
-            g = int(color_str[3:5], 16)
-            b = int(color_str[5:7], 16)
-            return True, [r, g, b]
-    except:
-        pass
+    # Als RGB parsen (weitere Werte nach dem dritten werden ignoriert)
+    if ',' in color_str:
+        match = _RGB_PATTERN.fullmatch(color_str)
+        if match:
+            rgb = [int(c) for c in match.groups()]
+            if all(0 <= c <= 255 for c in rgb):
+                return True, rgb
+    
+    # Als Hex parsen
+    else:
+        match = _HEX_COLOR_PATTERN.fullmatch(color_str)
+        if match:
+            value = match.group(1)
+            return True, [int(value[i:i + 2], 16) for i in (0, 2, 4)]
         
     return False, None
 
@@ -353,12 +93,11 @@ def validate_region(region_str: str) -> Tuple[bool, Optional[List[int]]]:
     Returns:
         Tuple[bool, Optional[List[int]]]: (ist_gültig, [x, y, width, height])
     """
-    try:
-        values = [int(v.strip()) for v in region_str.split(',')]
-        if len(values) == 4 and values[2] > 0 and values[3] > 0:
+    match = _REGION_PATTERN.fullmatch(region_str)
+    if match:
+        values = [int(v) for v in match.groups()]
+        if values[2] > 0 and values[3] > 0:
             return True, values
-    except:
-        pass
         
     return False, None
 
@@ -390,6 +129,39 @@ def load_settings() -> Dict[str, Any]:
     """
     Lädt die Einstellungen aus der Einstellungsdatei
 
+    Die Datei wird nur neu gelesen, wenn sich ihre Änderungszeit seit dem letzten
+    Lesen oder Speichern geändert hat; sonst wird eine Kopie der
+    zwischengespeicherten Einstellungen zurückgegeben.
+
+    Returns:
+        Dict[str, Any]: Einstellungen
+    """
+    global _settings_cache
+    mtime = _settings_mtime()
+    if _settings_cache is None or _settings_cache[0] != mtime:
+        _settings_cache = (mtime, _read_settings())
+    return copy.deepcopy(_settings_cache[1])
+
+
+def _settings_mtime() -> Optional[int]:
+    """
+    Liefert die Änderungszeit der Einstellungsdatei
+
+    Returns:
+        Optional[int]: Änderungszeit in Nanosekunden oder None, falls die Datei fehlt
+    """
+    if not SETTINGS_FILE:
+        init_config_directories()
+    try:
+        return os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_settings() -> Dict[str, Any]:
+    """
+    Liest die Einstellungen aus der Einstellungsdatei und ergänzt fehlende Werte
+
     Returns:
         Dict[str, Any]: Einstellungen
     """
@@ -408,8 +180,9 @@ def load_settings() -> Dict[str, Any]:
         return default_settings
 
     try:
-        with open(SETTINGS_FILE, 'r') as f:
-            settings = json.load(f)
+        with open(SETTINGS_FILE, 'rb') as f:
+            raw = f.read()
+        settings = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         # Stelle sicher, dass alle erforderlichen Einstellungen vorhanden sind
         for key, value in default_settings.items():
@@ -428,43 +201,26 @@ def save_settings(settings: Dict[str, Any]):
     Args:
         settings: Einstellungen
     """
+    global _settings_cache
     try:
         # Stelle sicher, dass das Verzeichnis existiert
         init_config_directories()
 
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
-    except Exception as e:
-        print(f"Fehler beim Speichern der Einstellungen: {e}")
-
-
-def add_recent_workflow(filename: str, max_entries: int = 10):
-    """
-    Fügt einen Workflow zur Liste der zuletzt verwendeten Workflows hinzu
-
-    Args:
-        filename: Pfad zur Workflow-Datei
-        max_entries: Maximale Anzahl der Einträge in der Liste
-    """
-    settings = load_settings()
-    recent = settings.get("recent_workflows", [])
-
-    # Entferne den Eintrag, falls er bereits vorhanden ist
-    if filename in recent:
-        recent.remove(filename)
-
-    # Füge den Eintrag am Anfang der Liste hinzu
-    recent.insert(0, filename)
+        if orjson is not None:
+            data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(settings, indent=2, ensure_ascii=False).encode("utf-8")
 
-    # Begrenze die Anzahl der Einträge
-    settings["recent_workflows"] = recent[:max_entries]
+        # Erst vollständig in eine temporäre Datei schreiben und dann ersetzen,
+        # damit ein Abbruch keine halb geschriebene Einstellungsdatei hinterlässt
+        temp_file = SETTINGS_FILE + ".tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, SETTINGS_FILE)
 
-    # Merke auch das Verzeichnis für den nächsten Dialog
-    directory = os.path.dirname(filename)
-    if directory:
-        update_last_directory("workflow", directory)
-
-    save_settings(settings)
+        _settings_cache = (_settings_mtime(), copy.deepcopy(settings))
+    except Exception as e:
+        print(f"Fehler beim Speichern der Einstellungen: {e}")
 
 
 def update_last_directory(dialog_type: str, directory: str):
@@ -1,19 +1,69 @@
 """
 Workflow-Tab für das Desktop-Automatisierungstool.
+
+Die Bearbeitung ist durch den UI-Thread begrenzt (Signale, Neuzeichnen,
+Python-Aufrufe je Ereignis), nicht durch Rechenaufwand. Daher gilt:
+ändernde Slots aktualisieren die Liste zeilenweise über WorkflowListModel;
+refresh_workflow_list ist dem Laden und Leeren eines Workflows vorbehalten.
 """
 
+import copy
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
-                            QLabel, QListWidget, QPushButton, QMessageBox,
+                            QLabel, QListView, QPushButton,
                             QSplitter, QRadioButton, QDialog, QFileDialog, QComboBox,
                             QCheckBox, QDoubleSpinBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QObject
-from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import (Qt, pyqtSignal, QObject, QSignalBlocker, QAbstractListModel,
+                          QModelIndex)
+from PyQt6.QtGui import QKeySequence, QShortcut, QUndoStack, QUndoCommand
 
 from automation_engine import AutomationEngine
 from models import Action, ActionType
-from action_editor import ActionEditor, ActionParameterChangeEvent
+from action_editor import ActionEditor
 from constants import *
 
+# Bereits erstellte Tastenfolgen je Kürzel-String (siehe _key_sequence)
+_KEY_SEQUENCES = {}
+
+
+def _key_sequence(key: str) -> QKeySequence:
+    """
+    Gibt die Tastenfolge für ein Kürzel zurück und parst jeden String nur einmal
+
+    Args:
+        key: Kürzel wie in constants.py, z. B. "Ctrl+D"
+
+    Returns:
+        QKeySequence: Die zugehörige Tastenfolge
+    """
+    sequence = _KEY_SEQUENCES.get(key)
+    if sequence is None:
+        sequence = _KEY_SEQUENCES[key] = QKeySequence(key)
+    return sequence
+
+
+# Parameterwerte, die beim Duplizieren kopiert statt geteilt werden müssen
+_MUTABLE_PARAM_TYPES = (dict, list, set, bytearray)
+
+
+def _clone_params(params: dict) -> dict:
+    """
+    Kopiert die Parameter einer Aktion
+
+    Veränderliche Werte (z. B. Tastenlisten oder Regionen) werden tief kopiert,
+    unveränderliche Werte werden ohne Kopie übernommen.
+
+    Args:
+        params: Parameter der Originalaktion
+
+    Returns:
+        dict: Unabhängige Kopie der Parameter
+    """
+    return {
+        name: copy.deepcopy(value) if isinstance(value, _MUTABLE_PARAM_TYPES) else value
+        for name, value in params.items()
+    }
+
 
 class ActionAddDialog(QDialog):
     """Dialog zum Hinzufügen einer neuen Aktion"""
@@ -29,8 +79,7 @@ class ActionAddDialog(QDialog):
         # Aktionstyp-Auswahl
         layout.addWidget(QLabel("Aktionstyp:"))
         self.action_type_combo = QComboBox()
-        for action_type in ActionType:
-            self.action_type_combo.addItem(action_type.value)
+        self.action_type_combo.addItems([t.value for t in ActionType])
         layout.addWidget(self.action_type_combo)
 
         # Position
@@ -63,14 +112,166 @@ class ActionAddDialog(QDialog):
 
     def get_action_type(self) -> ActionType:
         """Gibt den ausgewählten Aktionstyp zurück"""
-        action_type_str = self.action_type_combo.currentText()
-        return next(t for t in ActionType if t.value == action_type_str)
+        return ActionType.from_value(self.action_type_combo.currentText())
 
     def get_insert_at_end(self) -> bool:
         """Gibt zurück, ob die Aktion am Ende eingefügt werden soll"""
         return self.at_end_radio.isChecked()
 
 
+class WorkflowListModel(QAbstractListModel):
+    """
+    Listenmodell, das die Aktionen direkt aus engine.workflow anzeigt
+
+    Die Texte werden erst beim Zeichnen erzeugt, es gibt keine Kopie der
+    Beschreibungen in Listeneinträgen. Alle Änderungen des Tabs am Workflow
+    (Einfügen, Entfernen, Tauschen, Ersetzen, Parameter) laufen über die Methoden
+    des Modells, damit die Ansicht nur die betroffenen Zeilen neu zeichnet.
+    """
+
+    def __init__(self, engine: AutomationEngine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Anzahl der Aktionen (Listenmodell ohne Unterelemente)"""
+        if parent.isValid():
+            return 0
+        return len(self.engine.workflow)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """Gibt den nummerierten Beschreibungstext einer Aktion zurück"""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        row = index.row()
+        workflow = self.engine.workflow
+        if row >= len(workflow):
+            return None
+        return f"{row+1}. {workflow[row].get_description()}"
+
+    def reset(self):
+        """Baut die Ansicht nach dem Laden oder Leeren des Workflows neu auf"""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def row_changed(self, first: int, last: int = None):
+        """
+        Meldet geänderte Zeilen, damit nur diese neu gezeichnet werden
+
+        Args:
+            first: Erste geänderte Zeile
+            last: Letzte geänderte Zeile (Standard: first)
+        """
+        last = min(first if last is None else last, len(self.engine.workflow) - 1)
+        if 0 <= first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+    def set_params(self, index: int, params: dict):
+        """
+        Setzt Parameter einer Aktion im Workflow
+
+        Args:
+            index: Index der Aktion
+            params: Zu setzende Parameter (Name -> Wert)
+        """
+        action = self.engine.workflow[index]
+        for name, value in params.items():
+            action.set_param(name, value)
+        self.row_changed(index)
+
+    def replace_action(self, index: int, action: Action):
+        """
+        Ersetzt eine Aktion im Workflow (z. B. nach einem Typwechsel)
+
+        Args:
+            index: Index der zu ersetzenden Aktion
+            action: Die neue Aktion
+        """
+        self.engine.workflow[index] = action
+        self.row_changed(index)
+
+    def insert_action(self, index: int, action: Action):
+        """
+        Fügt eine Aktion in den Workflow ein
+
+        Args:
+            index: Zielposition (ungültige Werte hängen am Ende an)
+            action: Die neue Aktion
+        """
+        workflow = self.engine.workflow
+        if not 0 <= index <= len(workflow):
+            index = len(workflow)
+
+        self.beginInsertRows(QModelIndex(), index, index)
+        self.engine.insert_action(index, action)
+        self.endInsertRows()
+
+        # Nachfolgende Einträge neu nummerieren
+        self.row_changed(index + 1, len(workflow) - 1)
+
+    def remove_action(self, index: int):
+        """
+        Entfernt eine Aktion aus dem Workflow
+
+        Args:
+            index: Index der zu entfernenden Aktion
+        """
+        if not 0 <= index < len(self.engine.workflow):
+            return
+
+        self.beginRemoveRows(QModelIndex(), index, index)
+        self.engine.remove_action(index)
+        self.endRemoveRows()
+
+        # Nachfolgende Einträge neu nummerieren
+        self.row_changed(index, len(self.engine.workflow) - 1)
+
+    def swap_actions(self, index1: int, index2: int):
+        """
+        Tauscht zwei Aktionen im Workflow
+
+        Die Nummern bleiben an ihrer Position, daher genügt ein dataChanged
+        für den Bereich der beiden Zeilen.
+
+        Args:
+            index1: Index der ersten Aktion
+            index2: Index der zweiten Aktion
+        """
+        if self.engine.swap_actions(index1, index2):
+            self.row_changed(min(index1, index2), max(index1, index2))
+
+
+class RemoveActionCommand(QUndoCommand):
+    """Rückgängig machbares Entfernen einer Aktion"""
+
+    def __init__(self, tab: "WorkflowTab", index: int):
+        """
+        Merkt sich die zu entfernende Aktion
+
+        Args:
+            tab: Workflow-Tab, dessen Workflow geändert wird
+            index: Index der zu entfernenden Aktion
+        """
+        super().__init__("Aktion löschen")
+        self.tab = tab
+        self.index = index
+        self.action = tab.engine.workflow[index]
+
+    def redo(self):
+        """Entfernt die Aktion (auch beim ersten Ausführen über push)"""
+        # Über die Identität suchen, nicht über den gemerkten Index
+        for index, action in enumerate(self.tab.engine.workflow):
+            if action is self.action:
+                self.tab._remove_action_at(index)
+                return
+
+    def undo(self):
+        """Fügt die entfernte Aktion wieder an ihrer alten Position ein"""
+        self.tab._restore_action(self.index, self.action)
+
+
 class WorkflowTab(QWidget):
     """Tab für die Bearbeitung und Verwaltung von Workflows"""
 
@@ -85,7 +286,9 @@ class WorkflowTab(QWidget):
         # Aktuelle Auswahl und Aktionseditor-Zustand
         self.current_index = -1
         self.is_modified = False
-        self.updating_ui = False  # Verhindert rekursive Updates
+
+        # Gelöschte Aktionen können mit Rückgängig wiederhergestellt werden
+        self.undo_stack = QUndoStack(self)
 
         self.setup_ui()
         self.setup_shortcuts()
@@ -135,9 +338,14 @@ class WorkflowTab(QWidget):
         left_widget = QWidget()
         left_layout = QVBoxLayout(left_widget)
 
-        self.workflow_list = QListWidget()
-        self.workflow_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.workflow_list.itemSelectionChanged.connect(self.on_action_selected)
+        self.workflow_model = WorkflowListModel(self.engine, self)
+        self.workflow_list = QListView()
+        self.workflow_list.setModel(self.workflow_model)
+        self.workflow_list.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.workflow_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.workflow_list.setUniformItemSizes(True)  # Alle Zeilen einzeilig, kein Messen je Zeile
+        self._selection_model = self.workflow_list.selectionModel()
+        self._selection_model.currentRowChanged.connect(self._on_current_row_changed)
 
         left_layout.addWidget(QLabel("Workflow-Aktionen:"))
         left_layout.addWidget(self.workflow_list)
@@ -176,7 +384,7 @@ class WorkflowTab(QWidget):
 
         # Aktionseditor
         self.action_editor = ActionEditor()
-        self.action_editor.parameter_changed.connect(self.on_parameter_changed)
+        self.action_editor.parameters_changed.connect(self.on_parameters_changed)
         self.action_editor.type_changed.connect(self.on_type_changed)
 
         right_layout.addWidget(self.action_editor)
@@ -197,25 +405,22 @@ class WorkflowTab(QWidget):
 
     def setup_shortcuts(self):
         """Richtet Tastaturkürzel für den Tab ein"""
-        # Aktion hinzufügen
-        add_shortcut = QShortcut(QKeySequence(SHORTCUT_ADD_ACTION), self)
-        add_shortcut.activated.connect(self.add_action)
-
-        # Aktion löschen
-        delete_shortcut = QShortcut(QKeySequence(SHORTCUT_DELETE_ACTION), self)
-        delete_shortcut.activated.connect(self.remove_selected_action)
-
-        # Aktion duplizieren
-        duplicate_shortcut = QShortcut(QKeySequence(SHORTCUT_DUPLICATE_ACTION), self)
-        duplicate_shortcut.activated.connect(self.duplicate_selected_action)
-
-        # Aktion nach oben verschieben
-        move_up_shortcut = QShortcut(QKeySequence(SHORTCUT_MOVE_UP), self)
-        move_up_shortcut.activated.connect(self.move_action_up)
+        bindings = (
+            (SHORTCUT_ADD_ACTION, self.add_action),
+            (SHORTCUT_DELETE_ACTION, self.remove_selected_action),
+            (SHORTCUT_DUPLICATE_ACTION, self.duplicate_selected_action),
+            (SHORTCUT_MOVE_UP, self.move_action_up),
+            (SHORTCUT_MOVE_DOWN, self.move_action_down),
+            # Löschen rückgängig machen / wiederherstellen
+            (SHORTCUT_UNDO, self.undo_stack.undo),
+            (SHORTCUT_REDO, self.undo_stack.redo),
+        )
 
-        # Aktion nach unten verschieben
-        move_down_shortcut = QShortcut(QKeySequence(SHORTCUT_MOVE_DOWN), self)
-        move_down_shortcut.activated.connect(self.move_action_down)
+        # Shortcuts behalten, statt sie nur über den Qt-Elternbaum am Leben zu halten
+        self._shortcuts = [
+            QShortcut(_key_sequence(key), self, activated=slot)
+            for key, slot in bindings
+        ]
 
     # Callback-Methoden für die Dauerhaft-Optionen
     def on_loop_toggled(self, checked):
@@ -231,47 +436,104 @@ class WorkflowTab(QWidget):
         self.engine.abort_key = key
 
     def refresh_workflow_list(self):
-        """Aktualisiert die Workflow-Liste"""
-        if self.updating_ui:
+        """Baut die Workflow-Liste nach dem Laden oder Leeren des Workflows neu auf"""
+        # Gemerkte Löschungen gehören zum vorherigen Workflow
+        self._discard_undo_history()
+
+        # Signale der Auswahl während des Neuaufbaus unterdrücken
+        with QSignalBlocker(self._selection_model):
+            # Aktuelle Auswahl speichern
+            current_row = self.current_index
+
+            self.workflow_model.reset()
+
+            # Auswahl wiederherstellen, falls möglich
+            count = self.workflow_model.rowCount()
+            if 0 <= current_row < count:
+                self._set_current_row(current_row)
+            elif count > 0:
+                self._set_current_row(0)
+
+        # Auswahl, Aktionseditor und Button-Status einmalig übernehmen
+        self.on_action_selected()
+
+    def append_action(self, action: Action):
+        """
+        Hängt eine Aktion an den Workflow an, ohne die Liste neu aufzubauen
+        (z. B. während der Aufzeichnung)
+
+        Args:
+            action: Die neue Aktion
+        """
+        self._discard_undo_history()
+        self.workflow_model.insert_action(len(self.engine.workflow), action)
+
+        if len(self.engine.workflow) == 1:
+            # Erste Aktion auswählen
+            self._select_row(0)
+        else:
+            self.update_button_states()
+
+    def update_action_item(self, index: int):
+        """
+        Aktualisiert den Listeneintrag einer einzelnen Aktion, ohne die Liste neu aufzubauen
+
+        Args:
+            index: Index der geänderten Aktion
+        """
+        if not 0 <= index < len(self.engine.workflow):
             return
 
-        self.updating_ui = True
+        self.workflow_model.row_changed(index)
 
-        # Aktuelle Auswahl speichern
-        current_row = self.workflow_list.currentRow()
+        # Angezeigte Parameter aktualisieren, falls die Aktion gerade bearbeitet wird
+        if index == self.current_index:
+            self.action_editor.edit_action(self.engine.workflow[index])
 
-        self.workflow_list.clear()
+    def set_current_row(self, index: int):
+        """
+        Wählt eine Zeile aus; der Aktionseditor folgt über das Auswahlsignal
 
-        # Aktionen hinzufügen
-        for i, action in enumerate(self.engine.workflow):
-            item_text = f"{i+1}. {action.get_description()}"
-            self.workflow_list.addItem(item_text)
+        Args:
+            index: Index der auszuwählenden Zeile
+        """
+        self._set_current_row(index)
 
-        # Auswahl wiederherstellen, falls möglich
-        if current_row >= 0 and current_row < self.workflow_list.count():
-            self.workflow_list.setCurrentRow(current_row)
-        elif self.workflow_list.count() > 0:
-            self.workflow_list.setCurrentRow(0)
-            # Wenn nur eine Aktion vorhanden ist, wird der itemSelectionChanged-Signal manchmal nicht ausgelöst
-            # Daher manuell die Aktionsdetails aktualisieren, wenn es nur eine Aktion gibt
-            if len(self.engine.workflow) == 1:
-                self.current_index = 0
-                self.action_editor.edit_action(self.engine.workflow[0])
+    def _set_current_row(self, index: int):
+        """
+        Setzt die aktuelle Zeile der Liste
 
-        # Dauerhaft-Ausführen-Einstellungen aktualisieren
-        self.update_loop_settings()
+        Args:
+            index: Index der Zeile (-1 für keine Auswahl)
+        """
+        self.workflow_list.setCurrentIndex(self.workflow_model.index(index))
 
-        self.updating_ui = False
+    def _select_row(self, index: int):
+        """
+        Wählt eine Zeile aus und lädt die zugehörige Aktion in den Editor
 
-        # Button-Status aktualisieren
-        self.update_button_states()
+        Der Editor wird auch dann aktualisiert, wenn Qt kein Auswahlsignal
+        auslöst, weil die Zeilennummer nach einer Änderung unverändert bleibt.
+
+        Args:
+            index: Index der auszuwählenden Zeile (-1 für keine Auswahl)
+        """
+        with QSignalBlocker(self._selection_model):
+            self._set_current_row(index)
+
+        self.on_action_selected()
+
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Leitet einen Wechsel der aktuellen Zeile an on_action_selected weiter"""
+        self.on_action_selected()
 
     def update_button_states(self):
         """Aktualisiert den Status der Buttons basierend auf der aktuellen Auswahl"""
-        has_workflow = len(self.engine.workflow) > 0
-        has_selection = self.current_index >= 0
-        is_first = self.current_index == 0
-        is_last = self.current_index == len(self.engine.workflow) - 1
+        idx = self.current_index
+        n = len(self.engine.workflow)
+        has_selection = 0 <= idx < n
+        is_first = idx == 0
+        is_last = idx == n - 1
 
         # Buttons aktivieren/deaktivieren
         self.remove_action_btn.setEnabled(has_selection)
@@ -281,42 +543,54 @@ class WorkflowTab(QWidget):
 
     def on_action_selected(self):
         """Wird aufgerufen, wenn eine Aktion in der Liste ausgewählt wird"""
-        if self.updating_ui:
-            return
-
         # Index der ausgewählten Aktion
-        self.current_index = self.workflow_list.currentRow()
+        idx = self.current_index = self.workflow_list.currentIndex().row()
+        workflow = self.engine.workflow
 
         # Button-Status aktualisieren
         self.update_button_states()
 
         # Aktionseditor aktualisieren
-        if self.current_index >= 0 and self.current_index < len(self.engine.workflow):
-            self.action_editor.edit_action(self.engine.workflow[self.current_index])
+        if 0 <= idx < len(workflow):
+            self.action_editor.edit_action(workflow[idx])
         else:
             self.action_editor.clear_editor()
 
-    def on_parameter_changed(self, event: ActionParameterChangeEvent):
+    def on_parameters_changed(self, events: list):
         """
-        Wird aufgerufen, wenn ein Parameter einer Aktion geändert wurde
+        Wird aufgerufen, wenn Parameter einer Aktion geändert wurden
+
+        Alle Änderungen eines Übernehmen-Klicks werden gemeinsam übernommen,
+        die Liste wird dabei nur einmal aktualisiert.
 
         Args:
-            event: Das Ereignisobjekt mit dem geänderten Parameter
+            events: Liste der ActionParameterChangeEvent-Objekte
         """
-        if self.current_index < 0 or self.current_index >= len(self.engine.workflow):
+        workflow = self.engine.workflow
+        idx = self.current_index
+        if not 0 <= idx < len(workflow):
             return
 
-        # Parameter aktualisieren
-        self.engine.workflow[self.current_index].params[event.param_name] = event.new_value
+        # Änderungen ohne neuen Wert verwerfen; verglichen wird mit dem gespeicherten
+        # Wert, nicht mit dem vom Editor gemerkten
+        action = workflow[idx]
+        params = action.params
+        events = [event for event in events
+                  if params.get(event.param_name) != event.new_value]
+        if not events:
+            return
 
-        # Statusmeldung anzeigen
-        self.status_message.emit(
-            f"Parameter '{event.param_name}' geändert: {event.old_value} -> {event.new_value}",
-            STATUSBAR_TIMEOUT
-        )
+        # Parameter aktualisieren (das Modell aktualisiert den Listeneintrag)
+        self.workflow_model.set_params(idx, {event.param_name: event.new_value for event in events})
 
-        # Liste aktualisieren
-        self.refresh_workflow_list()
+        # Statusmeldung anzeigen
+        if len(events) == 1:
+            event = events[0]
+            message = f"Parameter '{event.param_name}' geändert: {event.old_value} -> {event.new_value}"
+        else:
+            names = ", ".join(event.param_name for event in events)
+            message = f"{len(events)} Parameter geändert: {names}"
+        self.status_message.emit(message, STATUSBAR_TIMEOUT)
 
         # Workflow als geändert markieren
         self.is_modified = True
@@ -329,10 +603,12 @@ class WorkflowTab(QWidget):
         Args:
             new_type: Der neue Aktionstyp
         """
-        if self.current_index < 0 or self.current_index >= len(self.engine.workflow):
+        workflow = self.engine.workflow
+        idx = self.current_index
+        if not 0 <= idx < len(workflow):
             return
 
-        old_action = self.engine.workflow[self.current_index]
+        old_action = workflow[idx]
         old_type = old_action.action_type
 
         # Standardparameter für den neuen Typ
@@ -346,8 +622,9 @@ class WorkflowTab(QWidget):
         # Neue Aktion erstellen
         new_action = Action(new_type, new_params)
 
-        # Alte Aktion ersetzen
-        self.engine.workflow[self.current_index] = new_action
+        # Alte Aktion samt Listeneintrag ersetzen
+        self._discard_undo_history()
+        self.workflow_model.replace_action(idx, new_action)
 
         # Statusmeldung anzeigen
         self.status_message.emit(
@@ -358,9 +635,6 @@ class WorkflowTab(QWidget):
         # Editor aktualisieren
         self.action_editor.edit_action(new_action)
 
-        # Liste aktualisieren
-        self.refresh_workflow_list()
-
         # Workflow als geändert markieren
         self.is_modified = True
         self.workflow_changed.emit()
@@ -382,15 +656,14 @@ class WorkflowTab(QWidget):
             if not dialog.get_insert_at_end() and self.current_index >= 0:
                 # Nach der aktuellen Aktion einfügen
                 insert_index = self.current_index + 1
-                self.engine.insert_action(insert_index, action)
             else:
                 # Am Ende einfügen
-                self.engine.add_action(action)
-                insert_index = len(self.engine.workflow) - 1
+                insert_index = len(self.engine.workflow)
 
-            # Liste aktualisieren und neue Aktion auswählen
-            self.refresh_workflow_list()
-            self.workflow_list.setCurrentRow(insert_index)
+            # Aktion mit Listeneintrag einfügen und auswählen
+            self._discard_undo_history()
+            self.workflow_model.insert_action(insert_index, action)
+            self._select_row(insert_index)
 
             # Statusmeldung anzeigen
             self.status_message.emit(f"Aktion '{action_type.value}' hinzugefügt", STATUSBAR_TIMEOUT)
@@ -401,63 +674,81 @@ class WorkflowTab(QWidget):
 
     def remove_selected_action(self):
         """Entfernt die ausgewählte Aktion"""
-        if self.current_index < 0 or self.current_index >= len(self.engine.workflow):
+        idx = self.current_index
+        if not 0 <= idx < len(self.engine.workflow):
             return
 
-        # Aktionsbeschreibung für die Bestätigungsmeldung
-        action_description = self.workflow_list.currentItem().text()
+        # Ohne Rückfrage löschen, die Aktion bleibt im Undo-Stack erhalten
+        self.undo_stack.push(RemoveActionCommand(self, idx))
 
-        # Bestätigung vom Benutzer einholen
-        confirm = QMessageBox.question(
-            self,
-            "Aktion löschen",
-            f"Möchtest du die Aktion wirklich löschen?\n\n{action_description}",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        # Statusmeldung anzeigen
+        self.status_message.emit(f"Aktion gelöscht (Rückgängig mit {SHORTCUT_UNDO})", STATUSBAR_TIMEOUT)
 
-        if confirm == QMessageBox.StandardButton.Yes:
-            # Aktion entfernen
-            self.engine.remove_action(self.current_index)
+    def _discard_undo_history(self):
+        """
+        Verwirft die gemerkten Löschungen vor einer Änderung, die selbst nicht
+        rückgängig gemacht werden kann (gemerkte Positionen wären danach ungültig)
+        """
+        self.undo_stack.clear()
 
-            # Liste aktualisieren
-            self.refresh_workflow_list()
+    def _remove_action_at(self, index: int):
+        """
+        Entfernt eine Aktion samt Listeneintrag und wählt die nachfolgende aus
 
-            # Neue Auswahl festlegen
-            new_index = min(self.current_index, len(self.engine.workflow) - 1)
-            if new_index >= 0:
-                self.workflow_list.setCurrentRow(new_index)
-            else:
-                self.current_index = -1
-                self.action_editor.clear_editor()
+        Args:
+            index: Index der zu entfernenden Aktion
+        """
+        with QSignalBlocker(self._selection_model):
+            self.workflow_model.remove_action(index)
 
-            # Statusmeldung anzeigen
-            self.status_message.emit("Aktion gelöscht", STATUSBAR_TIMEOUT)
+        # Neue Auswahl festlegen (-1 leert den Editor)
+        self._select_row(min(index, len(self.engine.workflow) - 1))
 
-            # Workflow als geändert markieren
-            self.is_modified = True
-            self.workflow_changed.emit()
+        # Workflow als geändert markieren
+        self.is_modified = True
+        self.workflow_changed.emit()
+
+    def _restore_action(self, index: int, action: Action):
+        """
+        Fügt eine zuvor entfernte Aktion wieder ein und wählt sie aus
+
+        Args:
+            index: Ursprünglicher Index der Aktion
+            action: Die entfernte Aktion
+        """
+        self.workflow_model.insert_action(index, action)
+        self._select_row(min(index, len(self.engine.workflow) - 1))
+
+        # Statusmeldung anzeigen
+        self.status_message.emit("Löschen rückgängig gemacht", STATUSBAR_TIMEOUT)
+
+        # Workflow als geändert markieren
+        self.is_modified = True
+        self.workflow_changed.emit()
 
     def duplicate_selected_action(self):
         """Dupliziert die ausgewählte Aktion"""
-        if self.current_index < 0 or self.current_index >= len(self.engine.workflow):
+        workflow = self.engine.workflow
+        idx = self.current_index
+        if not 0 <= idx < len(workflow):
             return
 
         # Originalaktion holen
-        original_action = self.engine.workflow[self.current_index]
+        original_action = workflow[idx]
 
         # Tiefe Kopie der Parameter erstellen
-        new_params = dict(original_action.params)
+        new_params = _clone_params(original_action.params)
 
         # Neue Aktion erstellen
         new_action = Action(original_action.action_type, new_params)
 
         # Nach der ausgewählten Aktion einfügen
-        insert_index = self.current_index + 1
-        self.engine.insert_action(insert_index, new_action)
+        insert_index = idx + 1
+        self._discard_undo_history()
+        self.workflow_model.insert_action(insert_index, new_action)
 
-        # Liste aktualisieren und neue Aktion auswählen
-        self.refresh_workflow_list()
-        self.workflow_list.setCurrentRow(insert_index)
+        # Neue Aktion auswählen
+        self._select_row(insert_index)
 
         # Statusmeldung anzeigen
         self.status_message.emit("Aktion dupliziert", STATUSBAR_TIMEOUT)
@@ -468,16 +759,17 @@ class WorkflowTab(QWidget):
 
     def move_action_up(self):
         """Verschiebt die ausgewählte Aktion nach oben"""
-        if self.current_index <= 0 or self.current_index >= len(self.engine.workflow):
+        idx = self.current_index
+        if not 0 < idx < len(self.engine.workflow):
             return
 
         # Aktionen tauschen
-        self.engine.swap_actions(self.current_index, self.current_index - 1)
+        new_index = idx - 1
+        self._discard_undo_history()
+        self.workflow_model.swap_actions(idx, new_index)
 
-        # Liste aktualisieren und Auswahl anpassen
-        new_index = self.current_index - 1
-        self.refresh_workflow_list()
-        self.workflow_list.setCurrentRow(new_index)
+        # Auswahl anpassen
+        self._select_row(new_index)
 
         # Statusmeldung anzeigen
         self.status_message.emit("Aktion nach oben verschoben", STATUSBAR_TIMEOUT)
@@ -488,17 +780,17 @@ class WorkflowTab(QWidget):
 
     def move_action_down(self):
         """Verschiebt die ausgewählte Aktion nach unten"""
-        if (self.current_index < 0 or
-            self.current_index >= len(self.engine.workflow) - 1):
+        idx = self.current_index
+        if not 0 <= idx < len(self.engine.workflow) - 1:
             return
 
         # Aktionen tauschen
-        self.engine.swap_actions(self.current_index, self.current_index + 1)
+        new_index = idx + 1
+        self._discard_undo_history()
+        self.workflow_model.swap_actions(idx, new_index)
 
-        # Liste aktualisieren und Auswahl anpassen
-        new_index = self.current_index + 1
-        self.refresh_workflow_list()
-        self.workflow_list.setCurrentRow(new_index)
+        # Auswahl anpassen
+        self._select_row(new_index)
 
         # Statusmeldung anzeigen
         self.status_message.emit("Aktion nach unten verschoben", STATUSBAR_TIMEOUT)
@@ -513,18 +805,16 @@ class WorkflowTab(QWidget):
 
     def update_loop_settings(self):
         """Aktualisiert die UI-Elemente für die Dauerhaft-Ausführen-Einstellungen"""
-        # UI-Updates blockieren, um Signale zu vermeiden
-        self.updating_ui = True
-
-        # Checkbox-Status aktualisieren
-        self.loop_checkbox.setChecked(self.engine.loop_enabled)
-
-        # Pausenzeit aktualisieren
-        self.loop_pause_spin.setValue(self.engine.loop_pause)
-
-        # Abbruchtaste aktualisieren
-        index = self.abort_key_combo.findText(self.engine.abort_key)
-        if index >= 0:
-            self.abort_key_combo.setCurrentIndex(index)
-
-        self.updating_ui = False
\ No newline at end of file
+        # Signale blockieren, damit die Werte nicht erneut in die Engine geschrieben werden
+        with QSignalBlocker(self.loop_checkbox), QSignalBlocker(self.loop_pause_spin), \
+                QSignalBlocker(self.abort_key_combo):
+            # Checkbox-Status aktualisieren
+            self.loop_checkbox.setChecked(self.engine.loop_enabled)
+
+            # Pausenzeit aktualisieren
+            self.loop_pause_spin.setValue(self.engine.loop_pause)
+
+            # Abbruchtaste aktualisieren
+            index = self.abort_key_combo.findText(self.engine.abort_key)
+            if index >= 0:
+                self.abort_key_combo.setCurrentIndex(index)
\ No newline at end of file